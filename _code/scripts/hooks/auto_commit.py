@@ -5,6 +5,17 @@ git-tracked vault directory, stages and commits it with a descriptive
 message. Then performs a broad sweep to catch any remaining unstaged
 vault files.
 
+Bursts of writes are coalesced: each invocation appends its path to a
+queue file in the git directory and tries to take a lock. The lock holder
+detaches from the hook, waits out a short debounce window, then commits
+every queued path at once before sweeping. Invocations that find the lock
+held exit immediately -- the holder picks up their queued path.
+
+The sweep itself runs when a write landed in a sweep dir without being
+committed directly, or when the last sweep is older than _SWEEP_INTERVAL;
+otherwise stray changes wait for the next due sweep instead of costing
+two git spawns on every fire.
+
 Consolidated from auto_commit.py + auto-commit.sh.
 
 Usage (Claude Code hook):
@@ -19,34 +30,51 @@ Exit behavior:
 
 from __future__ import annotations
 
-import json
+import fcntl
+import os
 import subprocess
 import sys
+import time
 from pathlib import Path
 
 _SCRIPT_DIR = Path(__file__).resolve().parent
 _CODE_DIR = _SCRIPT_DIR.parent.parent
 
-# Ensure src/ is importable for engram_r package
-sys.path.insert(0, str(_CODE_DIR / "src"))
+# Ensure src/ is importable for engram_r package.  Under the hook daemon
+# engram_r is already imported, and sys.path is left alone.
+if "engram_r" not in sys.modules:
+    sys.path.insert(0, str(_CODE_DIR / "src"))
+
+from engram_r import _fastjson, git_cache  # noqa: E402
+from engram_r.hook_utils import (  # noqa: E402
+    detach,
+    load_config,
+    resolve_vault,
+    vault_relpath,
+)
 
-from engram_r.hook_utils import load_config, resolve_vault  # noqa: E402
+try:
+    import pygit2  # optional: in-process repo discovery without forking git
+except ImportError:
+    pygit2 = None
 
 # Vault directories that contain notes worth auto-committing
-_TRACKED_DIRS = {
-    "hypotheses",
-    "literature",
-    "experiments",
-    "eda-reports",
-    "projects",
-    "_research",
-    "self",
-    "ops",
-    "_code",
-}
+_TRACKED_DIRS = frozenset(
+    {
+        "hypotheses",
+        "literature",
+        "experiments",
+        "eda-reports",
+        "projects",
+        "_research",
+        "self",
+        "ops",
+        "_code",
+    }
+)
 
 # Directories to stage in the broad sweep (absorbed from auto-commit.sh)
-_SWEEP_DIRS = [
+_SWEEP_DIRS = (
     "notes",
     "inbox",
     "archive",
@@ -57,21 +85,32 @@ _SWEEP_DIRS = [
     "_code/styles",
     "docs",
     "projects",
-]
+)
+_SWEEP_PREFIXES = tuple(d + "/" for d in _SWEEP_DIRS)
+
+# Coalescing state, kept inside the git directory so it is never committed
+_QUEUE_NAME = "engramr-autocommit.queue"
+_LOCK_NAME = "engramr-autocommit.lock"
+_LOG_NAME = "engramr-autocommit.log"
+_SWEEP_FLAG_NAME = "engramr-autocommit.sweep"
+_SWEPT_NAME = "engramr-autocommit.swept"
+
+# Seconds the lock holder waits for further writes before committing
+_DEBOUNCE_SECONDS = 2.0
+
+# Seconds after a sweep during which fires that need none skip it
+_SWEEP_INTERVAL = 60.0
 
 
 def _is_git_repo(path: Path) -> bool:
-    """Check if path is inside a git repository."""
-    try:
-        subprocess.run(
-            ["git", "rev-parse", "--git-dir"],
-            cwd=str(path),
-            capture_output=True,
-            check=True,
-        )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    """Check if path is inside a git repository.
+
+    Uses libgit2 discovery when pygit2 is installed, otherwise the
+    persisted ``git rev-parse`` probe from git_cache.
+    """
+    if pygit2 is not None:
+        return pygit2.discover_repository(str(path)) is not None
+    return git_cache.is_repo(path)
 
 
 def _git_has_changes(vault: Path) -> bool:
@@ -87,6 +126,243 @@ def _git_has_changes(vault: Path) -> bool:
     return bool(result.stdout.strip())
 
 
+def _git_dir(vault: Path) -> Path | None:
+    """Return the on-disk git directory for *vault*, or None if absent.
+
+    Handles both a ``.git`` directory and the ``gitdir:`` pointer file used
+    by worktrees and submodules.
+    """
+    dot_git = vault / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    if dot_git.is_file():
+        try:
+            line = dot_git.read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+        if line.startswith("gitdir:"):
+            target = Path(line[len("gitdir:") :].strip())
+            if not target.is_absolute():
+                target = vault / target
+            if target.is_dir():
+                return target
+    return None
+
+
+def _enqueue(git_dir: Path, rel: str) -> None:
+    """Append a vault-relative path to the coalescing queue."""
+    fd = os.open(
+        str(git_dir / _QUEUE_NAME), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+    )
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        os.write(fd, (rel + "\n").encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+def _drain_queue(git_dir: Path) -> list[str]:
+    """Read and clear the coalescing queue. Returns unique paths in order."""
+    try:
+        fd = os.open(str(git_dir / _QUEUE_NAME), os.O_RDWR)
+    except FileNotFoundError:
+        return []
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        chunks = []
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+        os.ftruncate(fd, 0)
+    finally:
+        os.close(fd)
+    lines = b"".join(chunks).decode("utf-8", errors="replace").splitlines()
+    return list(dict.fromkeys(ln for ln in lines if ln))
+
+
+def _queue_pending(git_dir: Path) -> bool:
+    """True if the coalescing queue holds any paths."""
+    try:
+        return (git_dir / _QUEUE_NAME).stat().st_size > 0
+    except OSError:
+        return False
+
+
+def _in_sweep_dirs(rel: str) -> bool:
+    """True if vault-relative *rel* lies under one of _SWEEP_DIRS."""
+    rel = rel.replace(os.sep, "/")
+    return rel in _SWEEP_DIRS or rel.startswith(_SWEEP_PREFIXES)
+
+
+def _request_sweep(git_dir: Path) -> None:
+    """Ask the lock holder to sweep regardless of _SWEEP_INTERVAL."""
+    (git_dir / _SWEEP_FLAG_NAME).touch()
+
+
+def _sweep_due(git_dir: Path) -> bool:
+    """Consume a pending sweep request, or check the last sweep's age."""
+    try:
+        (git_dir / _SWEEP_FLAG_NAME).unlink()
+        return True
+    except FileNotFoundError:
+        pass
+    try:
+        swept = (git_dir / _SWEPT_NAME).stat().st_mtime
+    except OSError:
+        return True
+    return time.time() - swept >= _SWEEP_INTERVAL
+
+
+def _try_lock(git_dir: Path) -> int | None:
+    """Take the commit lock without blocking. Returns the fd, or None if held."""
+    fd = os.open(str(git_dir / _LOCK_NAME), os.O_WRONLY | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    return fd
+
+
+def _detach(git_dir: Path) -> bool:
+    """Detach from the hook runner, logging stderr to the git directory."""
+    return detach(git_dir / _LOG_NAME)
+
+
+def _commit_paths(vault: Path, rels: list[str]) -> None:
+    """Stage and commit the given vault-relative paths in one commit."""
+    if not rels:
+        return
+    add_result = subprocess.run(
+        ["git", "add", "--pathspec-from-file=-", "--pathspec-file-nul"],
+        cwd=str(vault),
+        input="\0".join(rels),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=False,
+    )
+    if add_result.returncode != 0:
+        print(
+            f"auto_commit: git add failed ({add_result.returncode}): "
+            f"{(add_result.stderr or '').strip()}",
+            file=sys.stderr,
+        )
+
+    if len(rels) == 1:
+        commit_msg = f"auto: update {rels[0]}"
+    else:
+        commit_msg = f"auto: batch ({len(rels)} files)"
+    commit_result = subprocess.run(
+        ["git", "commit", "-m", commit_msg, "--no-verify"],
+        cwd=str(vault),
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    stdout = commit_result.stdout or ""
+    if commit_result.returncode != 0 and "nothing to commit" not in stdout:
+        print(
+            f"auto_commit: git commit failed ({commit_result.returncode}): "
+            f"{(commit_result.stderr or '').strip()}",
+            file=sys.stderr,
+        )
+
+
+def _present_sweep_dirs(vault: Path) -> list[str]:
+    """The _SWEEP_DIRS entries that exist as directories in *vault*.
+
+    One readdir of the vault (and of ``_code`` when a nested entry needs
+    it) instead of a stat per entry; is_dir() is answered from the dirent.
+    """
+
+    def subdirs(path: Path) -> set[str]:
+        try:
+            with os.scandir(path) as it:
+                return {e.name for e in it if e.is_dir()}
+        except OSError:
+            return set()
+
+    listings = {"": subdirs(vault)}
+    present = []
+    for d in _SWEEP_DIRS:
+        parent, _, name = d.rpartition("/")
+        if parent not in listings:
+            top = parent.split("/", 1)[0]
+            listings[parent] = subdirs(vault / parent) if top in listings[""] else set()
+        if name in listings[parent]:
+            present.append(d)
+    return present
+
+
+def _sweep(vault: Path) -> None:
+    """Stage all changes under the vault content dirs and commit them.
+
+    One ``git status`` finds the changed files; nothing further runs when
+    there are none. Otherwise they are fed to a single ``git update-index``,
+    which stages exactly those paths without walking the dirs again.
+    """
+    dirs = _present_sweep_dirs(vault)
+    if not dirs:
+        return
+    paths = git_cache.changed_paths(vault, dirs, all_untracked=True)
+    if not paths:
+        return
+
+    # git status names paths from the repository root, which is above the
+    # vault when the vault is a subdirectory; update-index reads them from
+    # its cwd.
+    top = git_cache.toplevel(vault) or vault
+    subprocess.run(
+        ["git", "update-index", "--add", "--remove", "-z", "--stdin"],
+        cwd=str(top),
+        input=b"".join(os.fsencode(p) + b"\0" for p in paths),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+    )
+    subprocess.run(
+        ["git", "commit", "-m", "auto: vault update", "--no-verify"],
+        cwd=str(vault),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+    )
+
+
+def _run_coalesced(
+    vault: Path, git_dir: Path, rel: str | None, *, sweep: bool = False
+) -> None:
+    """Queue *rel* and, if we win the lock, commit the whole queue.
+
+    *sweep* forces the holder to sweep even within _SWEEP_INTERVAL.
+    """
+    if rel is not None:
+        _enqueue(git_dir, rel)
+    if sweep:
+        _request_sweep(git_dir)
+
+    while True:
+        lock_fd = _try_lock(git_dir)
+        if lock_fd is None:
+            # Another invocation holds the lock and will drain our entry.
+            return
+        try:
+            if not _detach(git_dir):
+                return
+            time.sleep(_DEBOUNCE_SECONDS)
+            while rels := _drain_queue(git_dir):
+                _commit_paths(vault, rels)
+            if _sweep_due(git_dir):
+                _sweep(vault)
+                (git_dir / _SWEPT_NAME).touch()
+        finally:
+            os.close(lock_fd)
+        # An entry queued while we held the lock lost its race for the lock;
+        # take another round so it is not stranded until the next hook.
+        if not (_queue_pending(git_dir) or (git_dir / _SWEEP_FLAG_NAME).exists()):
+            return
+
+
 def main() -> None:
     try:
         config = load_config()
@@ -100,7 +376,7 @@ def main() -> None:
         raw = sys.stdin.read()
         if not raw.strip():
             return
-        hook_input = json.loads(raw)
+        hook_input = _fastjson.loads(raw)
 
         tool_input = hook_input.get("tool_input", {})
         file_path_str = tool_input.get("file_path", "")
@@ -108,86 +384,33 @@ def main() -> None:
         if not file_path_str:
             return
 
-        file_path = Path(file_path_str).resolve()
-        vault_resolved = vault.resolve()
-
-        if not str(file_path).startswith(str(vault_resolved)):
+        rel = vault_relpath(file_path_str, vault)
+        if rel is None:
             return
+        vault_abs = Path(os.path.abspath(vault))
 
         # Check if file is under a tracked directory
-        try:
-            rel = file_path.relative_to(vault_resolved)
-        except ValueError:
-            return
+        top_dir = rel.split(os.sep, 1)[0]
+        tracked = top_dir in _TRACKED_DIRS
 
-        top_dir = rel.parts[0] if rel.parts else ""
-        if top_dir not in _TRACKED_DIRS:
-            # Even if the specific file isn't tracked, still do the sweep
-            pass
-        else:
-            # Verify vault root has git
-            if not _is_git_repo(vault_resolved):
-                return
+        # Verify vault root has git
+        if not _is_git_repo(vault_abs):
+            return
 
-            # Stage and commit the specific file
-            add_result = subprocess.run(
-                ["git", "add", str(file_path)],
-                cwd=str(vault_resolved),
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            if add_result.returncode != 0:
-                print(
-                    f"auto_commit: git add failed ({add_result.returncode}): "
-                    f"{(add_result.stderr or '').strip()}",
-                    file=sys.stderr,
-                )
-
-            commit_msg = f"auto: update {rel}"
-            commit_result = subprocess.run(
-                ["git", "commit", "-m", commit_msg, "--no-verify"],
-                cwd=str(vault_resolved),
-                capture_output=True,
-                text=True,
-                check=False,
+        git_dir = _git_dir(vault_abs)
+        if git_dir is not None:
+            _run_coalesced(
+                vault_abs,
+                git_dir,
+                rel if tracked else None,
+                sweep=not tracked and _in_sweep_dirs(rel),
             )
-            stdout = commit_result.stdout or ""
-            if commit_result.returncode != 0 and "nothing to commit" not in stdout:
-                print(
-                    f"auto_commit: git commit failed ({commit_result.returncode}): "
-                    f"{(commit_result.stderr or '').strip()}",
-                    file=sys.stderr,
-                )
-
-        # Broad sweep: stage all vault content dirs (absorbed from auto-commit.sh)
-        if not _is_git_repo(vault_resolved):
             return
 
-        for d in _SWEEP_DIRS:
-            dir_path = vault_resolved / d
-            if dir_path.exists():
-                subprocess.run(
-                    ["git", "add", str(dir_path)],
-                    cwd=str(vault_resolved),
-                    capture_output=True,
-                    check=False,
-                )
-
-        # Commit remaining staged changes
-        result = subprocess.run(
-            ["git", "diff", "--cached", "--quiet"],
-            cwd=str(vault_resolved),
-            capture_output=True,
-            check=False,
-        )
-        if result.returncode != 0:
-            subprocess.run(
-                ["git", "commit", "-m", "auto: vault update", "--no-verify"],
-                cwd=str(vault_resolved),
-                capture_output=True,
-                check=False,
-            )
+        # No on-disk git directory to coordinate through: commit inline.
+        if tracked:
+            _commit_paths(vault_abs, [rel])
+        _sweep(vault_abs)
 
     except Exception as exc:
         print(f"auto_commit: {exc}", file=sys.stderr)
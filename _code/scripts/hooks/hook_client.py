@@ -0,0 +1,140 @@
+"""Hook launcher: forward a hook fire to the engram_r hook daemon.
+
+Runs a hook script through the warm daemon in ``engram_r.hookd`` instead
+of importing the package afresh on every fire. The daemon writes the hook's
+output straight to this process's stdout and stderr. Imports only the
+standard library so that it starts quickly.
+
+If the daemon is not running, this starts it in the background and runs
+the hook script in-process for the current fire, exactly as a direct
+invocation would. The same happens whenever forwarding fails before the
+daemon reports the hook's exit status, so a fire is never dropped. Set
+``ENGRAMR_HOOKD=0`` to always run in-process.
+
+Usage (Claude Code hook):
+    uv run python scripts/hooks/hook_client.py auto_commit
+
+Exit behavior:
+    - Exits with the hook's status: 0 for every hook as written.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import runpy
+import socket
+import subprocess
+import sys
+from pathlib import Path
+
+_SCRIPT_DIR = Path(__file__).resolve().parent
+_CODE_DIR = _SCRIPT_DIR.parent.parent
+
+# Mirrors engram_r.hookd; duplicated so this launcher never imports engram_r
+_HOOKS = (
+    "auto_commit",
+    "pipeline_bridge",
+    "session_capture",
+    "session_orient",
+    "validate_write",
+)
+_CODE_KEY = hashlib.sha256(os.fsencode(_CODE_DIR)).hexdigest()[:16]
+_SOCKET_NAME = f"hookd-{_CODE_KEY}.sock"
+_LOG_NAME = "hookd.log"
+
+# Seconds to wait on the daemon to accept this fire.  Once it has, the hook
+# runs under the hook runner's own timeout.
+_TIMEOUT = 10.0
+
+
+def _cache_dir() -> Path:
+    override = os.environ.get("ENGRAMR_CACHE_DIR")
+    if override:
+        return Path(override)
+    return Path.home() / ".cache" / "engramr"
+
+
+def _forward(name: str, payload: bytes) -> int | None:
+    """Run one fire in the daemon and return the hook's exit status.
+
+    None means the daemon did not report running the hook: it is not
+    listening, the connection broke, or the worker died first.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(_TIMEOUT)
+    reply = b""
+    try:
+        sock.connect(str(_cache_dir() / _SOCKET_NAME))
+        fields = [name.encode(), os.fsencode(os.getcwd())]
+        fields.extend(os.fsencode(f"{k}={v}") for k, v in os.environ.items())
+        header = b"\0".join([*fields, b"", b""])
+        sent = socket.send_fds(sock, [header], [1, 2])
+        sock.sendall(header[sent:] + payload)
+        sock.shutdown(socket.SHUT_WR)
+        # The hook writes to our stdout/stderr itself and the worker answers
+        # with its exit status once it returns.
+        sock.settimeout(None)
+        while chunk := sock.recv(16):
+            reply += chunk
+    except OSError:
+        return None
+    finally:
+        sock.close()
+    return reply[0] if len(reply) == 1 else None
+
+
+def _spawn_daemon() -> None:
+    """Start the daemon detached from this hook. Never raises."""
+    if not hasattr(os, "fork"):
+        return
+    try:
+        cache = _cache_dir()
+        cache.mkdir(parents=True, exist_ok=True)
+        env = dict(os.environ)
+        src = str(_CODE_DIR / "src")
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in (src, env.get("PYTHONPATH", "")) if p
+        )
+        with open(cache / _LOG_NAME, "ab") as log:
+            subprocess.Popen(
+                [sys.executable, "-m", "engram_r.hookd"],
+                cwd=str(_CODE_DIR),
+                env=env,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=log,
+                start_new_session=True,
+            )
+    except OSError as exc:
+        print(f"hook_client: could not start daemon: {exc}", file=sys.stderr)
+
+
+def _run_inline(name: str, payload: bytes) -> None:
+    """Run the hook script in this process, fed *payload* on stdin."""
+    sys.stdin = io.StringIO(payload.decode("utf-8", errors="replace"))
+    runpy.run_path(str(_SCRIPT_DIR / f"{name}.py"), run_name="__main__")
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 1 or args[0] not in _HOOKS:
+        print(f"hook_client: expected one of {', '.join(_HOOKS)}", file=sys.stderr)
+        return
+    name = args[0]
+    payload = sys.stdin.buffer.read()
+
+    if os.environ.get("ENGRAMR_HOOKD", "1") != "0":
+        status = _forward(name, payload)
+        if status is not None:
+            sys.exit(status)
+        _spawn_daemon()
+
+    _run_inline(name, payload)
+
+
+if __name__ == "__main__":
+    main()
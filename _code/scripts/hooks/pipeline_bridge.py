@@ -18,7 +18,10 @@ Exit behavior:
 
 from __future__ import annotations
 
+import functools
 import json
+import os
+import re
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -26,9 +29,38 @@ from pathlib import Path
 _SCRIPT_DIR = Path(__file__).resolve().parent
 _CODE_DIR = _SCRIPT_DIR.parent.parent
 
-sys.path.insert(0, str(_CODE_DIR / "src"))
-
-from engram_r.hook_utils import load_config, resolve_vault  # noqa: E402
+# Ensure src/ is importable for engram_r package.  Under the hook daemon
+# engram_r is already imported, and sys.path is left alone.
+if "engram_r" not in sys.modules:
+    sys.path.insert(0, str(_CODE_DIR / "src"))
+
+from engram_r import _fastjson  # noqa: E402
+from engram_r.hook_utils import (  # noqa: E402
+    load_config,
+    read_cache_json,
+    resolve_vault,
+    vault_relpath,
+    write_cache_json,
+)
+
+try:
+    import fcntl
+except ImportError:  # Windows: rely on O_APPEND alone
+    fcntl = None
+
+# Sidecar index of active queue sources, in the hook cache directory.  Bump
+# _INDEX_VERSION when the shape of an entry changes.
+_INDEX_NAME = "queue_index.json"
+_INDEX_VERSION = 2
+
+# Markdown notes under the two watched dirs, minus each dir's own _index.md.
+# The matching group's name keys _NOTE_TYPES.
+_NOTE_RE = re.compile(
+    r"_research/(?:(?P<literature>literature)|(?P<hypotheses>hypotheses))/"
+    r"(?!_index\.md\Z).*\.md\Z",
+    re.DOTALL,
+)
+_NOTE_TYPES = {"literature": "literature note", "hypotheses": "hypothesis"}
 
 
 def _classify_file(rel_path: str) -> str | None:
@@ -36,49 +68,94 @@ def _classify_file(rel_path: str) -> str | None:
 
     Returns None for non-matching files, index files, and templates.
     """
-    # Skip index files and templates
-    skip_prefixes = ("_research/literature/_index.md", "_research/hypotheses/_index.md")
-    if rel_path in skip_prefixes or rel_path.startswith("_code/templates/"):
-        return None
+    m = _NOTE_RE.match(rel_path)
+    return _NOTE_TYPES[m.lastgroup] if m else None
 
-    if rel_path.startswith("_research/literature/") and rel_path.endswith(".md"):
-        return "literature note"
-    if rel_path.startswith("_research/hypotheses/") and rel_path.endswith(".md"):
-        return "hypothesis"
 
-    return None
+def _source_key(source: str) -> str:
+    """The vault-relative note path a queue task's *source* names.
 
+    Sources may wrap the path in a wiki-link or give it absolutely; both
+    reduce to the ``_research/...`` form the hook compares against.
+    """
+    source = source.strip()
+    if source.startswith("[[") and source.endswith("]]"):
+        source = source[2:-2].split("|", 1)[0]
+    i = source.find("_research/")
+    return source[i:] if i >= 0 else source
+
+
+def _queue_index(queue_path: Path) -> dict | None:
+    """Return ``{"active": {path: status}, "pending": n}`` for queue.json.
+
+    *active* maps the _source_key() of every non-done task to its status. The
+    index is kept in a sidecar file in the hook cache, keyed on the queue's
+    path, mtime and size, so a hook fire that finds the queue unchanged reads
+    the small index instead of parsing the whole task list. Returns None
+    (after a warning) if the queue is malformed, {} if it does not exist.
+    """
+    try:
+        st = queue_path.stat()
+    except OSError:
+        return {}
+    return _queue_index_cached(str(queue_path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=4)
+def _queue_index_cached(path: str, mtime_ns: int, size: int) -> dict | None:
+    sidecar = read_cache_json(_INDEX_NAME)
+    entry = sidecar.get(path)
+    if (
+        isinstance(entry, dict)
+        and entry.get("version") == _INDEX_VERSION
+        and entry.get("mtime_ns") == mtime_ns
+        and entry.get("size") == size
+        and isinstance(entry.get("active"), dict)
+    ):
+        return {"active": entry["active"], "pending": entry.get("pending", 0)}
 
-def _is_already_queued(queue_path: Path, rel_path: str) -> bool:
-    """Check if a reduce task already exists in queue.json for this file."""
-    if not queue_path.exists():
-        return False
     try:
-        data = json.loads(queue_path.read_text(encoding="utf-8"))
-        tasks = data.get("tasks", [])
-        for task in tasks:
+        data = _fastjson.loads(Path(path).read_bytes())
+        active: dict[str, str] = {}
+        pending = 0
+        for task in data.get("tasks", []):
+            status = task.get("status")
+            if status == "done":
+                continue
+            pending += 1
             src = task.get("source", "")
-            if rel_path in src and task.get("status") != "done":
-                return True
+            if isinstance(src, str) and src:
+                active[_source_key(src)] = str(status)
     except (json.JSONDecodeError, Exception) as exc:
         print(
             f"pipeline_bridge: malformed queue.json: {exc}",
             file=sys.stderr,
         )
-    return False
+        return None
+
+    sidecar[path] = {
+        "version": _INDEX_VERSION,
+        "mtime_ns": mtime_ns,
+        "size": size,
+        "active": active,
+        "pending": pending,
+    }
+    write_cache_json(_INDEX_NAME, sidecar)
+    return {"active": active, "pending": pending}
+
+
+def _is_already_queued(queue_path: Path, rel_path: str) -> bool:
+    """Check if a reduce task already exists in queue.json for this file."""
+    index = _queue_index(queue_path)
+    if not index:
+        return False
+    return rel_path in index["active"]
 
 
 def _pending_queue_count(queue_path: Path) -> int:
     """Count non-done tasks in queue.json."""
-    if not queue_path.exists():
-        return 0
-    try:
-        data = json.loads(queue_path.read_text(encoding="utf-8"))
-        return sum(
-            1 for t in data.get("tasks", []) if t.get("status") != "done"
-        )
-    except (json.JSONDecodeError, Exception):
-        return 0
+    index = _queue_index(queue_path)
+    return index["pending"] if index else 0
 
 
 def main() -> None:
@@ -86,7 +163,7 @@ def main() -> None:
         raw = sys.stdin.read()
         if not raw.strip():
             return
-        hook_input = json.loads(raw)
+        hook_input = _fastjson.loads(raw)
     except (json.JSONDecodeError, Exception) as exc:
         print(f"pipeline_bridge: stdin parse error: {exc}", file=sys.stderr)
         return
@@ -97,13 +174,10 @@ def main() -> None:
         return
 
     vault = resolve_vault()
-    vault_str = str(vault.resolve())
-    file_path = Path(file_path_str).resolve()
 
     # Compute vault-relative path
-    try:
-        rel_path = str(file_path.relative_to(vault.resolve()))
-    except ValueError:
+    rel_path = vault_relpath(file_path_str, vault)
+    if rel_path is None:
         return
 
     note_type = _classify_file(rel_path)
@@ -133,8 +207,18 @@ def main() -> None:
         try:
             log_path.parent.mkdir(parents=True, exist_ok=True)
             ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            with open(log_path, "a", encoding="utf-8") as f:
-                f.write(f"{ts} | {suggestion}\n")
+            # One O_APPEND write: no buffered file object, no seek. The
+            # flock keeps lines from concurrent fires whole on filesystems
+            # where O_APPEND alone does not (NFS).
+            fd = os.open(
+                str(log_path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+            )
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                os.write(fd, f"{ts} | {suggestion}\n".encode())
+            finally:
+                os.close(fd)
         except OSError as exc:
             print(f"pipeline_bridge: log write failed: {exc}", file=sys.stderr)
 
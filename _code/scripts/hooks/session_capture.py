@@ -19,12 +19,17 @@ Stdin JSON shape (Claude Code Stop hook, all 7 fields):
 
 Exit behavior:
     - Always exits 0. Never blocks or fails the session.
+    - Returns as soon as stdin is read; the summary is gathered and written
+      by a detached child whose stderr goes to session_capture.log in the
+      hook cache directory.
 """
 
 from __future__ import annotations
 
-import json
-import subprocess
+import hashlib
+import mmap
+import os
+import re
 import sys
 from datetime import date
 from pathlib import Path
@@ -32,44 +37,208 @@ from pathlib import Path
 _SCRIPT_DIR = Path(__file__).resolve().parent
 _CODE_DIR = _SCRIPT_DIR.parent.parent
 
-# Ensure src/ is importable for engram_r package
-sys.path.insert(0, str(_CODE_DIR / "src"))
+# Ensure src/ is importable for engram_r package.  Under the hook daemon
+# engram_r is already imported, and sys.path is left alone.
+if "engram_r" not in sys.modules:
+    sys.path.insert(0, str(_CODE_DIR / "src"))
 
-from engram_r.hook_utils import load_config, resolve_vault  # noqa: E402
+from engram_r import _fastjson, git_cache  # noqa: E402
+from engram_r.hook_utils import (  # noqa: E402
+    cache_dir,
+    detach,
+    load_config,
+    resolve_vault,
+)
+
+# stderr of the detached worker
+_LOG_NAME = "session_capture.log"
+
+# Per-session record of what the note already lists, in the hook cache
+_STATE_DIR = "session_state"
+_STATE_KEYS = ("files_changed", "files_written", "skills_invoked", "summary")
+
+# Characters replaced when a session id becomes a file name
+_UNSAFE_NAME_RE = re.compile(r"[^A-Za-z0-9_.-]")
+
+# Per-transcript scan results, keyed by a hash of the transcript path
+_TRANSCRIPT_CACHE_DIR = "transcript_cache"
+
+# (info key, section title, bullet prefix, bullet suffix) for the list
+# sections; the note is assembled as UTF-8 bytes
+_LIST_SECTIONS = (
+    ("files_changed", b"Files Changed", b"- `", b"`\n"),
+    ("files_written", b"Tool Calls", b"- `", b"`\n"),
+    ("skills_invoked", b"Skills Invoked", b"- ", b"\n"),
+)
 
 
 def _git_files_changed(cwd: str) -> list[str]:
     """Return files changed on disk according to git.
 
-    Runs ``git status --porcelain`` from *cwd* and returns a sorted list of
-    relative paths.  Returns an empty list on any error (not a git repo,
-    git not installed, etc.).
+    Runs ``git status`` from *cwd* (see git_cache.changed_paths) and returns
+    a sorted list of relative paths.  Returns an empty list on any error
+    (not a git repo, git not installed, etc.).
     """
     if not cwd:
         return []
+    return sorted(set(git_cache.changed_paths(cwd, timeout=10)))
+
+
+def _read_cached(path: Path) -> dict | None:
+    """Load a JSON object from the hook cache. None if missing or corrupt."""
     try:
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode != 0:
-            return []
-        files = set()
-        for line in result.stdout.splitlines():
-            # porcelain format: XY filename  (or XY old -> new for renames)
-            if len(line) < 4:
+        data = _fastjson.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+# Transcript lines without this key carry no tool call, so they are skipped
+# before JSON decoding.
+_TOOL_KEY = b'"tool_name"'
+
+# Where an assistant entry names its role; searched for from the end
+_ROLE_KEY = b'"role"'
+_ASSISTANT_ROLE_RE = re.compile(rb'"role"\s*:\s*"assistant"')
+
+
+def _scan_transcript(
+    path: Path, *, start: int = 0
+) -> tuple[set[str], set[str], int]:
+    """Collect written files and invoked skills.
+
+    Streams the JSONL transcript from byte offset *start* in one pass so
+    memory stays flat however long the session ran.  Also returns the offset
+    just past the last complete line, where a later scan can resume.
+    """
+    files: set[str] = set()
+    skills: set[str] = set()
+    end = start
+
+    with path.open("rb", buffering=1 << 20) as f:
+        f.seek(start)
+        for line in f:
+            if line.endswith(b"\n"):
+                end += len(line)
+            if _TOOL_KEY not in line:
                 continue
-            entry = line[3:]
-            # Handle renames: "old -> new"
-            if " -> " in entry:
-                entry = entry.split(" -> ", 1)[1]
-            files.add(entry.strip())
-        return sorted(files)
-    except Exception:
-        return []
+            try:
+                entry = _fastjson.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(entry, dict):
+                continue
+
+            tool_name = entry.get("tool_name", "")
+            tool_input = entry.get("tool_input", {})
+            if isinstance(tool_input, dict):
+                fp = tool_input.get("file_path", "")
+                if fp and tool_name in ("Write", "Edit"):
+                    files.add(fp)
+
+            if tool_name == "Skill":
+                skill = tool_input.get("skill", "")
+                if skill:
+                    skills.add(f"/{skill}")
+
+    return files, skills, end
+
+
+def _last_assistant_message(path: Path) -> str:
+    """The content of the transcript's last assistant entry, or "".
+
+    Searches the memory-mapped transcript backwards for a ``"role"`` key
+    followed by ``"assistant"`` and decodes only the line holding it, so
+    the cost depends on how far from the end the message is, not on the
+    transcript size.  Entries whose content is not a non-empty string are
+    passed over.
+    """
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = len(mm)
+            while (pos := mm.rfind(_ROLE_KEY, 0, pos)) >= 0:
+                if not _ASSISTANT_ROLE_RE.match(mm, pos):
+                    continue
+                line_start = mm.rfind(b"\n", 0, pos) + 1
+                line_end = mm.find(b"\n", pos)
+                if line_end < 0:
+                    line_end = len(mm)
+                try:
+                    entry = _fastjson.loads(mm[line_start:line_end])
+                except ValueError:
+                    continue
+                if not isinstance(entry, dict) or entry.get("role") != "assistant":
+                    continue
+                content = entry.get("content", "")
+                if isinstance(content, str) and content.strip():
+                    return content.strip()
+                # Any other "role" keys on this line belong to the same entry
+                pos = line_start
+    return ""
+
+
+def _scan_transcript_cached(
+    path: Path, *, want_summary: bool
+) -> tuple[set[str], set[str], str]:
+    """_scan_transcript() with results kept in the hook cache.
+
+    Stop can fire several times per session while the transcript only grows,
+    so an unchanged transcript (same size and mtime) is not read at all and
+    a grown one is scanned from where the previous scan stopped.  The last
+    assistant message is looked up from the end of the file (see
+    _last_assistant_message) only when *want_summary* is set.
+    """
+    st = path.stat()
+    key = hashlib.sha1(str(path).encode("utf-8")).hexdigest()
+    cache_path = cache_dir() / _TRANSCRIPT_CACHE_DIR / f"{key}.json"
+
+    cached = _read_cached(cache_path)
+    usable = (
+        cached is not None
+        and isinstance(cached.get("offset"), int)
+        and cached["offset"] <= st.st_size
+    )
+    unchanged = usable and (cached.get("size"), cached.get("mtime_ns")) == (
+        st.st_size,
+        st.st_mtime_ns,
+    )
+    if unchanged and (cached.get("summary_tracked") or not want_summary):
+        return (
+            set(cached.get("files", ())),
+            set(cached.get("skills", ())),
+            cached.get("last_assistant", ""),
+        )
+
+    if unchanged:
+        files = set(cached.get("files", ()))
+        skills = set(cached.get("skills", ()))
+        end = cached["offset"]
+    else:
+        start = cached["offset"] if usable else 0
+        files, skills, end = _scan_transcript(path, start=start)
+        if usable:
+            files.update(cached.get("files", ()))
+            skills.update(cached.get("skills", ()))
+    last_assistant = _last_assistant_message(path) if want_summary else ""
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(
+            _fastjson.dumps({
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+                "offset": end,
+                "summary_tracked": want_summary,
+                "files": sorted(files),
+                "skills": sorted(skills),
+                "last_assistant": last_assistant,
+            })
+        )
+    except OSError as exc:
+        print(f"session_capture: transcript cache write failed: {exc}", file=sys.stderr)
+    return files, skills, last_assistant
 
 
 def _extract_session_info(hook_input: dict) -> dict:
@@ -102,55 +271,17 @@ def _extract_session_info(hook_input: dict) -> dict:
     transcript_path = hook_input.get("transcript_path", "")
     if transcript_path and Path(transcript_path).exists():
         try:
-            lines = Path(transcript_path).read_text(encoding="utf-8").splitlines()
-
-            files = set()
-            skills = set()
-
-            for line in lines:
-                if not line.strip():
-                    continue
-                try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-
-                if isinstance(entry, dict):
-                    tool_name = entry.get("tool_name", "")
-                    tool_input = entry.get("tool_input", {})
-                    if isinstance(tool_input, dict):
-                        fp = tool_input.get("file_path", "")
-                        if fp and tool_name in ("Write", "Edit"):
-                            files.add(fp)
-
-                    if tool_name == "Skill":
-                        skill = tool_input.get("skill", "")
-                        if skill:
-                            skills.add(f"/{skill}")
-
+            files, skills, last_assistant = _scan_transcript_cached(
+                Path(transcript_path), want_summary=not info["summary"]
+            )
             info["files_written"] = sorted(files)
             info["skills_invoked"] = sorted(skills)
 
-            # Fallback: if no last_assistant_message, try transcript
-            if not info["summary"]:
-                last_assistant = ""
-                for line in lines:
-                    if not line.strip():
-                        continue
-                    try:
-                        entry = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-                    if isinstance(entry, dict):
-                        role = entry.get("role", "")
-                        if role == "assistant":
-                            content = entry.get("content", "")
-                            if isinstance(content, str) and content.strip():
-                                last_assistant = content.strip()
-                if last_assistant:
-                    if len(last_assistant) > 300:
-                        last_assistant = last_assistant[:300] + "..."
-                    info["summary"] = last_assistant
+            # Fallback: if no last_assistant_message, use the transcript's
+            if last_assistant:
+                if len(last_assistant) > 300:
+                    last_assistant = last_assistant[:300] + "..."
+                info["summary"] = last_assistant
 
         except Exception as exc:
             print(
@@ -178,6 +309,75 @@ def _slack_session_end(vault: Path, info: dict) -> None:
         pass
 
 
+def _state_path(session_id: str) -> Path:
+    """Cache file holding what the session note already records."""
+    safe = _UNSAFE_NAME_RE.sub("_", session_id or "unknown")
+    return cache_dir() / _STATE_DIR / f"{safe}.json"
+
+
+def _write_state(path: Path, info: dict) -> None:
+    state = {key: info[key] for key in _STATE_KEYS}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(_fastjson.dumps(state))
+    except OSError as exc:
+        print(f"session_capture: state write failed: {exc}", file=sys.stderr)
+
+
+def _render_header(info: dict, today: str) -> bytes:
+    cwd = f'cwd: "{info["cwd"]}"\n' if info["cwd"] else ""
+    mode = info["permission_mode"]
+    mode = f'permission_mode: "{mode}"\n' if mode else ""
+    return (
+        f'---\ndate: {today}\nsession_id: "{info["session_id"]}"\n'
+        f"{cwd}{mode}---\n\n"
+    ).encode()
+
+
+def _render_body(info: dict, *, level: bytes = b"##") -> bytes:
+    """Render every section of the note body at heading *level*."""
+    buf = bytearray()
+    w = buf.extend
+    for key, title, prefix, suffix in _LIST_SECTIONS:
+        w(level + b" " + title + b"\n")
+        for item in info[key]:
+            w(prefix)
+            w(item.encode("utf-8"))
+            w(suffix)
+        if not info[key]:
+            w(b"(none)\n")
+        w(b"\n")
+    w(level + b" Session Summary\n")
+    w((info["summary"] or "(no summary available)").encode("utf-8"))
+    w(b"\n")
+    return bytes(buf)
+
+
+def _render_update(info: dict, prior: dict) -> bytes:
+    """Render only what changed since *prior*; b"" if nothing did."""
+    buf = bytearray()
+    w = buf.extend
+    for key, title, prefix, suffix in _LIST_SECTIONS:
+        seen = set(prior.get(key, ()))
+        items = [x for x in info[key] if x not in seen]
+        if items:
+            w(b"### " + title + b"\n")
+            for item in items:
+                w(prefix)
+                w(item.encode("utf-8"))
+                w(suffix)
+            w(b"\n")
+    if info["summary"] and info["summary"] != prior.get("summary"):
+        w(b"### Session Summary\n")
+        w(info["summary"].encode("utf-8"))
+        w(b"\n\n")
+    if not buf:
+        return b""
+    # Sections are separated by a blank line, not followed by one
+    del buf[-1]
+    return b"\n## Update\n\n" + buf
+
+
 def main() -> None:
     try:
         config = load_config()
@@ -191,7 +391,13 @@ def main() -> None:
         if not raw.strip():
             return
 
-        hook_input = json.loads(raw)
+        hook_input = _fastjson.loads(raw)
+
+        # Everything below (git status, transcript scan, note write, Slack)
+        # runs after the hook has returned.
+        if not detach(cache_dir() / _LOG_NAME):
+            return
+
         info = _extract_session_info(hook_input)
 
         sessions_dir = vault / "ops" / "sessions"
@@ -202,51 +408,30 @@ def main() -> None:
         filename = f"{today}-{session_prefix}.md"
         output_path = sessions_dir / filename
 
-        parts = [
-            "---",
-            f"date: {today}",
-            f'session_id: "{info["session_id"]}"',
-        ]
-        if info["cwd"]:
-            parts.append(f'cwd: "{info["cwd"]}"')
-        if info["permission_mode"]:
-            parts.append(f'permission_mode: "{info["permission_mode"]}"')
-        parts.extend([
-            "---",
-            "",
-            "## Files Changed",
-        ])
-
-        if info["files_changed"]:
-            for fp in info["files_changed"]:
-                parts.append(f"- `{fp}`")
+        state_path = _state_path(info["session_id"])
+        if output_path.exists():
+            # Stop re-fired for this session: append only what is new, so
+            # the note (and any frontmatter added since, e.g. ``mined``) is
+            # never rewritten.
+            prior = _read_cached(state_path)
+            if prior is not None:
+                update = _render_update(info, prior)
+                chunks = [update] if update else []
+            else:
+                # No record of what was written before: append it all.
+                chunks = [b"\n## Update\n\n", _render_body(info, level=b"###")]
         else:
-            parts.append("(none)")
-
-        parts.append("")
-        parts.append("## Tool Calls")
+            chunks = [_render_header(info, today), _render_body(info)]
 
-        if info["files_written"]:
-            for fp in info["files_written"]:
-                parts.append(f"- `{fp}`")
-        else:
-            parts.append("(none)")
-
-        parts.append("")
-        parts.append("## Skills Invoked")
-
-        if info["skills_invoked"]:
-            for s in info["skills_invoked"]:
-                parts.append(f"- {s}")
-        else:
-            parts.append("(none)")
-
-        parts.append("")
-        parts.append("## Session Summary")
-        parts.append(info["summary"] or "(no summary available)")
-        parts.append("")
-
-        output_path.write_text("\n".join(parts), encoding="utf-8")
+        if chunks:
+            fd = os.open(
+                str(output_path), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+            )
+            try:
+                os.writev(fd, chunks)
+            finally:
+                os.close(fd)
+        _write_state(state_path, info)
 
         _slack_session_end(vault, info)
 
@@ -12,18 +12,32 @@ Usage (Claude Code hook):
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import itertools
+import mmap
+import os
 import re
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # libyaml not compiled in
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
 _SCRIPT_DIR = Path(__file__).resolve().parent
 _CODE_DIR = _SCRIPT_DIR.parent.parent  # _code/
 
-# Ensure src/ is importable for engram_r package
-sys.path.insert(0, str(_CODE_DIR / "src"))
+# Ensure src/ is importable for engram_r package.  Under the hook daemon
+# engram_r is already imported, and sys.path is left alone.
+if "engram_r" not in sys.modules:
+    sys.path.insert(0, str(_CODE_DIR / "src"))
 
 from engram_r.daemon_scheduler import (  # noqa: E402
     _count_queue_blocked,
@@ -32,6 +46,37 @@ from engram_r.daemon_scheduler import (  # noqa: E402
 from engram_r.decision_engine import is_empty_vault  # noqa: E402
 from engram_r.hook_utils import load_config, resolve_vault  # noqa: E402
 
+try:
+    from engram_r.slack_notify import (  # noqa: E402
+        fetch_inbound_messages,
+        send_notification,
+    )
+except ImportError:  # Slack integration unavailable
+    fetch_inbound_messages = send_notification = None  # type: ignore[assignment]
+
+
+# Bytes read at a time when looking for a note's frontmatter
+_FM_CHUNK = 4096
+
+# One plain ``key: value`` frontmatter line
+_FM_FIELD_RE = re.compile(r"([A-Za-z_][\w-]*):(?:[ \t]+(.*?))?[ \t]*")
+
+# Whole goals.md bullet lines and unchecked reminder lines, matched over the
+# raw file bytes; group 1 of a reminder is the first date on its line
+_BULLET_RE = re.compile(rb"^[^\S\r\n]*-[^\S\r\n].*", re.M)
+_REMINDER_RE = re.compile(
+    rb"^[^\S\r\n]*- \[ \](?:.*?(\d{4}-\d{2}-\d{2}))?.*", re.M
+)
+
+# Files larger than this are scanned through mmap rather than read into memory
+_MMAP_MIN_BYTES = 4096
+
+# Values YAML would not read as a plain string; these go to the parser
+_FM_STRUCTURED = frozenset("[{|>&*!%@`")
+_FM_SPECIAL = frozenset({
+    "~", "null", "true", "false", "yes", "no", "on", "off",
+})
+
 
 def _check_integrity(vault: Path) -> list[str]:
     """Check integrity manifest and return warning strings for any drift.
@@ -53,26 +98,95 @@ def _check_integrity(vault: Path) -> list[str]:
         return []
 
 
+def _md_entries(directory: Path) -> list[tuple[str, str]]:
+    """(name, path) of the .md files in *directory*; [] if it is missing.
+
+    One scandir pass: names and file types come from the directory listing,
+    without a Path object or stat per entry.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return [
+                (e.name, e.path)
+                for e in it
+                if e.name.endswith(".md") and e.is_file()
+            ]
+    except OSError:
+        return []
+
+
+def _read_frontmatter(path: str, limit: int = _FM_CHUNK) -> object:
+    """Parse the YAML frontmatter of the note at *path*.
+
+    Reads *limit* bytes, then one more chunk of the same size if the closing
+    ``---`` is not in the first, then the rest of the file if it is in
+    neither.  CRLF line endings are folded to LF as the text is read, as a
+    text-mode read would.  Returns None if the note has no complete
+    frontmatter.
+    """
+    with open(path, "rb") as f:
+        data = f.read(limit).replace(b"\r\n", b"\n")
+        if not data.startswith(b"---"):
+            return None
+        end = data.find(b"\n---\n", 4)
+        if end < 0:
+            # Joined before folding, so a CRLF split across reads still folds
+            data = (data + f.read(limit)).replace(b"\r\n", b"\n")
+            end = data.find(b"\n---\n", 4)
+        if end < 0:
+            data = (data + f.read()).replace(b"\r\n", b"\n")
+            end = data.find(b"\n---\n", 4)
+            if end < 0:
+                return None
+    block = data[4:end].decode("utf-8")
+    fm = _fast_frontmatter(block)
+    if fm is None:
+        fm = yaml.load(block, Loader=_Loader)
+    return fm
+
+
+def _fast_frontmatter(block: str) -> dict[str, str] | None:
+    """Read a frontmatter block made only of flat ``key: value`` lines.
+
+    Values come back as strings with one level of quotes removed.  Returns
+    None as soon as a line needs the YAML parser: nested or multi-line
+    values, flow collections, block scalars, anchors, tags, comments after
+    a value, escapes, or the null/boolean keywords.
+    """
+    fields = {}
+    for line in block.splitlines():
+        if not line.strip() or line.startswith("#"):
+            continue
+        m = _FM_FIELD_RE.fullmatch(line)
+        if m is None:
+            return None
+        value = m.group(2)
+        if not value or value[0] in _FM_STRUCTURED or value.lower() in _FM_SPECIAL:
+            return None
+        if " #" in value or ": " in value or "\\" in value:
+            return None
+        if value[0] in "'\"":
+            quote = value[0]
+            if len(value) < 2 or value[-1] != quote or quote in value[1:-1]:
+                return None
+            value = value[1:-1]
+        fields[m.group(1)] = value
+    return fields
+
+
 def _list_active_goals(vault: Path) -> list[str]:
     """List active research goals by reading goal files."""
-    goals_dir = vault / "_research" / "goals"
-    if not goals_dir.is_dir():
-        return []
     goals = []
-    for f in sorted(goals_dir.glob("*.md")):
-        if f.name.startswith("_"):
+    for name, path in sorted(_md_entries(vault / "_research" / "goals")):
+        if name.startswith("_"):
             continue
         try:
-            text = f.read_text(encoding="utf-8")
-            if text.startswith("---"):
-                fm_end = text.find("\n---\n", 4)
-                if fm_end > 0:
-                    fm = yaml.safe_load(text[4:fm_end])
-                    if isinstance(fm, dict):
-                        status = fm.get("status", "active")
-                        if status == "active":
-                            title = fm.get("title", f.stem)
-                            goals.append(title)
+            fm = _read_frontmatter(path)
+            if isinstance(fm, dict):
+                status = fm.get("status", "active")
+                if status == "active":
+                    title = fm.get("title", name[:-3])
+                    goals.append(title)
         except Exception:
             continue
     return goals
@@ -81,63 +195,66 @@ def _list_active_goals(vault: Path) -> list[str]:
 def _top_hypotheses(vault: Path, n: int = 5) -> list[str]:
     """Extract top N from _research/hypotheses/_index.md leaderboard."""
     index_path = vault / "_research" / "hypotheses" / "_index.md"
-    if not index_path.exists():
-        return []
-    lines = index_path.read_text(encoding="utf-8").splitlines()
     results = []
     in_table = False
-    for line in lines:
-        if line.startswith("|") and "Rank" in line:
-            in_table = True
-            continue
-        if in_table and line.startswith("|---"):
-            continue
-        if in_table and line.startswith("|"):
-            cells = [c.strip() for c in line.split("|")[1:-1]]
-            if len(cells) >= 4:
-                rank, hyp_id, title, elo = cells[0], cells[1], cells[2], cells[3]
-                results.append(f"  {rank}. {title} (Elo {elo})")
-            if len(results) >= n:
-                break
-        elif in_table and not line.startswith("|"):
-            break
+    try:
+        with open(index_path, encoding="utf-8", buffering=65536) as f:
+            for line in f:
+                line = line.rstrip("\r\n")
+                if line.startswith("|") and "Rank" in line:
+                    in_table = True
+                    continue
+                if in_table and line.startswith("|---"):
+                    continue
+                if in_table and line.startswith("|"):
+                    cells = [c.strip() for c in line.split("|")[1:-1]]
+                    if len(cells) >= 4:
+                        rank, _, title, elo = cells[:4]
+                        results.append(f"  {rank}. {title} (Elo {elo})")
+                    if len(results) >= n:
+                        break
+                elif in_table and not line.startswith("|"):
+                    break
+    except OSError:
+        return []
     return results
 
 
 def _latest_meta_review(vault: Path) -> str | None:
     """Find the most recent meta-review and return a summary line."""
-    mr_dir = vault / "_research" / "meta-reviews"
-    if not mr_dir.is_dir():
-        return None
-    files = sorted(mr_dir.glob("*.md"), reverse=True)
-    if not files:
+    latest = max(_md_entries(vault / "_research" / "meta-reviews"), default=None)
+    if latest is None:
         return None
-    latest = files[0]
+    name, path = latest
+    stem = name[:-3]
     try:
-        text = latest.read_text(encoding="utf-8")
-        if text.startswith("---"):
-            fm_end = text.find("\n---\n", 4)
-            if fm_end > 0:
-                fm = yaml.safe_load(text[4:fm_end])
-                if isinstance(fm, dict):
-                    d = fm.get("date", latest.stem)
-                    reviewed = fm.get("hypotheses_reviewed", "?")
-                    matches = fm.get("matches_analyzed", "?")
-                    return (
-                        f"  Latest: {d} "
-                        f"({reviewed} hypotheses, {matches} matches)"
-                    )
+        fm = _read_frontmatter(path)
+        if isinstance(fm, dict):
+            d = fm.get("date", stem)
+            reviewed = fm.get("hypotheses_reviewed", "?")
+            matches = fm.get("matches_analyzed", "?")
+            return f"  Latest: {d} ({reviewed} hypotheses, {matches} matches)"
     except Exception:
         pass
-    return f"  Latest: {latest.stem}"
+    return f"  Latest: {stem}"
 
 
 def _load_methodology(vault: Path) -> str:
-    """Load compiled methodology directives for session context."""
+    """Load compiled methodology directives for session context.
+
+    The parse is cached on the file's mtime and size, like load_config().
+    """
     compiled = vault / "ops" / "methodology" / "_compiled.md"
-    if not compiled.exists():
+    try:
+        st = compiled.stat()
+    except OSError:
         return ""
-    text = compiled.read_text(encoding="utf-8").strip()
+    return _load_methodology_cached(str(compiled), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_methodology_cached(path: str, mtime_ns: int, size: int) -> str:
+    text = Path(path).read_text(encoding="utf-8").strip()
     if not text:
         return ""
     lines = text.splitlines()
@@ -151,13 +268,13 @@ def _load_methodology(vault: Path) -> str:
 
 def _count_md_files(directory: Path) -> int:
     """Count .md files in a directory (non-recursive, excludes dotfiles and .gitkeep)."""
-    if not directory.is_dir():
+    try:
+        with os.scandir(directory) as it:
+            return sum(
+                1 for e in it if e.name.endswith(".md") and not e.name.startswith(".")
+            )
+    except OSError:
         return 0
-    return sum(
-        1
-        for f in directory.iterdir()
-        if f.suffix == ".md" and not f.name.startswith(".")
-    )
 
 
 def _vault_state_counts(vault: Path) -> dict[str, int]:
@@ -173,16 +290,36 @@ def _vault_state_counts(vault: Path) -> dict[str, int]:
     }
 
 
+def _scan_file(path: Path, pattern: re.Pattern[bytes]) -> Iterator[re.Match[bytes]]:
+    """Yield the matches of *pattern* over the bytes of *path*.
+
+    Files above _MMAP_MIN_BYTES are memory-mapped and searched in place;
+    smaller ones are read whole.  A mapped buffer is closed when iteration
+    ends, so use each match before moving past the last one.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size > _MMAP_MIN_BYTES:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            buf = f.read()
+    try:
+        yield from pattern.finditer(buf)
+    finally:
+        if isinstance(buf, mmap.mmap):
+            buf.close()
+
+
+def _line_text(m: re.Match[bytes]) -> str:
+    """The matched line, decoded, without a CRLF's carriage return."""
+    return m.group().rstrip(b"\r").decode("utf-8")
+
+
 def _goals_md_threads(vault: Path, max_lines: int = 10) -> list[str]:
     """Extract bullet lines from self/goals.md as active threads."""
     goals_file = vault / "self" / "goals.md"
-    if not goals_file.exists():
-        return []
     try:
-        text = goals_file.read_text(encoding="utf-8")
-        lines = text.splitlines()
-        bullets = [ln for ln in lines if re.match(r"^\s*-\s", ln)]
-        return bullets[:max_lines]
+        matches = _scan_file(goals_file, _BULLET_RE)
+        return [_line_text(m) for m in itertools.islice(matches, max_lines)]
     except Exception:
         return []
 
@@ -190,23 +327,17 @@ def _goals_md_threads(vault: Path, max_lines: int = 10) -> list[str]:
 def _overdue_reminders(vault: Path, max_lines: int = 5) -> list[str]:
     """Extract unchecked reminders from ops/reminders.md."""
     reminders_file = vault / "ops" / "reminders.md"
-    if not reminders_file.exists():
-        return []
     try:
-        text = reminders_file.read_text(encoding="utf-8")
-        today_str = date.today().isoformat()
-        lines = text.splitlines()
+        today = date.today().isoformat().encode("ascii")
         unchecked = []
-        for ln in lines:
-            if re.match(r"^\s*- \[ \]", ln):
-                # Extract date if present (format: YYYY-MM-DD)
-                m = re.search(r"(\d{4}-\d{2}-\d{2})", ln)
-                if m and m.group(1) <= today_str:
-                    unchecked.append(ln)
-                elif not m:
-                    # No date -- include as undated reminder
-                    unchecked.append(ln)
-        return unchecked[:max_lines]
+        for m in _scan_file(reminders_file, _REMINDER_RE):
+            # Due (YYYY-MM-DD on or before today) or undated
+            due = m.group(1)
+            if due is None or due <= today:
+                unchecked.append(_line_text(m))
+                if len(unchecked) >= max_lines:
+                    break
+        return unchecked
     except Exception:
         return []
 
@@ -283,9 +414,9 @@ def _metabolic_dashboard(vault: Path, claim_count: int) -> str:
 
 def _slack_inbound(vault: Path) -> str:
     """Fetch inbound Slack messages for orientation. Never raises."""
+    if fetch_inbound_messages is None:
+        return ""
     try:
-        from engram_r.slack_notify import fetch_inbound_messages
-
         return fetch_inbound_messages(vault)
     except Exception:
         return ""
@@ -293,17 +424,15 @@ def _slack_inbound(vault: Path) -> str:
 
 def _slack_session_start(vault: Path, goals: list[str], top: list[str]) -> None:
     """Fire session_start Slack notification. Never raises."""
-    try:
-        from engram_r.slack_notify import send_notification
-
+    if send_notification is None:
+        return
+    with contextlib.suppress(Exception):
         send_notification(
             "session_start",
             vault,
             goals=goals,
             top_hypotheses=top,
         )
-    except Exception:
-        pass
 
 
 def main() -> None:
@@ -323,10 +452,24 @@ def main() -> None:
     except Exception:
         pass
 
+    # The vault probes only read files (and Slack), so their waits overlap
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        pending = {
+            "goals": pool.submit(_list_active_goals, vault),
+            "top": pool.submit(_top_hypotheses, vault),
+            "meta_review": pool.submit(_latest_meta_review, vault),
+            "threads": pool.submit(_goals_md_threads, vault),
+            "reminders": pool.submit(_overdue_reminders, vault),
+            "counts": pool.submit(_vault_state_counts, vault),
+            "methodology": pool.submit(_load_methodology, vault),
+            "inbound": pool.submit(_slack_inbound, vault),
+        }
+        integrity_warnings = _check_integrity(vault)
+    probes = {name: future.result() for name, future in pending.items()}
+
     parts = []
 
     # Integrity check (before everything else so drift is unmissable)
-    integrity_warnings = _check_integrity(vault)
     if integrity_warnings:
         parts.append("### Integrity")
         for w in integrity_warnings:
@@ -336,7 +479,7 @@ def main() -> None:
     parts.append("[Session Orient]")
 
     # Active goals
-    goals = _list_active_goals(vault)
+    goals = probes["goals"]
     if goals:
         parts.append("Active goals:")
         for g in goals:
@@ -345,7 +488,7 @@ def main() -> None:
         parts.append("Active goals: (none found)")
 
     # Top hypotheses
-    top = _top_hypotheses(vault)
+    top = probes["top"]
     if top:
         parts.append("Top hypotheses:")
         for line in top:
@@ -354,7 +497,7 @@ def main() -> None:
         parts.append("Top hypotheses: (no leaderboard)")
 
     # Meta-review
-    mr = _latest_meta_review(vault)
+    mr = probes["meta_review"]
     if mr:
         parts.append("Meta-review:")
         parts.append(mr)
@@ -362,7 +505,7 @@ def main() -> None:
         parts.append("Meta-review: (none yet)")
 
     # Active threads from goals.md (absorbed from session-orient.sh)
-    threads = _goals_md_threads(vault)
+    threads = probes["threads"]
     if threads:
         parts.append("")
         parts.append("### Active Threads")
@@ -370,7 +513,7 @@ def main() -> None:
             parts.append(t)
 
     # Overdue reminders (absorbed from session-orient.sh)
-    reminders = _overdue_reminders(vault)
+    reminders = probes["reminders"]
     if reminders:
         parts.append("")
         parts.append("### Reminders")
@@ -378,7 +521,7 @@ def main() -> None:
             parts.append(r)
 
     # Vault state counts (absorbed from session-orient.sh)
-    counts = _vault_state_counts(vault)
+    counts = probes["counts"]
     parts.append("")
     parts.append("### Vault State")
     queue_str = f"{counts['queue_pending']} pending"
@@ -410,13 +553,13 @@ def main() -> None:
     parts.extend(_build_next_action_section(vault))
 
     # Methodology directives
-    methodology = _load_methodology(vault)
+    methodology = probes["methodology"]
     if methodology:
         parts.append("")
         parts.append(methodology)
 
     # Slack inbound messages
-    inbound = _slack_inbound(vault)
+    inbound = probes["inbound"]
     if inbound:
         parts.append("")
         parts.append(inbound)
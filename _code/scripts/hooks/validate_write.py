@@ -19,32 +19,35 @@ Exit behavior:
 
 from __future__ import annotations
 
-import json
 import os
-import re
 import sys
 from pathlib import Path
+from typing import TextIO
 
 
-# Add src to path so we can import engram_r
+# Add src to path so we can import engram_r.  Under the hook daemon
+# engram_r is already imported, and sys.path is left alone.
 _SCRIPT_DIR = Path(__file__).resolve().parent
 _CODE_DIR = _SCRIPT_DIR.parent.parent
-sys.path.insert(0, str(_CODE_DIR / "src"))
-
-from engram_r.hook_utils import load_config, resolve_vault  # noqa: E402
+if "engram_r" not in sys.modules:
+    sys.path.insert(0, str(_CODE_DIR / "src"))
+
+from engram_r import _fastjson  # noqa: E402
+from engram_r.hook_utils import (  # noqa: E402
+    load_config,
+    resolve_vault,
+    vault_relpath,
+)
 from engram_r.integrity import MONITORED_DIRS, PROTECTED_PATHS  # noqa: E402
 from engram_r.pii_filter import redact_text  # noqa: E402
 from engram_r.schema_validator import (  # noqa: E402
     check_nonstandard_headers,
-    check_notes_provenance,
     check_queue_provenance,
     check_title_echo,
     check_topics_footer,
     check_wiki_link_targets,
-    detect_unicode_issues,
-    detect_yaml_safety_issues,
+    validate_all,
     validate_filename,
-    validate_note,
 )
 
 def _log_bypass(vault: Path, bypass_type: str, file_path: str) -> None:
@@ -66,8 +69,16 @@ def _log_bypass(vault: Path, bypass_type: str, file_path: str) -> None:
 # Directories where notes are flat (no subdirectories allowed).
 _FLAT_DIRS = {"notes", "hypotheses", "literature", "experiments", "landscape"}
 
-# Regex for truncated wiki links: [[some title...]]
-_TRUNCATED_LINK_RE = re.compile(r"\[\[[^\]]*\.\.\.\]\]")
+# How the end of a .md file_path value appears in the raw hook JSON
+_MD_PATH_END = '.md"'
+
+# MONITORED_DIRS as path prefixes, for a single str.startswith() test
+_MONITORED_PREFIXES = tuple(d + "/" for d in MONITORED_DIRS)
+
+
+def _respond(response: dict, file: TextIO | None = None) -> None:
+    """Print a hook decision as one line of JSON (stdout by default)."""
+    print(_fastjson.dumps(response).decode("utf-8"), file=file)
 
 
 def _check_flat_dir_violation(rel_path: str) -> str | None:
@@ -91,22 +102,19 @@ def _check_flat_dir_violation(rel_path: str) -> str | None:
     return None
 
 
-def _check_truncated_wiki_links(content: str) -> str | None:
-    """Detect truncated wiki links like ``[[some title...]]``.
-
-    Absorbed from validate-note.sh. Returns an error message if found.
-    """
-    match = _TRUNCATED_LINK_RE.search(content)
-    if match:
-        return (
-            f"Truncated wiki link found: {match.group()}. "
-            f"Write the full title or use backtick code spans for shorthand references."
-        )
-    return None
-
-
 def main() -> None:
     """Validate a written file against note schemas."""
+    # Read hook input from stdin
+    try:
+        raw = sys.stdin.read()
+    except Exception:
+        return
+    # Only .md paths are validated, and JSON never escapes ".md", so input
+    # without '.md"' is skipped before loading config or decoding the
+    # (possibly large) tool_input content.
+    if _MD_PATH_END not in raw:
+        return
+
     config = load_config()
 
     if not config.get("schema_validation", True):
@@ -114,13 +122,9 @@ def main() -> None:
 
     vault = resolve_vault(config)
 
-    # Read hook input from stdin
     try:
-        raw = sys.stdin.read()
-        if not raw.strip():
-            return
-        hook_input = json.loads(raw)
-    except (json.JSONDecodeError, Exception):
+        hook_input = _fastjson.loads(raw)
+    except Exception:
         return
 
     tool_input = hook_input.get("tool_input", {})
@@ -135,21 +139,13 @@ def main() -> None:
     if file_path.suffix != ".md":
         return
 
-    try:
-        vault_resolved = vault.resolve()
-        file_resolved = file_path.resolve()
-        if not str(file_resolved).startswith(str(vault_resolved)):
-            return
-    except Exception:
+    # Lexical comparison first; symlinks are only resolved if that misses
+    rel_str = vault_relpath(file_path_str, vault)
+    if not rel_str:
         return
 
     # Skip files in _code/ (code, templates, and styles -- not notes)
-    try:
-        rel = file_resolved.relative_to(vault_resolved)
-        rel_str = str(rel)
-        if rel_str.startswith("_code"):
-            return
-    except ValueError:
+    if rel_str.startswith("_code"):
         return
 
     # Block writes to protected identity/config files
@@ -167,21 +163,19 @@ def main() -> None:
                     f"the manifest."
                 ),
             }
-            print(json.dumps(response))
+            _respond(response)
             sys.exit(0)
 
     # Warn on methodology source file writes (monitored, not blocked)
-    for monitored_dir in MONITORED_DIRS:
-        if rel_str.startswith(monitored_dir + "/") and rel_str not in PROTECTED_PATHS:
-            response = {
-                "decision": "warn",
-                "reason": (
-                    f"Methodology source file: {rel_str}. "
-                    f"Changes will persist into future compiled outputs."
-                ),
-            }
-            print(json.dumps(response), file=sys.stderr)
-            break  # Only warn once
+    if rel_str.startswith(_MONITORED_PREFIXES) and rel_str not in PROTECTED_PATHS:
+        response = {
+            "decision": "warn",
+            "reason": (
+                f"Methodology source file: {rel_str}. "
+                f"Changes will persist into future compiled outputs."
+            ),
+        }
+        _respond(response, file=sys.stderr)
 
     # Check for / in note titles (creates accidental subdirectories)
     flat_error = _check_flat_dir_violation(rel_str)
@@ -190,7 +184,7 @@ def main() -> None:
             "decision": "block",
             "reason": flat_error,
         }
-        print(json.dumps(response))
+        _respond(response)
         sys.exit(0)
 
     # Check for other unsafe characters (: * ? " < > |) in the filename
@@ -200,7 +194,7 @@ def main() -> None:
             "decision": "block",
             "reason": "; ".join(filename_errors),
         }
-        print(json.dumps(response))
+        _respond(response)
         sys.exit(0)
 
     # Read the content -- prefer tool_input content if available (Write),
@@ -225,63 +219,40 @@ def main() -> None:
                 "Remove or redact identifiable information before writing."
             ),
         }
-        print(json.dumps(response))
-        sys.exit(0)
-
-    # YAML safety: detect unquoted colons/hashes that silently misparse
-    yaml_issues = detect_yaml_safety_issues(content)
-    if yaml_issues:
-        response = {
-            "decision": "block",
-            "reason": ("YAML safety issue in frontmatter: " + "; ".join(yaml_issues)),
-        }
-        print(json.dumps(response))
-        sys.exit(0)
-
-    # Unicode: detect non-NFC characters in frontmatter
-    unicode_issues = detect_unicode_issues(content)
-    if unicode_issues:
-        response = {
-            "decision": "block",
-            "reason": ("Unicode normalization issue: " + "; ".join(unicode_issues)),
-        }
-        print(json.dumps(response))
+        _respond(response)
         sys.exit(0)
 
-    # Truncated wiki links (absorbed from validate-note.sh)
-    # Only check files under notes/ and _research/
-    if rel_str.startswith("notes") or rel_str.startswith("_research"):
-        trunc_error = _check_truncated_wiki_links(content)
-        if trunc_error:
-            response = {
-                "decision": "block",
-                "reason": trunc_error,
-            }
-            print(json.dumps(response))
-            sys.exit(0)
-
-    result = validate_note(content)
-
+    # Frontmatter YAML safety and Unicode, truncated wiki links (notes/ and
+    # _research/ only, absorbed from validate-note.sh), the type schema,
+    # and notes/ provenance -- one frontmatter parse, first failure blocks.
+    in_notes = rel_str.startswith("notes")
+    pipeline_checks = bool(config.get("pipeline_compliance", True)) and in_notes
+    tool_name = hook_input.get("tool_name", "")
+    # Source warnings only for new files (Write tool), not edits.
+    # Design choice: Write warns on missing source field because new notes
+    # should have provenance. Edit suppresses because most edits add
+    # content to existing notes that already have a source field, and
+    # warning on every /reflect or /reweave edit would produce noise.
+    # To enforce source on all writes, set schema_validation_strict: true
+    # in ops/config.yaml.
+    result = validate_all(
+        content,
+        check_truncated_links=rel_str.startswith(("notes", "_research")),
+        check_provenance=pipeline_checks,
+        check_source=(
+            tool_name == "Write" or bool(config.get("schema_validation_strict"))
+        ),
+    )
     if not result.valid:
         response = {
             "decision": "block",
             "reason": "; ".join(result.errors),
         }
-        print(json.dumps(response))
+        _respond(response)
         sys.exit(0)
 
-    # Pipeline provenance check for notes/ files
-    if config.get("pipeline_compliance", True) and rel_str.startswith("notes"):
-        prov = check_notes_provenance(content)
-
-        if not prov.valid:
-            response = {
-                "decision": "block",
-                "reason": "; ".join(prov.errors),
-            }
-            print(json.dumps(response))
-            sys.exit(0)
-
+    # Structural checks for notes/ files
+    if pipeline_checks:
         # B1: Title echo -- BLOCK if body starts with # heading
         title_echo = check_title_echo(content)
         if not title_echo.valid:
@@ -289,7 +260,7 @@ def main() -> None:
                 "decision": "block",
                 "reason": "; ".join(title_echo.errors),
             }
-            print(json.dumps(response))
+            _respond(response)
             sys.exit(0)
 
         # B2: Non-standard headers -- WARN
@@ -305,7 +276,7 @@ def main() -> None:
                 "decision": "block",
                 "reason": "; ".join(wiki_links.errors),
             }
-            print(json.dumps(response))
+            _respond(response)
             sys.exit(0)
 
         # B4: Topics footer -- WARN if missing
@@ -318,7 +289,6 @@ def main() -> None:
         # Only applies to Write (new files), not Edit (updates to existing).
         # Skipped when ENGRAMR_PIPELINE_BYPASS is set (for /init seeding
         # and other direct-write workflows that predate the queue).
-        tool_name = hook_input.get("tool_name", "")
         pipeline_bypass_active = bool(os.environ.get("ENGRAMR_PIPELINE_BYPASS"))
         if pipeline_bypass_active and tool_name == "Write" and not file_path.exists():
             _log_bypass(vault, "PIPELINE_BYPASS", rel_str)
@@ -335,18 +305,11 @@ def main() -> None:
                     "decision": "block",
                     "reason": "; ".join(queue_prov.errors),
                 }
-                print(json.dumps(response))
+                _respond(response)
                 sys.exit(0)
 
-        # Source warnings only for new files (Write tool), not edits.
-        # Design choice: Write warns on missing source field because new notes
-        # should have provenance. Edit suppresses because most edits add
-        # content to existing notes that already have a source field, and
-        # warning on every /reflect or /reweave edit would produce noise.
-        # To enforce source on all writes, set schema_validation_strict: true
-        # in ops/config.yaml.
-        if prov.warnings and tool_name == "Write":
-            for w in prov.warnings:
+        if result.warnings:
+            for w in result.warnings:
                 print(f"WARN: {w}", file=sys.stderr)
 
 
@@ -9,6 +9,7 @@ Usage:
     uv run python scripts/init_vault.py /path/to/new-vault --name "My Lab"
     uv run python scripts/init_vault.py /path/to/new-vault --no-git
     uv run python scripts/init_vault.py /path/to/new-vault --starter
+    uv run python scripts/init_vault.py /path/to/new-vault --hardlink-code
 
 Exit codes:
     0 - success
@@ -19,12 +20,24 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import contextlib
+import errno
+import functools
 import json
 import logging
+import os
 import shutil
 import subprocess
 import sys
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import BinaryIO
+
+try:
+    import fcntl
+except ImportError:  # not on Windows
+    fcntl = None  # type: ignore[assignment]
 
 logging.basicConfig(
     level=logging.INFO,
@@ -118,33 +131,238 @@ _FULL_SKILLS: list[str] = [
 ]
 
 
+@functools.cache
 def _find_source_vault() -> Path:
-    """Locate the source vault (the repo containing this script)."""
-    # scripts/init_vault.py -> _code/scripts/init_vault.py -> vault root
-    script_dir = Path(__file__).resolve().parent
-    code_dir = script_dir.parent  # _code/
-    vault_root = code_dir.parent  # vault root
-    if (vault_root / "_code" / "templates").is_dir() and (vault_root / "CLAUDE.md").is_file():
+    """Locate the source vault (the repo containing this script).
+
+    ``ENGRAMR_SOURCE_VAULT`` names it directly, skipping the resolve of this
+    script's path. The result is cached for the life of the process.
+    """
+    override = os.environ.get("ENGRAMR_SOURCE_VAULT")
+    if override:
+        vault_root = Path(override)
+        origin = "ENGRAMR_SOURCE_VAULT"
+    else:
+        # scripts/init_vault.py -> _code/scripts/init_vault.py -> vault root
+        script_dir = Path(__file__).resolve().parent
+        vault_root = script_dir.parent.parent
+        origin = f"script location {script_dir}"
+    if (vault_root / "_code" / "templates").is_dir() and (
+        vault_root / "CLAUDE.md"
+    ).is_file():
         return vault_root
-    log.error("Cannot find source vault from script location: %s", script_dir)
+    log.error("Cannot find source vault from %s", origin)
     sys.exit(2)
 
 
-def _copy_dir(src: Path, dst: Path) -> None:
-    """Copy a directory tree, creating parents as needed."""
+def _sendfile(in_fd: int, out_fd: int, count: int) -> int:
+    """os.sendfile with copy_file_range's argument order."""
+    return os.sendfile(out_fd, in_fd, None, count)
+
+
+# FICLONE ioctl from linux/fs.h
+_FICLONE = 0x40049409
+
+
+def _ficlone(in_fd: int, out_fd: int, count: int) -> int:
+    """Make *out_fd* share *in_fd*'s extents (a reflink). Returns *count*."""
+    fcntl.ioctl(out_fd, _FICLONE, in_fd)
+    return count
+
+
+# In-kernel copy primitives, tried in order: a FICLONE reflink (instant on
+# btrfs and XFS), copy_file_range, then sendfile.  Each takes (in_fd,
+# out_fd, count) and returns the bytes copied; the last two also advance
+# both file offsets.
+_KERNEL_COPIES: list[Callable[[int, int, int], int]] = []
+if fcntl is not None and sys.platform.startswith("linux"):
+    _KERNEL_COPIES.append(_ficlone)
+if hasattr(os, "copy_file_range"):
+    _KERNEL_COPIES.append(os.copy_file_range)
+if hasattr(os, "sendfile"):
+    _KERNEL_COPIES.append(_sendfile)
+
+# Buffer for the userspace fallback copy: 1 MiB rather than shutil's 64 KiB
+# default, so a large file takes a sixteenth of the read/write calls.
+_COPY_BUFSIZE = 1024 * 1024
+
+# errnos meaning "not supported for this pair of files" -- try the next method
+_UNSUPPORTED_COPY = frozenset({
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.ENOTSOCK,
+    errno.ENOTTY,
+})
+
+
+def _copy_buffered(fsrc: BinaryIO, fdst: BinaryIO) -> None:
+    """Copy the rest of *fsrc* to *fdst* through one reused buffer."""
+    with memoryview(bytearray(_COPY_BUFSIZE)) as view:
+        while n := fsrc.readinto(view):
+            fdst.write(view[:n])
+
+
+def _fastcopy(src: str | Path, dst: str | Path) -> str | Path:
+    """Copy file contents without a userspace buffer where possible, like copy2.
+
+    Falls back to a buffered copy when neither kernel primitive applies,
+    then copies permissions and timestamps. Usable as a copytree
+    ``copy_function``.
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        remaining = os.fstat(in_fd).st_size
+        for kernel_copy in _KERNEL_COPIES:
+            try:
+                while remaining > 0:
+                    copied = kernel_copy(in_fd, out_fd, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            except OSError as exc:
+                if exc.errno not in _UNSUPPORTED_COPY:
+                    raise
+                continue
+            break
+        else:
+            _copy_buffered(fsrc, fdst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+# errnos from os.link meaning "cannot link here" -- copy instead
+_UNLINKABLE = frozenset({errno.EXDEV, errno.EPERM, errno.EMLINK, errno.EOPNOTSUPP})
+
+
+def _link_or_copy(src: str | Path, dst: str | Path) -> str | Path:
+    """Hard-link *src* at *dst*, or copy it where a link is not possible."""
+    try:
+        os.link(src, dst)
+    except OSError as exc:
+        if exc.errno not in _UNLINKABLE:
+            raise
+        return _fastcopy(src, dst)
+    return dst
+
+
+_CopyFunction = Callable[[Path, Path], object]
+
+# A file copy queued by the _copy_* planners:
+# (source file, destination file, function that copies it)
+_CopyJob = tuple[Path, Path, _CopyFunction]
+
+
+def _mirror_tree(
+    src: Path,
+    dst: Path,
+    jobs: list[_CopyJob],
+    exclude: frozenset[str] = frozenset(),
+    copy: _CopyFunction = _fastcopy,
+) -> None:
+    """Recreate *src*'s directories under *dst* and queue its files on *jobs*.
+
+    Like copytree, symlinks are followed and names in *exclude* are skipped
+    at any depth. Each file is queued to be copied with *copy*.
+    """
+    for root, dirs, files in os.walk(src, followlinks=True):
+        dirs[:] = [d for d in dirs if d not in exclude]
+        out = dst / os.path.relpath(root, src)
+        out.mkdir(parents=True, exist_ok=True)
+        shutil.copystat(root, out)
+        jobs.extend((Path(root, f), out / f, copy) for f in files if f not in exclude)
+
+
+def _run_copies(jobs: list[_CopyJob]) -> None:
+    """Copy every queued file, overlapping them on a thread pool.
+
+    Each copy spends its time in the kernel with the GIL released, so the
+    copies proceed in parallel up to the disk's queue depth.
+    """
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for _ in pool.map(lambda job: job[2](job[0], job[1]), jobs):
+            pass
+
+
+def _copy_dir(src: Path, dst: Path, jobs: list[_CopyJob]) -> None:
+    """Queue a directory tree for copying, creating its directories now."""
     if dst.exists():
         shutil.rmtree(dst)
-    shutil.copytree(src, dst)
+    _mirror_tree(src, dst, jobs)
     log.info("  copied %s/", dst.name)
 
 
-def _copy_file(src: Path, dst: Path) -> None:
-    """Copy a single file, creating parent dirs as needed."""
+def _copy_file(src: Path, dst: Path, jobs: list[_CopyJob]) -> None:
+    """Queue a single file for copying, creating parent dirs now."""
     dst.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src, dst)
+    jobs.append((src, dst, _fastcopy))
     log.info("  copied %s", dst.relative_to(dst.parent.parent))
 
 
+def _probe_source(source: Path, paths: Iterable[str]) -> tuple[set[str], set[str]]:
+    """Split *paths* (relative to *source*) into existing dirs and files.
+
+    Each distinct parent directory is listed once with scandir, whose
+    entries carry their type, instead of stat'ing every path. Symlinks are
+    followed, as with Path.is_dir() and Path.is_file().
+    """
+    wanted = set(paths)
+    dirs: set[str] = set()
+    files: set[str] = set()
+    for parent in {os.path.dirname(p) for p in wanted}:
+        try:
+            with os.scandir(source / parent) as it:
+                for entry in it:
+                    rel = f"{parent}/{entry.name}" if parent else entry.name
+                    if rel not in wanted:
+                        continue
+                    try:
+                        if entry.is_dir():
+                            dirs.add(rel)
+                        elif entry.is_file():
+                            files.add(rel)
+                    except OSError:  # dangling symlink
+                        pass
+        except OSError:  # parent missing, so nothing under it exists
+            continue
+    return dirs, files
+
+
+def _create_empty_dirs(target: Path) -> None:
+    """Create each of _EMPTY_DIRS under *target*, holding a .gitkeep.
+
+    Directories are opened once and children created relative to them
+    (``dir_fd``), so shared parents such as ``ops/`` and ``_research/`` are
+    looked up once rather than once per entry.
+    """
+    if not {os.open, os.mkdir} <= os.supports_dir_fd:
+        for d in _EMPTY_DIRS:
+            (target / d).mkdir(parents=True, exist_ok=True)
+            (target / d / ".gitkeep").touch()
+        return
+
+    flags = os.O_RDONLY | os.O_DIRECTORY
+    fds = {"": os.open(target, flags)}
+    try:
+        for d in _EMPTY_DIRS:
+            prefix = ""
+            for name in d.split("/"):
+                parent_fd = fds[prefix]
+                prefix = f"{prefix}/{name}" if prefix else name
+                if prefix not in fds:
+                    with contextlib.suppress(FileExistsError):
+                        os.mkdir(name, dir_fd=parent_fd)
+                    fds[prefix] = os.open(name, flags, dir_fd=parent_fd)
+            os.close(
+                os.open(".gitkeep", os.O_WRONLY | os.O_CREAT, 0o644, dir_fd=fds[prefix])
+            )
+    finally:
+        for fd in fds.values():
+            os.close(fd)
+
+
 def _create_gitignore(target: Path) -> None:
     """Write a .gitignore suitable for a new vault."""
     content = """\
@@ -336,12 +554,18 @@ def _create_reminders(target: Path) -> None:
     log.info("  created ops/reminders.md")
 
 
-def _copy_code_dir(source: Path, target: Path) -> None:
-    """Copy _code/ directory, excluding venv, caches, and coverage."""
+def _copy_code_dir(
+    source: Path, target: Path, jobs: list[_CopyJob], *, hardlink: bool = False
+) -> None:
+    """Queue the _code/ directory, excluding venv, caches, and coverage.
+
+    With *hardlink*, files are hard-linked to the source where both trees
+    share a filesystem, so edits in either vault show up in the other.
+    """
     src_code = source / "_code"
     dst_code = target / "_code"
 
-    exclude = {
+    exclude = frozenset({
         ".venv",
         "__pycache__",
         ".mypy_cache",
@@ -351,35 +575,37 @@ def _copy_code_dir(source: Path, target: Path) -> None:
         "htmlcov",
         ".claude",
         ".git",
-    }
-
-    def _ignore(directory: str, contents: list[str]) -> list[str]:
-        return [c for c in contents if c in exclude]
+    })
 
-    shutil.copytree(src_code, dst_code, ignore=_ignore)
-    log.info("  copied _code/ (Python + R library)")
+    if hardlink:
+        _mirror_tree(src_code, dst_code, jobs, exclude, copy=_link_or_copy)
+        log.info("  linked _code/ (Python + R library)")
+    else:
+        _mirror_tree(src_code, dst_code, jobs, exclude)
+        log.info("  copied _code/ (Python + R library)")
 
 
 def _init_git(target: Path) -> None:
-    """Initialize a git repository and make the initial commit."""
-    subprocess.run(
-        ["git", "init"],
-        cwd=str(target),
-        capture_output=True,
-        check=True,
-    )
-    subprocess.run(
-        ["git", "add", "."],
-        cwd=str(target),
-        capture_output=True,
-        check=True,
-    )
-    subprocess.run(
-        ["git", "commit", "-m", "feat: scaffold EngramR vault"],
-        cwd=str(target),
-        capture_output=True,
-        check=True,
-    )
+    """Initialize a git repository and make the initial commit.
+
+    The scaffold commit is never signed: a signing setup in the user's git
+    config would otherwise spawn gpg (and possibly a pinentry prompt) from
+    a non-interactive command.
+    """
+    for cmd in (
+        ["git", "init", "-q"],
+        ["git", "add", "-A"],
+        [
+            "git",
+            "-c",
+            "commit.gpgsign=false",
+            "commit",
+            "-q",
+            "-m",
+            "feat: scaffold EngramR vault",
+        ],
+    ):
+        subprocess.run(cmd, cwd=str(target), capture_output=True, check=True)
     log.info("  initialized git repository with initial commit")
 
 
@@ -461,8 +687,13 @@ def scaffold(
     starter_only: bool = False,
     register: bool = True,
     force: bool = False,
+    hardlink_code: bool = False,
 ) -> None:
-    """Create a new vault at *target* from the *source* vault template."""
+    """Create a new vault at *target* from the *source* vault template.
+
+    With *hardlink_code*, the new vault's _code/ files are hard links to the
+    source's rather than copies.
+    """
     target = target.resolve()
 
     if target.exists() and any(target.iterdir()):
@@ -480,9 +711,18 @@ def scaffold(
 
     # 1. Create empty runtime directories
     log.info("Creating directory structure...")
-    for d in _EMPTY_DIRS:
-        (target / d).mkdir(parents=True, exist_ok=True)
-        (target / d / ".gitkeep").touch()
+    _create_empty_dirs(target)
+
+    # 2-4. Queue the template directories, config files, and _code/, then
+    # copy all of their files at once.
+    jobs: list[_CopyJob] = []
+
+    # Find which of the source paths below exist, one listing per parent
+    probes = [*_COPY_DIRS, *_COPY_FILES]
+    if starter_only:
+        probes.extend(f".claude/skills/{name}" for name in _STARTER_SKILLS)
+        probes.append(".claude/skills/_graph.md")
+    present_dirs, present_files = _probe_source(source, probes)
 
     # 2. Copy template directories
     log.info("Copying templates and configuration...")
@@ -493,29 +733,28 @@ def scaffold(
             dst = target / d
             dst.mkdir(parents=True, exist_ok=True)
             for skill_name in _STARTER_SKILLS:
-                skill_src = src / skill_name
-                if skill_src.is_dir():
-                    _copy_dir(skill_src, dst / skill_name)
+                if f"{d}/{skill_name}" in present_dirs:
+                    _copy_dir(src / skill_name, dst / skill_name, jobs)
             # Also copy _graph.md if present
-            graph_md = src / "_graph.md"
-            if graph_md.is_file():
-                _copy_file(graph_md, dst / "_graph.md")
-        elif src.is_dir():
-            _copy_dir(src, target / d)
+            if f"{d}/_graph.md" in present_files:
+                _copy_file(src / "_graph.md", dst / "_graph.md", jobs)
+        elif d in present_dirs:
+            _copy_dir(src, target / d, jobs)
         else:
             log.warning("  skipped %s (not found in source)", d)
 
     # 3. Copy individual config files
     for f in _COPY_FILES:
         src = source / f
-        if src.is_file():
-            _copy_file(src, target / f)
+        if f in present_files:
+            _copy_file(src, target / f, jobs)
         else:
             log.warning("  skipped %s (not found in source)", f)
 
     # 4. Copy _code/ directory
     log.info("Copying code library...")
-    _copy_code_dir(source, target)
+    _copy_code_dir(source, target, jobs, hardlink=hardlink_code)
+    _run_copies(jobs)
 
     # 5. Generate scaffold files
     log.info("Generating scaffold files...")
@@ -604,11 +843,22 @@ def main() -> None:
         action="store_true",
         help="Overwrite target if it already exists",
     )
+    parser.add_argument(
+        "--hardlink-code",
+        action="store_true",
+        help=(
+            "Hard-link _code/ files to the source vault instead of copying "
+            "them (same filesystem only; edits then affect both vaults)"
+        ),
+    )
     parser.add_argument(
         "--source",
         type=Path,
         default=None,
-        help="Source vault to copy from (default: auto-detect from script location)",
+        help=(
+            "Source vault to copy from (default: $ENGRAMR_SOURCE_VAULT, else "
+            "auto-detect from script location)"
+        ),
     )
     args = parser.parse_args()
 
@@ -622,6 +872,7 @@ def main() -> None:
         starter_only=args.starter,
         register=not args.no_register,
         force=args.force,
+        hardlink_code=args.hardlink_code,
     )
 
 
@@ -13,51 +13,81 @@ Source class inference logic:
 
 Usage:
   uv run python scripts/backfill_provenance.py [--dry-run] [--notes-dir PATH]
+      [--workers N]
 """
 
 from __future__ import annotations
 
 import argparse
+import functools
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
 
-_FM_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # libyaml not compiled in
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
 
-# Source class inference from the source wiki-link target
-_SOURCE_RULES: list[tuple[re.Pattern, str]] = [
-    (re.compile(r"^\[\[H-"), "hypothesis"),
-    (re.compile(r"^\[\[H0"), "hypothesis"),
-    (re.compile(r"^\[\[EXP-"), "empirical"),
-    (re.compile(r"^\[\[lit-survey-"), "published"),
-    (re.compile(r"^\[\[2026-"), "published"),
-    (re.compile(r"^\[\[202[0-9]-"), "published"),
-]
+# Frontmatter delimiters: the file opens with _FM_OPEN and the block ends at
+# the first _FM_CLOSE after it.
+_FM_OPEN = "---\n"
+_FM_CLOSE = "\n---\n"
+
+# Frontmatter sits at the top of the file; this prefix covers nearly all notes
+_HEAD_CHARS = 8192
+
+# Source class inference from the source wiki-link target.  One anchored
+# alternation; the name of the matching group is the inferred class.
+_SOURCE_RE = re.compile(
+    r"\[\[(?:"
+    r"(?P<hypothesis>H-|H0)"
+    r"|(?P<empirical>EXP-)"
+    r"|(?P<published>lit-survey-|202[0-9]-)"
+    r")"
+)
 
 
 def infer_source_class(source_value: str) -> str:
     """Infer source_class from the source field value."""
-    source_value = source_value.strip()
-    if not source_value:
-        return "synthesis"
-    for pattern, cls in _SOURCE_RULES:
-        if pattern.search(source_value):
-            return cls
-    return "synthesis"
+    m = _SOURCE_RE.match(source_value.strip())
+    return m.lastgroup if m else "synthesis"
+
+
+def _read_head(path: Path) -> tuple[str, bool] | None:
+    """Read enough of *path* to cover its frontmatter.
+
+    Returns ``(text, complete)`` where *complete* is True when *text* holds
+    the whole file, or None when the file does not open a frontmatter block.
+    Falls back to the full file when the frontmatter outgrows the prefix.
+    """
+    with path.open(encoding="utf-8") as f:
+        text = f.read(_HEAD_CHARS)
+        if not text.startswith(_FM_OPEN):
+            return None
+        complete = len(text) < _HEAD_CHARS
+        if not complete and text.find(_FM_CLOSE, len(_FM_OPEN)) < 0:
+            text += f.read()
+            complete = True
+    return text, complete
 
 
 def backfill_note(path: Path, *, dry_run: bool = False) -> dict[str, str] | None:
     """Add provenance fields to a single note.  Returns changes made or None."""
-    content = path.read_text(encoding="utf-8")
-    match = _FM_PATTERN.match(content)
-    if not match:
+    head = _read_head(path)
+    if head is None:
+        return None
+    content, complete = head
+    end = content.find(_FM_CLOSE, len(_FM_OPEN))
+    if end < 0:
         return None
 
-    fm_text = match.group(1)
+    fm_text = content[len(_FM_OPEN) : end]
     try:
-        fm = yaml.safe_load(fm_text)
+        fm = yaml.load(fm_text, Loader=_Loader)
     except yaml.YAMLError:
         return None
 
@@ -90,31 +120,32 @@ def backfill_note(path: Path, *, dry_run: bool = False) -> dict[str, str] | None
     if dry_run:
         return changes
 
-    # Build new frontmatter lines to insert before the closing ---
-    new_lines: list[str] = []
-    for key, val in changes.items():
-        if val == "null":
-            new_lines.append(f"{key}: null")
-        else:
-            new_lines.append(f'{key}: "{val}"')
+    if not complete:
+        content = path.read_text(encoding="utf-8")
 
-    insert_block = "\n".join(new_lines)
-
-    # Insert before closing --- of frontmatter
-    # The frontmatter ends at match.end(), which is after the closing ---\n
-    # We need to insert before the closing ---
-    pre = content[: match.end()]
-    post = content[match.end() :]
+    insert_block = "\n".join(
+        f"{key}: null" if val == "null" else f'{key}: "{val}"'
+        for key, val in changes.items()
+    )
 
-    # Find the closing --- in the pre section
+    # Insert after the last frontmatter line, before the closing ---
     # Structure: ---\n{fm_text}\n---\n
-    closing_idx = pre.rfind("---")
-    new_content = pre[:closing_idx] + insert_block + "\n" + pre[closing_idx:] + post
+    new_content = content[:end] + "\n" + insert_block + content[end:]
 
     path.write_text(new_content, encoding="utf-8")
     return changes
 
 
+def _backfill_worker(
+    path: Path, *, dry_run: bool
+) -> tuple[dict[str, str] | None, str | None]:
+    """Pool worker: run backfill_note, returning ``(changes, error)``."""
+    try:
+        return backfill_note(path, dry_run=dry_run), None
+    except Exception as exc:
+        return None, str(exc)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Backfill epistemic provenance fields")
     parser.add_argument(
@@ -128,6 +159,12 @@ def main() -> None:
         default=Path(__file__).resolve().parents[3] / "notes",
         help="Path to notes directory",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker count for the note scan (default: CPU count)",
+    )
     args = parser.parse_args()
 
     notes_dir: Path = args.notes_dir
@@ -141,24 +178,31 @@ def main() -> None:
 
     source_class_counts: dict[str, int] = {}
 
-    for note_path in sorted(notes_dir.glob("*.md")):
-        try:
-            result = backfill_note(note_path, dry_run=args.dry_run)
-        except Exception as exc:
-            print(f"  ERROR {note_path.name}: {exc}", file=sys.stderr)
-            errors += 1
-            continue
-
-        if result is None:
-            skipped += 1
-            continue
-
-        updated += 1
-        sc = result.get("source_class", "?")
-        source_class_counts[sc] = source_class_counts.get(sc, 0) + 1
-
-        if args.dry_run:
-            print(f"  WOULD UPDATE {note_path.name}: {result}")
+    note_paths = sorted(notes_dir.glob("*.md"))
+    worker = functools.partial(_backfill_worker, dry_run=args.dry_run)
+    # Dry runs only read: threads overlap the file reads without paying for
+    # worker processes.  Real runs fan out to processes so parsing and
+    # writing proceed in parallel.
+    executor_cls = ThreadPoolExecutor if args.dry_run else ProcessPoolExecutor
+
+    with executor_cls(max_workers=args.workers) as executor:
+        results = executor.map(worker, note_paths, chunksize=32)
+        for note_path, (result, error) in zip(note_paths, results, strict=True):
+            if error is not None:
+                print(f"  ERROR {note_path.name}: {error}", file=sys.stderr)
+                errors += 1
+                continue
+
+            if result is None:
+                skipped += 1
+                continue
+
+            updated += 1
+            sc = result.get("source_class", "?")
+            source_class_counts[sc] = source_class_counts.get(sc, 0) + 1
+
+            if args.dry_run:
+                print(f"  WOULD UPDATE {note_path.name}: {result}")
 
     mode = "DRY RUN" if args.dry_run else "DONE"
     print(f"\n{mode}: {updated} updated, {skipped} skipped, {errors} errors")
@@ -12,78 +12,181 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import functools
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # libyaml not compiled in
+    from yaml import SafeDumper as _Dumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
 _FM_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
 
+# Frontmatter sits at the top of the file; this prefix covers nearly all notes
+_HEAD_CHARS = 8192
 
-def verify_note(path: Path, who: str, date_str: str) -> bool:
-    """Set verified_by, verified_who, verified_date on a claim note.
+# Per-note report lines are written to stdout in chunks of this many
+_REPORT_CHUNK = 1024
 
-    Returns True if the note was modified, False if skipped.
+
+@functools.cache
+def _read_and_parse(path: str, mtime_ns: int, size: int) -> tuple[dict, int] | None:
+    """Parse the frontmatter of *path*. Returns (frontmatter, body offset) or None.
+
+    Only the first _HEAD_CHARS characters are read unless the frontmatter
+    block runs up to or past them. Keyed on mtime and size, so a --batch
+    run that filters a note and then verifies it parses the file once.
     """
-    content = path.read_text(encoding="utf-8")
-    match = _FM_PATTERN.match(content)
+    with open(path, encoding="utf-8") as f:
+        head = f.read(_HEAD_CHARS)
+        if not head.startswith("---"):
+            return None
+        match = _FM_PATTERN.match(head)
+        if len(head) == _HEAD_CHARS and (match is None or match.end() == len(head)):
+            head += f.read()
+            match = _FM_PATTERN.match(head)
     if not match:
-        return False
+        return None
 
-    fm_text = match.group(1)
     try:
-        fm = yaml.safe_load(fm_text)
+        fm = yaml.load(match.group(1), Loader=_Loader)
     except yaml.YAMLError:
-        return False
+        return None
 
     if not isinstance(fm, dict):
-        return False
+        return None
+    return fm, match.end()
 
-    # Update fields
-    fm["verified_by"] = "human"
-    fm["verified_who"] = who
-    fm["verified_date"] = date_str
 
-    # Rebuild the full content with updated frontmatter
-    body = content[match.end() :]
-    new_fm = yaml.dump(
-        fm, default_flow_style=False, sort_keys=False, allow_unicode=True
-    )
-    new_content = f"---\n{new_fm}---\n{body}"
+def _load_note(path: Path) -> tuple[dict, int] | None:
+    """(frontmatter, body offset) of *path*, or None if it has no YAML mapping.
 
-    path.write_text(new_content, encoding="utf-8")
-    return True
+    The offset counts characters of the decoded text. The frontmatter dict
+    is shared with the parse cache; copy it before editing.
+    """
+    st = path.stat()
+    return _read_and_parse(str(path), st.st_mtime_ns, st.st_size)
 
 
-def find_batch_claims(notes_dir: Path, filters: dict[str, str]) -> list[Path]:
-    """Find claims matching filter criteria."""
-    results: list[Path] = []
+def _dump(data: dict) -> str:
+    return yaml.dump(
+        data,
+        Dumper=_Dumper,
+        default_flow_style=False,
+        sort_keys=False,
+        allow_unicode=True,
+    )
 
-    for note_path in sorted(notes_dir.glob("*.md")):
-        try:
-            content = note_path.read_text(encoding="utf-8")
-        except OSError:
-            continue
 
-        match = _FM_PATTERN.match(content)
-        if not match:
-            continue
+def _patch_fm(fm_text: str, updates: dict[str, str]) -> str:
+    """Set the top-level keys in *updates* within the YAML text *fm_text*.
 
-        try:
-            fm = yaml.safe_load(match.group(1))
-        except yaml.YAMLError:
+    Every other line is kept verbatim. A replaced key's continuation lines
+    (indented, or a block sequence) are dropped, and keys not yet present
+    are appended. Returns the new text with a trailing newline.
+    """
+    lines: list[str] = []
+    seen: set[str] = set()
+    replacing = False
+    for line in fm_text.splitlines():
+        lead = line[:1]
+        if replacing and lead in (" ", "\t", "-"):
             continue
+        replacing = False
+        key = None
+        if lead not in ("", " ", "\t", "-", "#"):
+            key = line.split(":", 1)[0].strip().strip("'\"")
+        if key in updates:
+            lines.append(_dump({key: updates[key]}))
+            seen.add(key)
+            replacing = True
+        else:
+            lines.append(line + "\n")
+    lines.extend(_dump({k: v}) for k, v in updates.items() if k not in seen)
+    return "".join(lines)
 
-        if not isinstance(fm, dict):
-            continue
 
-        # Check all filters match
-        if all(fm.get(k) == v for k, v in filters.items()):
-            results.append(note_path)
+def verify_note(path: Path, who: str, date_str: str) -> bool:
+    """Set verified_by, verified_who, verified_date on a claim note.
 
-    return results
+    Only those keys' lines change; the rest of the frontmatter keeps its
+    formatting. Should the patched text not parse back to the expected
+    mapping, the whole block is re-dumped instead.
+
+    Returns True if the note was modified, False if skipped.
+    """
+    note = _load_note(path)
+    if note is None:
+        return False
+
+    updates = {"verified_by": "human", "verified_who": who, "verified_date": date_str}
+    fm = {**note[0], **updates}
+
+    with path.open(encoding="utf-8") as f:
+        old_text = f.read(note[1])
+    match = _FM_PATTERN.match(old_text)
+    new_fm = _patch_fm(match.group(1), updates) if match else ""
+    try:
+        patched_ok = yaml.load(new_fm, Loader=_Loader) == fm
+    except yaml.YAMLError:
+        patched_ok = False
+    if not patched_ok:
+        new_fm = _dump(fm)
+    header = f"---\n{new_fm}---\n".encode()
+
+    # A header of unchanged byte length is overwritten in place, leaving the
+    # body untouched on disk. Otherwise the whole file is rewritten.
+    old_header = old_text.encode()
+    if len(header) == len(old_header):
+        with path.open("r+b") as f:
+            # Equal only if newline translation did not alter the header
+            if f.read(len(old_header)) == old_header:
+                if header != old_header:
+                    f.seek(0)
+                    f.write(header)
+                return True
+
+    body = path.read_text(encoding="utf-8")[note[1] :]
+    path.write_text(header.decode() + body, encoding="utf-8")
+    return True
+
+
+def _matches(note_path: Path, filters: dict[str, str]) -> bool:
+    """True if *note_path* has frontmatter matching every filter."""
+    try:
+        note = _load_note(note_path)
+    except OSError:
+        return False
+    if note is None:
+        return False
+
+    # Check all filters match
+    fm = note[0]
+    return all(fm.get(k) == v for k, v in filters.items())
+
+
+def find_batch_claims(
+    notes_dir: Path, filters: dict[str, str], *, workers: int | None = None
+) -> list[Path]:
+    """Find claims matching filter criteria.
+
+    Notes are scanned on a thread pool of *workers* (default: the executor's
+    own default). Threads rather than processes, so the parses land in this
+    process's cache for verify_note to reuse.
+    """
+    note_paths = sorted(notes_dir.glob("*.md"))
+    scan = functools.partial(_matches, filters=filters)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        hits = list(executor.map(scan, note_paths))
+    return [p for p, hit in zip(note_paths, hits, strict=True) if hit]
 
 
 def main() -> None:
@@ -109,6 +212,12 @@ def main() -> None:
         default=Path(__file__).resolve().parents[2] / "notes",
         help="Path to notes directory",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker count for the --batch scan (default: executor default)",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -130,7 +239,7 @@ def main() -> None:
         for pair in args.batch.split(","):
             k, v = pair.strip().split("=", 1)
             filters[k.strip()] = v.strip()
-        targets = find_batch_claims(args.notes_dir, filters)
+        targets = find_batch_claims(args.notes_dir, filters, workers=args.workers)
         print(f"Batch filter matched {len(targets)} claims")
     elif args.files:
         targets = [Path(f) for f in args.files if Path(f).exists()]
@@ -143,17 +252,20 @@ def main() -> None:
         sys.exit(0)
 
     verified = 0
+    report: list[str] = []
     for path in targets:
         if args.dry_run:
-            print(f"  WOULD VERIFY: {path.name}")
+            report.append(f"  WOULD VERIFY: {path.name}\n")
             verified += 1
-            continue
-
-        if verify_note(path, args.who, args.date):
-            print(f"  VERIFIED: {path.name}")
+        elif verify_note(path, args.who, args.date):
+            report.append(f"  VERIFIED: {path.name}\n")
             verified += 1
         else:
-            print(f"  SKIPPED (no frontmatter): {path.name}")
+            report.append(f"  SKIPPED (no frontmatter): {path.name}\n")
+        if len(report) >= _REPORT_CHUNK:
+            sys.stdout.writelines(report)
+            report.clear()
+    sys.stdout.writelines(report)
 
     mode = "DRY RUN" if args.dry_run else "DONE"
     print(f"\n{mode}: {verified} claims verified by {args.who} on {args.date}")
@@ -1,42 +1,53 @@
-"""EngramR: Co-scientist system for Obsidian-based hypothesis research."""
+"""EngramR: Co-scientist system for Obsidian-based hypothesis research.
+
+The plotting API below is re-exported lazily (PEP 562): importing engram_r,
+as every hook and daemon helper does, does not load matplotlib, pandas, or
+scipy until one of these names is first used.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
 
 __version__ = "0.7.0"
 
-from engram_r.plot_builders import (
-    build_bar,
-    build_box,
-    build_forest,
-    build_heatmap,
-    build_roc,
-    build_scatter,
-    build_violin,
-    build_volcano,
-)
-from engram_r.plot_stats import (
-    CorrelationResult,
-    StatResult,
-    format_correlation,
-    format_pval,
-    pval_stars,
-    run_correlation,
-    run_test,
-    save_pvalues,
-    select_test,
-)
-from engram_r.plot_theme import (
-    BINARY_COLORS,
-    DIRECTION_COLORS,
-    DIVERGING_PALETTE,
-    FIGURE_SIZES,
-    LAB_PALETTES,
-    SEMANTIC_PALETTES,
-    SEQUENTIAL_PALETTE,
-    SIG_COLORS,
-    apply_research_theme,
-    get_figure_size,
-    get_lab_palette,
-    save_figure,
-)
+if TYPE_CHECKING:
+    from engram_r.plot_builders import (
+        build_bar,
+        build_box,
+        build_forest,
+        build_heatmap,
+        build_roc,
+        build_scatter,
+        build_violin,
+        build_volcano,
+    )
+    from engram_r.plot_stats import (
+        CorrelationResult,
+        StatResult,
+        format_correlation,
+        format_pval,
+        pval_stars,
+        run_correlation,
+        run_test,
+        save_pvalues,
+        select_test,
+    )
+    from engram_r.plot_theme import (
+        BINARY_COLORS,
+        DIRECTION_COLORS,
+        DIVERGING_PALETTE,
+        FIGURE_SIZES,
+        LAB_PALETTES,
+        SEMANTIC_PALETTES,
+        SEQUENTIAL_PALETTE,
+        SIG_COLORS,
+        apply_research_theme,
+        get_figure_size,
+        get_lab_palette,
+        save_figure,
+    )
 
 __all__ = [
     # plot_builders
@@ -72,3 +83,49 @@ __all__ = [
     "get_lab_palette",
     "save_figure",
 ]
+
+# Exported name -> engram_r submodule that defines it
+_LAZY = {
+    "build_bar": "plot_builders",
+    "build_box": "plot_builders",
+    "build_forest": "plot_builders",
+    "build_heatmap": "plot_builders",
+    "build_roc": "plot_builders",
+    "build_scatter": "plot_builders",
+    "build_violin": "plot_builders",
+    "build_volcano": "plot_builders",
+    "CorrelationResult": "plot_stats",
+    "StatResult": "plot_stats",
+    "format_correlation": "plot_stats",
+    "format_pval": "plot_stats",
+    "pval_stars": "plot_stats",
+    "run_correlation": "plot_stats",
+    "run_test": "plot_stats",
+    "save_pvalues": "plot_stats",
+    "select_test": "plot_stats",
+    "BINARY_COLORS": "plot_theme",
+    "DIRECTION_COLORS": "plot_theme",
+    "DIVERGING_PALETTE": "plot_theme",
+    "FIGURE_SIZES": "plot_theme",
+    "LAB_PALETTES": "plot_theme",
+    "SEMANTIC_PALETTES": "plot_theme",
+    "SEQUENTIAL_PALETTE": "plot_theme",
+    "SIG_COLORS": "plot_theme",
+    "apply_research_theme": "plot_theme",
+    "get_figure_size": "plot_theme",
+    "get_lab_palette": "plot_theme",
+    "save_figure": "plot_theme",
+}
+
+
+def __getattr__(name: str) -> object:
+    submodule = _LAZY.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -1,8 +1,14 @@
 """Skill-level failure tracking with exponential backoff for the daemon.
 
-Reads and writes ``ops/daemon/skill-backoff.json``. Pure Python, no
-external dependencies. The daemon shell layer calls these functions to
-decide whether a skill should be retried or is still cooling down.
+Reads and writes ``ops/daemon/skill-backoff.json`` through _fastjson
+(orjson when installed, else the stdlib json module). The daemon shell
+layer calls these functions to decide whether a skill should be retried
+or is still cooling down.
+
+The parsed state is cached on the file's mtime and size, so repeated
+checks within one process read the file once until it changes. Writes
+are not deferred: the shell layer calls each function from its own short
+process, and the next call must see the previous one's update.
 
 Escalation schedule:
     - 3 consecutive failures  -> 30 min backoff
@@ -13,35 +19,66 @@ Escalation schedule:
 
 from __future__ import annotations
 
-import json
+import copy
+import functools
 import logging
+import os
+import stat
 import time
 from pathlib import Path
 
+from engram_r import _fastjson
+
 logger = logging.getLogger(__name__)
 
+# fdatasync skips the metadata flush fsync does; macOS only has fsync
+_datasync = getattr(os, "fdatasync", os.fsync)
+
 
 def read_backoff(path: Path) -> dict:
-    """Read the backoff state file. Returns {} if missing or corrupt."""
-    if not path.is_file():
+    """Read the backoff state file. Returns {} if missing or corrupt.
+
+    Callers get their own copy of the cached parse.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return {}
+    if not stat.S_ISREG(st.st_mode):
         return {}
+    return copy.deepcopy(_load_state(str(path), st.st_mtime_ns, st.st_size))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_state(path: str, mtime_ns: int, size: int) -> dict:
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        with open(path, "rb") as f:
+            data = _fastjson.loads(f.read())
         return data if isinstance(data, dict) else {}
-    except (json.JSONDecodeError, OSError):
+    except (ValueError, OSError):  # JSONDecodeError, or bytes that are not UTF-8
         logger.warning("Corrupt backoff file at %s, resetting", path)
         return {}
 
 
 def _write_backoff(state: dict, path: Path) -> None:
-    """Write backoff state atomically."""
+    """Write backoff state atomically.
+
+    The temp file's data is flushed to disk before the rename, so a crash
+    leaves either the old state or the new one, never a truncated file.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(".tmp")
+    payload = _fastjson.dumps(state, indent=True)
     try:
-        tmp.write_text(
-            json.dumps(state, indent=2, ensure_ascii=False), encoding="utf-8"
-        )
-        tmp.replace(path)
+        fd = os.open(str(tmp), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view) :]
+            _datasync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
     except OSError:
         logger.warning("Failed to write backoff state to %s", path, exc_info=True)
 
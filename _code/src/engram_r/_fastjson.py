@@ -0,0 +1,41 @@
+"""JSON encode/decode with an optional orjson fast path.
+
+orjson is a compiled encoder several times faster than the stdlib ``json``
+module. It is optional (``pip install engram-r[fast]``); without it these
+helpers fall back to ``json`` with byte-identical output for the data the
+vault stores (string keys, no NaN).
+
+Both variants keep non-ASCII text as UTF-8 rather than ``\\u`` escapes, and
+orjson's decode error subclasses ``json.JSONDecodeError``, so callers can
+keep catching the stdlib exception.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize *obj* to UTF-8 JSON bytes.
+
+    Compact (``{"a":1}``) by default; with *indent*, two-space indentation
+    matching ``json.dumps(obj, indent=2)``.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
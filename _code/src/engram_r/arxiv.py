@@ -1,22 +1,60 @@
 """arXiv search via Atom API.
 
-Uses urllib only. Reference: https://info.arxiv.org/help/api/index.html
+Uses the standard library only; requests reuse a keep-alive connection per
+thread, and search_many() overlaps several queries on a thread pool.
+Responses are cached on disk for a day (see _fetch). Reference:
+https://info.arxiv.org/help/api/index.html
 """
 
 from __future__ import annotations
 
+import hashlib
+import http.client
+import io
 import logging
+import os
+import tempfile
+import threading
+import time
+import urllib.error
 import urllib.parse
 import urllib.request
 import xml.etree.ElementTree as ET
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 
+from engram_r.hook_utils import cache_dir
+
+try:
+    from lxml import etree as _lxml
+except ImportError:  # optional: pip install engram-r[fast]
+    _lxml = None
+
 logger = logging.getLogger(__name__)
 
 ARXIV_API_BASE = "http://export.arxiv.org/api/query"
 
-# Atom namespace
-_NS = {"atom": "http://www.w3.org/2005/Atom"}
+# Fully qualified Atom tags, so lookups skip ElementTree's prefix mapping
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_ENTRY_TAG = _ATOM + "entry"
+_ID_TAG = _ATOM + "id"
+_TITLE_TAG = _ATOM + "title"
+_AUTHOR_TAG = _ATOM + "author"
+_NAME_TAG = _ATOM + "name"
+_SUMMARY_TAG = _ATOM + "summary"
+_PUBLISHED_TAG = _ATOM + "published"
+_UPDATED_TAG = _ATOM + "updated"
+_CATEGORY_TAG = _ATOM + "category"
+_LINK_TAG = _ATOM + "link"
+_DOI_TAG = "{http://arxiv.org/schemas/atom}doi"
+
+# Seconds a cached API response is reused; arXiv listings change daily
+_CACHE_TTL_SECONDS = 24 * 3600
+
+# Per-thread keep-alive connection (search_many runs several threads), so a
+# repeat search skips the TCP handshake. Attributes: conn, key.
+_connections = threading.local()
 
 
 @dataclass
@@ -39,6 +77,8 @@ def search_arxiv(
     max_results: int = 10,
     sort_by: str = "relevance",
     sort_order: str = "descending",
+    *,
+    no_cache: bool = False,
 ) -> list[ArxivArticle]:
     """Search arXiv and return parsed articles.
 
@@ -47,6 +87,7 @@ def search_arxiv(
         max_results: Maximum number of results.
         sort_by: Sort criterion ('relevance', 'lastUpdatedDate', 'submittedDate').
         sort_order: 'ascending' or 'descending'.
+        no_cache: Always query the API, ignoring any cached response.
 
     Returns:
         List of ArxivArticle objects.
@@ -61,74 +102,204 @@ def search_arxiv(
     url = f"{ARXIV_API_BASE}?{urllib.parse.urlencode(params)}"
     logger.info("arXiv search: %s", query)
 
-    req = urllib.request.Request(url)
-    with urllib.request.urlopen(req, timeout=30) as resp:
+    data = _fetch(url, no_cache=no_cache)
+    return [_parse_entry(entry) for entry in _iter_entries(data)]
+
+
+def _iter_entries(data: bytes) -> Iterator[ET.Element]:
+    """Yield the Atom entries of a feed as they are parsed.
+
+    Streams with lxml's iterparse when lxml is installed, else the stdlib's.
+    Each entry is cleared once the consumer moves on, so the feed is never
+    held whole.
+    """
+    if _lxml is not None:
+        events = _lxml.iterparse(
+            io.BytesIO(data),
+            tag=_ENTRY_TAG,
+            resolve_entities=False,
+            no_network=True,
+        )
+    else:
+        events = (
+            (event, elem)
+            for event, elem in ET.iterparse(io.BytesIO(data))
+            if elem.tag == _ENTRY_TAG
+        )
+    for _, entry in events:
+        yield entry
+        entry.clear()
+
+
+def _fetch(url: str, *, no_cache: bool = False) -> bytes:
+    """GET *url*, reusing a response cached under cache_dir()/arxiv.
+
+    Cache files are named by a hash of the full request URL and trusted for
+    _CACHE_TTL_SECONDS. Failing to read or write the cache never fails the
+    search.
+    """
+    digest = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+    path = cache_dir() / "arxiv" / f"{digest}.xml"
+    if not no_cache:
+        try:
+            if time.time() - path.stat().st_mtime < _CACHE_TTL_SECONDS:
+                return path.read_bytes()
+        except OSError:
+            pass
+
+    data = _http_get(url)
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except OSError as exc:
+        logger.debug("arXiv cache write failed: %s", exc)
+    return data
+
+
+def _http_get(url: str) -> bytes:
+    """GET *url* over this thread's persistent connection to its host.
+
+    Raises urllib.error.HTTPError for a non-200 status, as urlopen would.
+    Redirects are handed to urlopen to follow.
+    """
+    parts = urllib.parse.urlsplit(url)
+    key = (parts.scheme, parts.netloc)
+    conn = getattr(_connections, "conn", None)
+    if conn is None or _connections.key != key:
+        if conn is not None:
+            conn.close()
+        if parts.scheme == "https":
+            conn = http.client.HTTPSConnection(parts.netloc, timeout=30)
+        else:
+            conn = http.client.HTTPConnection(parts.netloc, timeout=30)
+        _connections.conn, _connections.key = conn, key
+
+    path = parts.path or "/"
+    target = f"{path}?{parts.query}" if parts.query else path
+    try:
+        try:
+            conn.request("GET", target)
+            resp = conn.getresponse()
+        except ConnectionError:
+            # The server dropped the idle connection; retry once on a new one
+            conn.close()
+            conn.request("GET", target)
+            resp = conn.getresponse()
         data = resp.read()
+    except BaseException:
+        # A request cut short (a timeout, say) leaves the connection mid-
+        # exchange, and every later request on it would fail; start over.
+        conn.close()
+        _connections.conn = None
+        raise
 
-    root = ET.fromstring(data)
-    articles = []
+    if 300 <= resp.status < 400:
+        with urllib.request.urlopen(url, timeout=30) as redirected:
+            return redirected.read()
+    if resp.status != 200:
+        raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.msg, None)
+    return data
 
-    for entry in root.findall("atom:entry", _NS):
-        articles.append(_parse_entry(entry))
 
-    return articles
+def search_many(
+    queries: Sequence[str],
+    max_results: int = 10,
+    sort_by: str = "relevance",
+    sort_order: str = "descending",
+    *,
+    concurrency: int = 3,
+    no_cache: bool = False,
+) -> list[list[ArxivArticle]]:
+    """Run several arXiv searches with their network waits overlapped.
+
+    Each query goes through search_arxiv() on a pool of *concurrency*
+    threads, so N queries take about one round trip per *concurrency*
+    queries instead of N. arXiv asks API clients to keep their request
+    rate low; keep *concurrency* small.
+
+    Args:
+        queries: arXiv search queries, as for search_arxiv().
+        max_results: Maximum number of results per query.
+        sort_by: Sort criterion ('relevance', 'lastUpdatedDate', 'submittedDate').
+        sort_order: 'ascending' or 'descending'.
+        concurrency: Maximum number of requests in flight.
+        no_cache: Always query the API, ignoring any cached response.
+
+    Returns:
+        One list of ArxivArticle objects per query, in query order.
+    """
+    if not queries:
+        return []
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(queries))) as pool:
+        return list(
+            pool.map(
+                lambda q: search_arxiv(
+                    q, max_results, sort_by, sort_order, no_cache=no_cache
+                ),
+                queries,
+            )
+        )
 
 
 def _parse_entry(entry: ET.Element) -> ArxivArticle:
     """Parse an Atom entry element into an ArxivArticle."""
     # ID
-    id_elem = entry.find("atom:id", _NS)
+    id_elem = entry.find(_ID_TAG)
     raw_id = id_elem.text.strip() if id_elem is not None and id_elem.text else ""
     # Extract just the arXiv ID from the URL
     arxiv_id = raw_id.replace("http://arxiv.org/abs/", "")
 
     # Title
-    title_elem = entry.find("atom:title", _NS)
+    title_elem = entry.find(_TITLE_TAG)
     title = ""
     if title_elem is not None and title_elem.text:
         title = " ".join(title_elem.text.split())  # normalize whitespace
 
     # Authors
     authors = []
-    for author_elem in entry.findall("atom:author", _NS):
-        name_elem = author_elem.find("atom:name", _NS)
+    for author_elem in entry.findall(_AUTHOR_TAG):
+        name_elem = author_elem.find(_NAME_TAG)
         if name_elem is not None and name_elem.text:
             authors.append(name_elem.text.strip())
 
     # Abstract
-    summary_elem = entry.find("atom:summary", _NS)
+    summary_elem = entry.find(_SUMMARY_TAG)
     abstract = ""
     if summary_elem is not None and summary_elem.text:
         abstract = " ".join(summary_elem.text.split())
 
     # Dates
-    published_elem = entry.find("atom:published", _NS)
+    published_elem = entry.find(_PUBLISHED_TAG)
     published = ""
     if published_elem is not None and published_elem.text:
         published = published_elem.text.strip()[:10]  # YYYY-MM-DD
 
-    updated_elem = entry.find("atom:updated", _NS)
+    updated_elem = entry.find(_UPDATED_TAG)
     updated = ""
     if updated_elem is not None and updated_elem.text:
         updated = updated_elem.text.strip()[:10]
 
     # Categories
     categories = []
-    for cat_elem in entry.findall("atom:category", _NS):
+    for cat_elem in entry.findall(_CATEGORY_TAG):
         term = cat_elem.get("term", "")
         if term:
             categories.append(term)
 
     # PDF link
     pdf_url = ""
-    for link_elem in entry.findall("atom:link", _NS):
+    for link_elem in entry.findall(_LINK_TAG):
         if link_elem.get("title") == "pdf":
             pdf_url = link_elem.get("href", "")
             break
 
     # DOI
     doi = ""
-    doi_elem = entry.find("{http://arxiv.org/schemas/atom}doi")
+    doi_elem = entry.find(_DOI_TAG)
     if doi_elem is not None and doi_elem.text:
         doi = doi_elem.text.strip()
 
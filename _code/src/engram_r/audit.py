@@ -2,23 +2,33 @@
 
 Records each decision cycle as a JSONL entry -- what was evaluated,
 which rules triggered, what was selected (or skipped), and why.
-Queryable with ``jq``. No external dependencies beyond stdlib.
+append_audit_entry() and append_outcome() write one record each;
+AuditWriter batches many into one write.
+Queryable with ``jq``. Lines are encoded through _fastjson (orjson when
+installed, else the stdlib json module).
 """
 
 from __future__ import annotations
 
-import contextlib
-import json
+import fcntl
 import logging
 import os
-import tempfile
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from engram_r import _fastjson
+
 logger = logging.getLogger(__name__)
 
+# Largest entry written without a lock: PIPE_BUF on Linux, and the size up
+# to which an O_APPEND write is never split in practice.
+_ATOMIC_APPEND = 4096
+
+# Most buffers handed to one writev call (IOV_MAX on Linux and macOS)
+_IOV_MAX = 1024
+
 
-@dataclass
+@dataclass(slots=True)
 class RuleEvaluation:
     """Result of evaluating one cascade check."""
 
@@ -28,8 +38,18 @@ class RuleEvaluation:
     candidate_skill: str = ""
     candidate_key: str = ""
 
+    def to_dict(self) -> dict:
+        """Serialize to a plain dict suitable for JSON."""
+        return {
+            "check_name": self.check_name,
+            "triggered": self.triggered,
+            "skip_reason": self.skip_reason,
+            "candidate_skill": self.candidate_skill,
+            "candidate_key": self.candidate_key,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class AuditEntry:
     """One daemon decision cycle."""
 
@@ -44,12 +64,25 @@ class AuditEntry:
     error: str = ""
 
     def to_dict(self) -> dict:
-        """Serialize to a plain dict suitable for JSON."""
-        d = asdict(self)
-        return d
-
-
-@dataclass
+        """Serialize to a plain dict suitable for JSON.
+
+        Spelled out rather than dataclasses.asdict(), which deep-copies
+        every field on each call. Containers are copied one level deep.
+        """
+        return {
+            "timestamp": self.timestamp,
+            "type": self.type,
+            "selected_task": self.selected_task,
+            "selected_skill": self.selected_skill,
+            "selected_tier": self.selected_tier,
+            "metabolic_suppressed": self.metabolic_suppressed,
+            "vault_summary": dict(self.vault_summary),
+            "rules_evaluated": [r.to_dict() for r in self.rules_evaluated],
+            "error": self.error,
+        }
+
+
+@dataclass(slots=True)
 class AuditOutcome:
     """Post-execution outcome record for a daemon task.
 
@@ -69,44 +102,113 @@ class AuditOutcome:
     type: str = "outcome"
 
     def to_dict(self) -> dict:
-        """Serialize to a plain dict suitable for JSON."""
-        return asdict(self)
+        """Serialize to a plain dict suitable for JSON (see AuditEntry)."""
+        return {
+            "timestamp": self.timestamp,
+            "task_key": self.task_key,
+            "skill": self.skill,
+            "outcome": self.outcome,
+            "duration_seconds": self.duration_seconds,
+            "vault_summary_before": dict(self.vault_summary_before),
+            "vault_summary_after": dict(self.vault_summary_after),
+            "changed_keys": list(self.changed_keys),
+            "type": self.type,
+        }
+
+
+def _encode(record: AuditEntry | AuditOutcome) -> bytes:
+    """One JSONL line for *record*, newline included."""
+    return _fastjson.dumps(record.to_dict()) + b"\n"
+
+
+def _append_buffers(bufs: list[bytes], log_path: Path) -> None:
+    """Append *bufs* to *log_path* with one vectored O_APPEND write.
+
+    An O_APPEND write lands whole at the end of the file, so concurrent
+    writers never interleave within it. Writes larger than _ATOMIC_APPEND
+    also hold an exclusive flock, in case the kernel splits them. Creates
+    parent directories as needed; raises OSError on failure.
+    """
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    if len(bufs) > _IOV_MAX or not hasattr(os, "writev"):
+        bufs = [b"".join(bufs)]
+    total = sum(map(len, bufs))
+    fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        if total > _ATOMIC_APPEND:
+            fcntl.flock(fd, fcntl.LOCK_EX)  # released by close
+        written = os.writev(fd, bufs) if len(bufs) > 1 else os.write(fd, bufs[0])
+        if written < total:
+            view = memoryview(b"".join(bufs))[written:]
+            while view:
+                view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+class AuditWriter:
+    """Buffer audit records and append them to a JSONL log in batches.
+
+    Records are encoded on append() and written together, in one vectored
+    O_APPEND write, once *max_batch* records or *max_bytes* bytes are
+    pending, or on flush(). Use it as a context manager or call close(),
+    so the last partial batch is written too.
+    """
+
+    def __init__(
+        self, path: Path, max_batch: int = 64, max_bytes: int = 64 * 1024
+    ) -> None:
+        self.path = path
+        self.max_batch = max_batch
+        self.max_bytes = max_bytes
+        self._pending: list[bytes] = []
+        self._pending_bytes = 0
+
+    def append(self, record: AuditEntry | AuditOutcome) -> None:
+        """Queue *record*, writing the batch if it is now full."""
+        buf = _encode(record)
+        self._pending.append(buf)
+        self._pending_bytes += len(buf)
+        if (
+            len(self._pending) >= self.max_batch
+            or self._pending_bytes >= self.max_bytes
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all pending records. On OSError they stay pending."""
+        if not self._pending:
+            return
+        _append_buffers(self._pending, self.path)
+        self._pending.clear()
+        self._pending_bytes = 0
+
+    def close(self) -> None:
+        """Write any pending records."""
+        self.flush()
+
+    def __enter__(self) -> AuditWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
 
 def append_audit_entry(entry: AuditEntry, log_path: Path) -> None:
     """Atomically append an audit entry to a JSONL file.
 
-    Creates parent directories if they do not exist. Uses write-to-temp
-    + append to minimize data loss on crash.
+    Creates parent directories if they do not exist. The entry goes out in
+    a single O_APPEND write, so a crash leaves no partial line behind in
+    practice and no temp files at all.
 
     Args:
         entry: The audit entry to write.
         log_path: Path to the JSONL file (e.g. ops/daemon/logs/audit.jsonl).
     """
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    line = json.dumps(entry.to_dict(), ensure_ascii=False, separators=(",", ":"))
-
-    # Write to temp file first, then append -- reduces risk of partial writes
-    fd, tmp = tempfile.mkstemp(
-        dir=str(log_path.parent), prefix=".audit-", suffix=".tmp"
-    )
     try:
-        os.write(fd, (line + "\n").encode("utf-8"))
-        os.close(fd)
-        fd = -1  # mark as closed
-        # Append temp content to the log file
-        with (
-            open(log_path, "a", encoding="utf-8") as f,
-            open(tmp, encoding="utf-8") as t,
-        ):
-            f.write(t.read())
+        _append_buffers([_encode(entry)], log_path)
     except OSError:
         logger.warning("Failed to write audit entry to %s", log_path, exc_info=True)
-    finally:
-        if fd >= 0:
-            os.close(fd)
-        with contextlib.suppress(OSError):
-            os.unlink(tmp)
 
 
 def append_outcome(outcome: AuditOutcome, log_path: Path) -> None:
@@ -118,25 +220,7 @@ def append_outcome(outcome: AuditOutcome, log_path: Path) -> None:
         outcome: The outcome record to write.
         log_path: Path to the JSONL file (e.g. ops/daemon/logs/audit.jsonl).
     """
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    line = json.dumps(outcome.to_dict(), ensure_ascii=False, separators=(",", ":"))
-
-    fd, tmp = tempfile.mkstemp(
-        dir=str(log_path.parent), prefix=".audit-", suffix=".tmp"
-    )
     try:
-        os.write(fd, (line + "\n").encode("utf-8"))
-        os.close(fd)
-        fd = -1
-        with (
-            open(log_path, "a", encoding="utf-8") as f,
-            open(tmp, encoding="utf-8") as t,
-        ):
-            f.write(t.read())
+        _append_buffers([_encode(outcome)], log_path)
     except OSError:
         logger.warning("Failed to write outcome entry to %s", log_path, exc_info=True)
-    finally:
-        if fd >= 0:
-            os.close(fd)
-        with contextlib.suppress(OSError):
-            os.unlink(tmp)
@@ -22,7 +22,9 @@ Wiki-links are converted to plain text on export and NOT restored on import.
 from __future__ import annotations
 
 import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
@@ -30,6 +32,13 @@ from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # libyaml not compiled in
+    from yaml import SafeDumper as _Dumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
 from engram_r.note_builder import build_claim_note
 from engram_r.schema_validator import validate_note
 
@@ -38,15 +47,17 @@ logger = logging.getLogger(__name__)
 # Pattern to match YAML frontmatter
 _FM_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
 
-# Pattern to match wiki-links: [[target]] or [[target|display]]
-_WIKI_LINK = re.compile(r"\[\[([^\]|]+)(?:\|([^\]]+))?\]\]")
+# Pattern to match wiki-links: [[target|display]] captures display as group 1,
+# [[target]] captures target as group 2.  Exactly one group takes part in a
+# match, so the template r"\1\2" yields the link text without a callback.
+_WIKI_LINK = re.compile(r"\[\[(?:[^\]|]+\|([^\]]+)|([^\]|]+))\]\]")
 
 
 class ClaimExchangeError(Exception):
     """Raised for claim export/import failures."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExportedClaim:
     """Portable representation of a vault claim."""
 
@@ -67,14 +78,7 @@ class ExportedClaim:
 
 def _strip_wiki_links(text: str) -> str:
     """Convert [[target|display]] to display, [[target]] to target."""
-
-    def _replace(m: re.Match) -> str:
-        display = m.group(2)
-        if display:
-            return display
-        return m.group(1)
-
-    return _WIKI_LINK.sub(_replace, text)
+    return _WIKI_LINK.sub(r"\1\2", text)
 
 
 def _parse_note(content: str) -> tuple[dict[str, Any], str]:
@@ -85,7 +89,7 @@ def _parse_note(content: str) -> tuple[dict[str, Any], str]:
     fm_text = match.group(1)
     body = content[match.end() :]
     try:
-        fm = yaml.safe_load(fm_text)
+        fm = yaml.load(fm_text, Loader=_Loader)
     except yaml.YAMLError as exc:
         raise ClaimExchangeError(f"Invalid YAML: {exc}") from exc
     if not isinstance(fm, dict):
@@ -119,9 +123,27 @@ def export_claim(
     Returns:
         ExportedClaim with wiki-links stripped from body and source.
     """
-    ts = now or datetime.now(UTC)
     fm, body = _parse_note(content)
+    return _build_export(
+        fm,
+        body,
+        title=title,
+        source_vault=source_vault,
+        ts=now or datetime.now(UTC),
+        sanitize_pii=sanitize_pii,
+    )
+
 
+def _build_export(
+    fm: dict[str, Any],
+    body: str,
+    *,
+    title: str,
+    source_vault: str,
+    ts: datetime,
+    sanitize_pii: bool,
+) -> ExportedClaim:
+    """Build the ExportedClaim for a parsed note (see export_claim)."""
     description = fm.get("description", "")
     body_text = _strip_wiki_links(body).strip()
     verified_who = fm.get("verified_who", "") or ""
@@ -152,6 +174,14 @@ def export_claim(
     )
 
 
+def _read_note(path: Path) -> str | None:
+    """Text of *path*, or None if it cannot be read."""
+    try:
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
 def export_claims(
     vault_path: Path,
     *,
@@ -186,40 +216,50 @@ def export_claims(
     ts = now or datetime.now(UTC)
     results: list[ExportedClaim] = []
 
-    for note_file in sorted(notes_path.glob("*.md")):
-        try:
-            content = note_file.read_text(encoding="utf-8")
-            fm, _ = _parse_note(content)
-        except (ClaimExchangeError, OSError):
-            continue
-
-        # Apply filters
-        if filter_type and fm.get("type", "claim") != filter_type:
-            continue
-        if filter_confidence and fm.get("confidence") != filter_confidence:
-            continue
-        if filter_tags:
-            note_tags = set(fm.get("tags", []))
-            if not all(t in note_tags for t in filter_tags):
+    # Reads overlap on a thread pool; parsing and filtering stay in this
+    # thread, in sorted order, as each read completes.
+    note_files = sorted(notes_path.glob("*.md"))
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        contents = pool.map(_read_note, note_files)
+        for note_file, content in zip(note_files, contents, strict=True):
+            if content is None:
+                continue
+            try:
+                fm, body = _parse_note(content)
+            except ClaimExchangeError:
                 continue
 
-        if filter_quarantined and fm.get("quarantine"):
-            logger.debug("federation.export_skip_quarantined title=%r", note_file.stem)
-            continue
+            # Apply filters
+            if filter_type and fm.get("type", "claim") != filter_type:
+                continue
+            if filter_confidence and fm.get("confidence") != filter_confidence:
+                continue
+            if filter_tags:
+                note_tags = set(fm.get("tags", []))
+                if not all(t in note_tags for t in filter_tags):
+                    continue
+
+            if filter_quarantined and fm.get("quarantine"):
+                logger.debug(
+                    "federation.export_skip_quarantined title=%r", note_file.stem
+                )
+                continue
 
-        claim = export_claim(
-            content,
-            title=note_file.stem,
-            source_vault=source_vault,
-            now=ts,
-            sanitize_pii=sanitize_pii,
-        )
-        logger.debug(
-            "federation.export_claim title=%r source_vault=%r",
-            claim.title,
-            source_vault,
-        )
-        results.append(claim)
+            claim = _build_export(
+                fm,
+                body,
+                title=note_file.stem,
+                source_vault=source_vault,
+                ts=ts,
+                sanitize_pii=sanitize_pii,
+            )
+            logger.debug(
+                "federation.export_claim title=%r source_vault=%r",
+                claim.title,
+                source_vault,
+            )
+            results.append(claim)
 
     logger.info(
         "federation.export_claims source_vault=%r count=%d",
@@ -239,7 +279,7 @@ def export_to_yaml(claims: list[ExportedClaim]) -> str:
         YAML string with all claims.
     """
     data = [asdict(c) for c in claims]
-    return yaml.dump(data, default_flow_style=False, sort_keys=False)
+    return yaml.dump(data, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
 
 
 def load_exported_claims(yaml_content: str) -> list[ExportedClaim]:
@@ -255,7 +295,7 @@ def load_exported_claims(yaml_content: str) -> list[ExportedClaim]:
         ClaimExchangeError: If YAML is invalid or claims are malformed.
     """
     try:
-        data = yaml.safe_load(yaml_content)
+        data = yaml.load(yaml_content, Loader=_Loader)
     except yaml.YAMLError as exc:
         raise ClaimExchangeError(f"Invalid YAML: {exc}") from exc
 
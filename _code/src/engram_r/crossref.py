@@ -23,7 +23,7 @@ logger = logging.getLogger(__name__)
 CROSSREF_API_BASE = "https://api.crossref.org/works"
 
 
-@dataclass
+@dataclass(slots=True)
 class CrossRefMetadata:
     """Metadata fetched from CrossRef for a single DOI."""
 
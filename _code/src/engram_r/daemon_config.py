@@ -1,19 +1,23 @@
 """Configuration loader for the Research Loop Daemon.
 
 Reads ops/daemon-config.yaml and provides typed access to all settings.
-Pure Python -- no I/O beyond initial file read.
+Pure Python -- no I/O beyond initial file read. The built config is cached
+on the file's mtime and size, and the YAML parse is shared with
+hook_utils.load_config(), which persists it between processes.
 """
 
 from __future__ import annotations
 
+import copy
+import functools
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
+from engram_r import hook_utils
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CooldownConfig:
     """Cooldown durations in minutes after each model tier."""
 
@@ -32,7 +36,7 @@ class CooldownConfig:
         return mapping.get(model, self.after_sonnet)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BatchConfig:
     """Batch size settings for daemon tasks."""
 
@@ -43,7 +47,7 @@ class BatchConfig:
     mine_sessions_batch: int = 30
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ThresholdConfig:
     """Thresholds that trigger maintenance or research actions."""
 
@@ -56,7 +60,7 @@ class ThresholdConfig:
     unmined_sessions: int = 2
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RetryConfig:
     """Retry settings for failed tasks."""
 
@@ -65,14 +69,14 @@ class RetryConfig:
     max_backoff_seconds: int = 900
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimeoutConfig:
     """Global daemon timeout."""
 
     global_hours: int = 0  # 0 = no timeout
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelConfig:
     """Model assignments for each skill type."""
 
@@ -111,7 +115,7 @@ class ModelConfig:
         return mapping.get(skill, "sonnet")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MetabolicConfig:
     """Metabolic feedback thresholds for daemon self-regulation.
 
@@ -139,7 +143,7 @@ class MetabolicConfig:
     history_max_snapshots: int = 90  # Max historical snapshots to retain
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HealthConfig:
     """Health gate settings for /health integration."""
 
@@ -148,7 +152,7 @@ class HealthConfig:
     model: str = "sonnet"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NotificationChannels:
     """Channel routing for Slack notifications."""
 
@@ -168,7 +172,7 @@ class NotificationChannels:
         return self.default
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NotificationEvents:
     """Toggle individual notification event types."""
 
@@ -182,7 +186,7 @@ class NotificationEvents:
     meta_review: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InboundConfig:
     """Configuration for inbound Slack message polling."""
 
@@ -191,7 +195,7 @@ class InboundConfig:
     channel: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NotificationConfig:
     """Top-level notification configuration."""
 
@@ -217,7 +221,7 @@ class NotificationConfig:
         return getattr(self.events, event_type, False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuthorityConfig:
     """Access control for the Slack bot."""
 
@@ -228,7 +232,7 @@ class AuthorityConfig:
     cooldown_after_deny_s: int = 30
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BotConfig:
     """Slack bot configuration for the two-way vault-aware assistant."""
 
@@ -240,7 +244,7 @@ class BotConfig:
     authority: AuthorityConfig = field(default_factory=AuthorityConfig)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScheduleEntry:
     """A single scheduled recurring task.
 
@@ -269,7 +273,7 @@ class ScheduleEntry:
     channel: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DaemonConfig:
     """Top-level daemon configuration."""
 
@@ -314,7 +318,19 @@ def load_config(config_path: Path) -> DaemonConfig:
         FileNotFoundError: If config file does not exist.
         yaml.YAMLError: If YAML is malformed.
     """
-    raw = yaml.safe_load(config_path.read_text())
+    st = config_path.stat()
+    return copy.deepcopy(
+        _load_config_cached(str(config_path), st.st_mtime_ns, st.st_size)
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> DaemonConfig:
+    return _build_config(hook_utils._load_config_cached(path, mtime_ns, size))
+
+
+def _build_config(raw: Any) -> DaemonConfig:
+    """Build a DaemonConfig from parsed YAML. Does not modify *raw*."""
     if not isinstance(raw, dict):
         return DaemonConfig()
 
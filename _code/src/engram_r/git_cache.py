@@ -0,0 +1,122 @@
+"""Git queries shared by the hook scripts.
+
+Hooks fire dozens of times per session, each in a fresh process, and each
+used to ask ``git rev-parse`` the same question about the same vault. The
+answer is stored in the hook context file (see hook_utils.cache_dir()) and
+reused while it is younger than _TTL_SECONDS and, for a repository, while
+its ``.git`` entry still exists -- a stat instead of a fork+exec.
+
+changed_paths() is the one ``git status`` parser used by both auto_commit
+and session_capture. It is not cached: edits to tracked files and new
+untracked files leave ``.git/index`` untouched, so no cheap stat can tell
+whether a cached listing is still current.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+from engram_r import hook_utils
+
+_SECTION = "git_probe"
+
+# Seconds a probe result is trusted before git is asked again
+_TTL_SECONDS = 300.0
+
+
+def _probe(cwd: str) -> str | None:
+    """Run ``git rev-parse --show-toplevel`` in *cwd*. None if not a repo."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=True,
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError, NotADirectoryError):
+        return None
+    return result.stdout.strip() or None
+
+
+def _cached(cwd: str) -> tuple[bool, str | None]:
+    """Look up a still-valid probe for *cwd*. Returns (hit, toplevel)."""
+    entry = hook_utils._read_ctx().get(_SECTION, {}).get(cwd)
+    if not isinstance(entry, dict):
+        return False, None
+    checked = entry.get("checked")
+    if not isinstance(checked, (int, float)) or time.time() - checked > _TTL_SECONDS:
+        return False, None
+    toplevel = entry.get("toplevel")
+    if toplevel is None:
+        return True, None
+    if isinstance(toplevel, str) and os.path.exists(os.path.join(toplevel, ".git")):
+        return True, toplevel
+    return False, None
+
+
+def toplevel(cwd: str | Path) -> Path | None:
+    """Work-tree root containing *cwd*, or None if it is not in a git repo."""
+    key = str(cwd)
+    hit, top = _cached(key)
+    if not hit:
+        top = _probe(key)
+        hook_utils._update_ctx(_SECTION, key, {"toplevel": top, "checked": time.time()})
+    return Path(top) if top is not None else None
+
+
+def is_repo(path: str | Path) -> bool:
+    """True if *path* is inside a git work tree."""
+    return toplevel(path) is not None
+
+
+def changed_paths(
+    cwd: str | Path,
+    pathspecs: Sequence[str] = (),
+    *,
+    all_untracked: bool = False,
+    timeout: float | None = None,
+) -> list[str]:
+    """Paths under *pathspecs* that differ from HEAD, in git status order.
+
+    One ``git status --porcelain=v1 -z`` call; paths come back unquoted
+    and relative to the repository root, not to *cwd*.
+    With *all_untracked*, files inside untracked directories are listed
+    individually rather than as the directory. Ignored files are never
+    listed. Returns [] if *cwd* is not a repository or git fails.
+    """
+    cmd = ["git", "status", "--porcelain=v1", "-z"]
+    if all_untracked:
+        cmd.append("--untracked-files=all")
+    if pathspecs:
+        cmd.extend(["--", *pathspecs])
+    try:
+        result = subprocess.run(
+            cmd,
+            cwd=str(cwd),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=timeout,
+            check=False,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return []
+    if result.returncode != 0:
+        return []
+
+    # NUL-terminated "XY path" records.  A rename or copy is followed by an
+    # extra record holding the original path, which is skipped.
+    records = iter(result.stdout.split(b"\0"))
+    paths = []
+    for rec in records:
+        if len(rec) < 4:
+            continue
+        paths.append(os.fsdecode(rec[3:]))
+        if rec[0:1] in (b"R", b"C"):
+            next(records, None)
+    return paths
@@ -4,66 +4,228 @@ Extracts the three functions duplicated across all hooks:
 find_vault_root(), load_config(), resolve_vault().
 
 Fixes the .arscontexta marker detection bug (was .is_dir(), marker is a file).
+
+Each hook fire is a fresh process, so the two expensive lookups -- the
+``git rev-parse`` fallback in find_vault_root() (via git_cache) and the YAML
+parse in load_config() -- are memoized in-process and also persisted to a
+small JSON context file in cache_dir(), revalidated against the filesystem
+on reuse.
 """
 
 from __future__ import annotations
 
+import copy
+import functools
+import json
 import os
-import subprocess
+import sys
+import tempfile
 from pathlib import Path
 
-import yaml
-
 _CODE_DIR = Path(__file__).resolve().parent.parent.parent  # _code/
 
+_HOOK_CTX_NAME = "hook_ctx.json"
 
-def find_vault_root(start: Path | None = None) -> Path:
-    """Walk up from *start* (default CWD) looking for the vault root.
 
-    Detection priority:
-        1. Walk up looking for ``.arscontexta`` marker (file or directory)
-        2. ``PROJECT_DIR`` environment variable
-        3. ``git rev-parse --show-toplevel``
-        4. Relative fallback from ``_code/``
+def cache_dir() -> Path:
+    """Directory for state persisted between hook fires.
+
+    ``ENGRAMR_CACHE_DIR`` overrides the default ``~/.cache/engramr``.
     """
-    d = (start or Path.cwd()).resolve()
-    while d != d.parent:
-        if (d / ".arscontexta").exists():
-            return d
-        d = d.parent
-
-    project_dir = os.environ.get("PROJECT_DIR")
-    if project_dir:
-        p = Path(project_dir)
-        if p.is_dir():
-            return p
+    override = os.environ.get("ENGRAMR_CACHE_DIR")
+    if override:
+        return Path(override)
+    return Path.home() / ".cache" / "engramr"
+
+
+def detach(log_path: Path | None = None) -> bool:
+    """Fork so the hook returns at once; True in the process that continues.
 
+    The caller's hook runner only waits on the parent, which gets False and
+    should return straight away. The child starts a new session and points
+    stdin/stdout at /dev/null and stderr at *log_path* (or /dev/null), so
+    nothing keeps the runner's pipes open while it finishes the slow work.
+
+    Without ``os.fork`` (Windows), or with ``ENGRAMR_HOOK_FOREGROUND`` set,
+    no fork happens and the caller carries on in the foreground.
+    """
+    if not hasattr(os, "fork") or os.environ.get("ENGRAMR_HOOK_FOREGROUND"):
+        return True
+    sys.stdout.flush()
+    sys.stderr.flush()
+    if os.fork() > 0:
+        return False
+    os.setsid()
+    devnull = os.open(os.devnull, os.O_RDWR)
+    err_fd = devnull
+    if log_path is not None:
+        try:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            err_fd = os.open(
+                str(log_path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+            )
+        except OSError:
+            pass
+    os.dup2(devnull, 0)
+    os.dup2(devnull, 1)
+    os.dup2(err_fd, 2)
+    if err_fd != devnull:
+        os.close(err_fd)
+    os.close(devnull)
+    return True
+
+
+def read_cache_json(name: str) -> dict:
+    """Load JSON object *name* from cache_dir(). {} if missing or corrupt."""
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--show-toplevel"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return Path(result.stdout.strip())
-    except (subprocess.CalledProcessError, FileNotFoundError):
+        data = json.loads((cache_dir() / name).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def write_cache_json(name: str, data: dict) -> None:
+    """Atomically replace *name* in cache_dir() with *data*. Never raises."""
+    try:
+        payload = json.dumps(data)
+        target_dir = cache_dir()
+        target_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=target_dir, prefix=f".{name}-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp, target_dir / name)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+    except (OSError, TypeError, ValueError):
         pass
 
+
+def _read_ctx() -> dict:
+    """Load the persisted hook context. Returns {} if missing or corrupt."""
+    return read_cache_json(_HOOK_CTX_NAME)
+
+
+def _update_ctx(section: str, key: str, value: object) -> None:
+    """Merge one entry into the persisted hook context. Never raises.
+
+    Values that do not survive a JSON round trip unchanged (dates, non-string
+    keys) are not persisted.
+    """
+    try:
+        if json.loads(json.dumps(value)) != value:
+            return
+    except (TypeError, ValueError):
+        return
+    ctx = _read_ctx()
+    section_data = ctx.get(section)
+    if not isinstance(section_data, dict):
+        section_data = ctx[section] = {}
+    section_data[key] = value
+    write_cache_json(_HOOK_CTX_NAME, ctx)
+
+
+def find_vault_root(start: Path | None = None) -> Path:
+    """Walk up from *start* (default CWD) looking for the vault root.
+
+    Detection priority:
+        1. ``ENGRAMR_VAULT_ROOT`` environment variable
+        2. Walk up looking for ``.arscontexta`` marker (file or directory)
+        3. ``PROJECT_DIR`` environment variable
+        4. ``git rev-parse --show-toplevel``
+        5. Relative fallback from ``_code/``
+    """
+    cwd = os.getcwd()
+    return _find_vault_root_cached(
+        os.path.realpath(start if start is not None else cwd),
+        cwd,
+        os.environ.get("PROJECT_DIR"),
+        os.environ.get("ENGRAMR_VAULT_ROOT"),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _find_vault_root_cached(
+    start: str, cwd: str, project_dir: str | None, vault_override: str | None
+) -> Path:
+    if vault_override and os.path.isdir(vault_override):
+        # Resolved against *cwd* (part of the cache key), like the other roots
+        return Path(os.path.realpath(vault_override))
+
+    d = start
+    while (parent := os.path.dirname(d)) != d:
+        if os.path.exists(os.path.join(d, ".arscontexta")):
+            return Path(d)
+        d = parent
+
+    if project_dir and os.path.isdir(project_dir):
+        return Path(project_dir)
+
+    # Deferred import: git_cache builds on this module's context helpers.
+    from engram_r import git_cache
+
+    toplevel = git_cache.toplevel(cwd)
+    if toplevel is not None:
+        return toplevel
+
     return _CODE_DIR.parent
 
 
 def load_config(vault: Path | None = None) -> dict:
     """Load ops/config.yaml from vault root.
 
-    If *vault* is None, resolves it via find_vault_root().
+    If *vault* is None, resolves it via find_vault_root(). The parse is
+    cached on the file's mtime and size; callers get their own copy.
     """
     if vault is None:
         vault = find_vault_root()
     config_path = vault / "ops" / "config.yaml"
-    if not config_path.exists():
+    try:
+        st = config_path.stat()
+    except OSError:
         return {}
-    with open(config_path) as f:
-        return yaml.safe_load(f) or {}
+    return copy.deepcopy(
+        _load_config_cached(str(config_path), st.st_mtime_ns, st.st_size)
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> dict:
+    entry = _read_ctx().get("config", {}).get(path)
+    if (
+        isinstance(entry, dict)
+        and entry.get("mtime_ns") == mtime_ns
+        and entry.get("size") == size
+    ):
+        return entry.get("data") or {}
+
+    # Deferred import: warm hook fires are served from the JSON context above
+    # and never pay for loading PyYAML.
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path) as f:
+        data = yaml.load(f, Loader=loader) or {}
+    _update_ctx("config", path, {"mtime_ns": mtime_ns, "size": size, "data": data})
+    return data
+
+
+def vault_relpath(file_path: str | Path, vault: str | Path) -> str | None:
+    """Return *file_path* relative to *vault*, or None if it lies outside.
+
+    Normalized absolute paths are compared first, which touches no files.
+    Only when that misses are both sides resolved through symlinks, so a
+    vault reached through a link still matches. The vault itself maps to "".
+    """
+    for norm in (os.path.abspath, os.path.realpath):
+        child = norm(file_path)
+        parent = norm(vault)
+        if child == parent:
+            return ""
+        prefix = parent.rstrip(os.sep) + os.sep
+        if child.startswith(prefix):
+            return child[len(prefix) :]
+    return None
 
 
 def resolve_vault(config: dict | None = None) -> Path:
@@ -0,0 +1,258 @@
+"""Hook daemon: serve the Claude Code hooks from one warm process.
+
+Each hook fire used to start a fresh interpreter under ``uv run`` and
+re-import engram_r before doing a few milliseconds of work.
+``scripts/hooks/hook_client.py`` instead forwards the hook's stdin over a
+UNIX socket to this daemon, which has the hook scripts loaded already and
+forks a worker per request. The client starts the daemon on first use. It
+exits after ``ENGRAMR_HOOKD_IDLE`` seconds (default 300) without requests,
+or after serving a request once any watched source file has changed, so the
+next fire starts a daemon running the new code.
+
+Usage:
+    python -m engram_r.hookd
+
+Wire format (client to daemon), NUL-terminated fields, then EOF:
+    hook name, client cwd, one ``NAME=value`` field per client environment
+    variable, an empty field, stdin payload
+The first message also carries the client's stdout and stderr descriptors
+(SCM_RIGHTS). The worker runs the hook with those as its fd 1 and fd 2, so
+the hook's output reaches the hook runner exactly as from an in-process
+run. When the hook returns, the worker answers with one byte, the hook's
+exit status. A client that gets no status runs the hook itself.
+
+Each ``_code`` tree gets its own daemon: the socket and lock names carry a
+hash of the tree's path, so a vault never runs another vault's hook code.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import hashlib
+import importlib.util
+import io
+import os
+import socket
+import sys
+import traceback
+from pathlib import Path
+from types import ModuleType
+
+from engram_r.hook_utils import cache_dir
+
+_CODE_DIR = Path(__file__).resolve().parent.parent.parent  # _code/
+_HOOKS_DIR = _CODE_DIR / "scripts" / "hooks"
+
+HOOKS = (
+    "auto_commit",
+    "pipeline_bridge",
+    "session_capture",
+    "session_orient",
+    "validate_write",
+)
+
+_CODE_KEY = hashlib.sha256(os.fsencode(_CODE_DIR)).hexdigest()[:16]
+SOCKET_NAME = f"hookd-{_CODE_KEY}.sock"
+LOCK_NAME = f"hookd-{_CODE_KEY}.lock"
+LOG_NAME = "hookd.log"
+
+_DEFAULT_IDLE = 300.0
+
+# Seconds a worker waits for the client to finish sending
+_RECV_TIMEOUT = 10.0
+
+
+def socket_path() -> Path:
+    """Path of the daemon's listening socket."""
+    return cache_dir() / SOCKET_NAME
+
+
+def parse_request(data: bytes) -> tuple[str, str, dict[str, str], bytes]:
+    """Split a request into (hook, cwd, environment, payload).
+
+    Raises ValueError for a malformed request or an unknown hook.
+    """
+    parts = data.split(b"\0", 2)
+    if len(parts) != 3:
+        raise ValueError("malformed request")
+    name, cwd, rest = parts
+    hook = name.decode("utf-8", errors="replace")
+    if hook not in HOOKS:
+        raise ValueError(f"unknown hook: {hook!r}")
+    env = {}
+    while True:
+        entry, sep, rest = rest.partition(b"\0")
+        if not sep:
+            raise ValueError("malformed request")
+        if not entry:
+            break
+        key, eq, value = entry.partition(b"=")
+        if not key or not eq:
+            raise ValueError("malformed request")
+        env[os.fsdecode(key)] = os.fsdecode(value)
+    return hook, os.fsdecode(cwd), env, rest
+
+
+def _load_hooks() -> dict[str, ModuleType]:
+    """Import every hook script once, as the daemon's warm copy."""
+    hooks = {}
+    for name in HOOKS:
+        path = _HOOKS_DIR / f"{name}.py"
+        spec = importlib.util.spec_from_file_location(name, path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"cannot load hook {name}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        hooks[name] = module
+    return hooks
+
+
+def _source_stamp() -> dict[str, int]:
+    """mtimes of the hook scripts and the engram_r package sources."""
+    stamp = {}
+    paths = [_HOOKS_DIR / f"{name}.py" for name in HOOKS]
+    paths.extend(Path(__file__).resolve().parent.glob("*.py"))
+    for p in paths:
+        try:
+            stamp[str(p)] = p.stat().st_mtime_ns
+        except OSError:
+            stamp[str(p)] = -1
+    return stamp
+
+
+def _recv_request(conn: socket.socket) -> tuple[bytes, list[int]]:
+    """Read a whole request. Returns (data, descriptors passed with it)."""
+    conn.settimeout(_RECV_TIMEOUT)
+    data, fds, _, _ = socket.recv_fds(conn, 65536, 2)
+    chunks = [data]
+    while chunk := conn.recv(65536):
+        chunks.append(chunk)
+    return b"".join(chunks), fds
+
+
+def _handle(conn: socket.socket, hooks: dict[str, ModuleType]) -> None:
+    """Run one hook fire in the current (forked worker) process."""
+    data, fds = _recv_request(conn)
+    try:
+        if len(fds) != 2:
+            raise ValueError("request carried no output descriptors")
+        hook, cwd, env, payload = parse_request(data)
+    except ValueError:
+        for fd in fds:
+            os.close(fd)
+        raise
+
+    with contextlib.suppress(OSError):
+        os.chdir(cwd)
+    # Hooks read switches such as ENGRAMR_IDENTITY_UNLOCK from the
+    # environment, so run each fire under its client's, not the daemon's.
+    os.environ.clear()
+    os.environ.update(env)
+
+    # The client returns once this connection closes. A hook that detaches
+    # forks a child that must not hold it open, so every child forked from
+    # here drops its copy first.
+    inherited = [conn.detach()]
+
+    def _drop_connection() -> None:
+        while inherited:
+            os.close(inherited.pop())
+
+    os.register_at_fork(after_in_child=_drop_connection)
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.dup2(fds[0], 1)
+    os.dup2(fds[1], 2)
+    for fd in fds:
+        os.close(fd)
+    sys.stdin = io.StringIO(payload.decode("utf-8", errors="replace"))
+    status = 1
+    try:
+        hooks[hook].main()
+        status = 0
+    except SystemExit as exc:
+        status = _exit_status(exc.code)  # hooks finish early with sys.exit(0)
+    except Exception:
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+    # A detached child arrives here too, after its copy has been dropped.
+    if inherited:
+        os.write(inherited[0], bytes([status]))
+
+
+def _exit_status(code: object) -> int:
+    """Exit status for ``SystemExit(code)``, as the interpreter would pick."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code & 0xFF
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _reap() -> None:
+    """Collect exited workers so they do not linger as zombies."""
+    try:
+        while os.waitpid(-1, os.WNOHANG)[0] > 0:
+            pass
+    except ChildProcessError:
+        pass
+
+
+def serve() -> None:
+    """Accept hook requests until idle or until a source file changes."""
+    base = cache_dir()
+    base.mkdir(parents=True, exist_ok=True)
+
+    # One daemon per cache dir and code tree: a second one started by a
+    # racing client finds the lock held and leaves.
+    lock_fd = os.open(str(base / LOCK_NAME), os.O_WRONLY | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(lock_fd)
+        return
+
+    hooks = _load_hooks()
+    stamp = _source_stamp()
+    idle = float(os.environ.get("ENGRAMR_HOOKD_IDLE", _DEFAULT_IDLE))
+
+    path = socket_path()
+    path.unlink(missing_ok=True)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.bind(str(path))
+        sock.listen(16)
+        sock.settimeout(idle)
+        while True:
+            try:
+                conn, _ = sock.accept()
+            except TimeoutError:
+                break
+            _reap()
+            if os.fork() == 0:
+                sock.close()
+                try:
+                    _handle(conn, hooks)
+                except Exception as exc:
+                    print(f"hookd: {exc}", file=sys.stderr)
+                finally:
+                    sys.stderr.flush()
+                    os._exit(0)
+            conn.close()
+            if _source_stamp() != stamp:
+                break
+    finally:
+        sock.close()
+        path.unlink(missing_ok=True)
+        os.close(lock_fd)
+        _reap()
+
+
+if __name__ == "__main__":
+    serve()
@@ -9,8 +9,12 @@ from __future__ import annotations
 import logging
 import re
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import pandas as pd
+# Only annotations name pandas; redact_text() runs in the Write hook, which
+# should not pay for importing it.
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
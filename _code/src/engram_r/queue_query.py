@@ -26,6 +26,8 @@ import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 
+from engram_r import _fastjson
+
 PIPELINE_ORDER = ["reduce", "create", "enrich", "reflect", "reweave", "verify"]
 
 # Phase sequences by task type (used for advance logic)
@@ -74,14 +76,12 @@ def write_queue_atomic(queue: list[dict], queue_file: Path) -> None:
     """Write queue to disk atomically (write-to-temp then rename)."""
     queue_file.parent.mkdir(parents=True, exist_ok=True)
     with tempfile.NamedTemporaryFile(
-        mode="w",
+        mode="wb",
         dir=queue_file.parent,
         suffix=".tmp",
         delete=False,
-        encoding="utf-8",
     ) as tmp:
-        json.dump(queue, tmp, indent=2, ensure_ascii=False)
-        tmp.write("\n")
+        tmp.write(_fastjson.dumps(queue, indent=True) + b"\n")
         tmp_path = Path(tmp.name)
     tmp_path.replace(queue_file)
 
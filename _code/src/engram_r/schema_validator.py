@@ -20,6 +20,11 @@ from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # libyaml not compiled in
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
 # Characters that break filesystems when used in filenames.
 # / is a directory separator on POSIX; \ on Windows; others break shells.
 _UNSAFE_FILENAME_CHARS = r'/\:*?"<>|'
@@ -170,6 +175,40 @@ def validate_filename(file_path: str) -> list[str]:
 # Reuse the frontmatter regex from hypothesis_parser.py
 _FM_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
 
+# Truncated wiki links: [[some title...]]
+_TRUNCATED_LINK_RE = re.compile(r"\[\[[^\]]*\.\.\.\]\]")
+
+
+@lru_cache(maxsize=4)
+def _split_frontmatter(content: str) -> tuple[str | None, str]:
+    """Split *content* into (frontmatter text, body).
+
+    Returns ``(None, content)`` when there is no frontmatter block.  Cached
+    because the write-time checks all receive the same content string,
+    whose hash Python computes once and keeps on the object.
+    """
+    match = _FM_PATTERN.match(content)
+    if match is None:
+        return None, content
+    return match.group(1), content[match.end() :]
+
+
+# Returned by _parse_frontmatter for text that is not valid YAML
+_INVALID = object()
+
+
+@lru_cache(maxsize=32)
+def _parse_frontmatter(fm_text: str) -> object:
+    """YAML-load *fm_text*, or return _INVALID on a YAML error.
+
+    Cached because one write runs several checks over the same frontmatter.
+    Callers must not mutate the result.
+    """
+    try:
+        return yaml.load(fm_text, Loader=_Loader)
+    except yaml.YAMLError:
+        return _INVALID
+
 
 # ---------------------------------------------------------------------------
 # Content safety detectors (pre-parse)
@@ -189,12 +228,14 @@ def detect_yaml_safety_issues(content: str) -> list[str]:
     Returns:
         List of human-readable issue descriptions (empty if clean).
     """
-    fm_match = _FM_PATTERN.match(content)
-    if not fm_match:
+    fm_text, _ = _split_frontmatter(content)
+    if fm_text is None:
         return []
+    return _yaml_safety_issues(fm_text)
+
 
+def _yaml_safety_issues(fm_text: str) -> list[str]:
     issues: list[str] = []
-    fm_text = fm_match.group(1)
     for lineno, line in enumerate(fm_text.splitlines(), start=1):
         stripped = line.strip()
         if not stripped or stripped.startswith("#"):
@@ -223,13 +264,15 @@ def detect_unicode_issues(content: str) -> list[str]:
     Returns:
         List of human-readable issue descriptions (empty if clean).
     """
-    fm_match = _FM_PATTERN.match(content)
-    if not fm_match:
+    fm_text, _ = _split_frontmatter(content)
+    if fm_text is None:
         return []
+    return _unicode_issues(fm_text)
 
+
+def _unicode_issues(fm_text: str) -> list[str]:
     issues: list[str] = []
-    fm_text = fm_match.group(1)
-    if fm_text != unicodedata.normalize("NFC", fm_text):
+    if not unicodedata.is_normalized("NFC", fm_text):
         issues.append(
             "Frontmatter contains non-NFC Unicode characters. "
             "Normalize text with normalize_text() before writing."
@@ -237,6 +280,22 @@ def detect_unicode_issues(content: str) -> list[str]:
     return issues
 
 
+def detect_truncated_wiki_links(content: str) -> list[str]:
+    """Detect truncated wiki links like ``[[some title...]]``.
+
+    Args:
+        content: Full note content.
+
+    Returns:
+        List of human-readable issue descriptions (empty if clean).
+    """
+    return [
+        f"Truncated wiki link found: {m.group()}. "
+        f"Write the full title or use backtick code spans for shorthand references."
+        for m in _TRUNCATED_LINK_RE.finditer(content)
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Schema definitions -- required fields per note type
 # ---------------------------------------------------------------------------
@@ -365,14 +424,15 @@ def validate_note(
     if not content or not content.strip():
         return ValidationResult(valid=True)
 
-    match = _FM_PATTERN.match(content)
-    if not match:
+    fm_text, _ = _split_frontmatter(content)
+    if fm_text is None:
         return ValidationResult(valid=True)
+    return _schema_result(_parse_frontmatter(fm_text), note_type)
 
-    fm_text = match.group(1)
-    try:
-        frontmatter = yaml.safe_load(fm_text)
-    except yaml.YAMLError:
+
+def _schema_result(frontmatter: object, note_type: str | None) -> ValidationResult:
+    """validate_note() for an already parsed frontmatter block."""
+    if frontmatter is _INVALID:
         return ValidationResult(valid=False, errors=["Invalid YAML frontmatter"])
 
     if not isinstance(frontmatter, dict):
@@ -445,11 +505,7 @@ def check_queue_provenance(
         if not fm_match:
             continue
 
-        try:
-            fm = yaml.safe_load(fm_match.group(1))
-        except yaml.YAMLError:
-            continue
-
+        fm = _parse_frontmatter(fm_match.group(1))
         if not isinstance(fm, dict):
             continue
 
@@ -488,22 +544,25 @@ def check_notes_provenance(content: str) -> ValidationResult:
     Returns:
         A ``ValidationResult`` with errors (blocking) and warnings (advisory).
     """
-    errors: list[str] = []
-    warnings: list[str] = []
-
     if not content or not content.strip():
         return ValidationResult(valid=False, errors=["Empty file content"])
 
-    match = _FM_PATTERN.match(content)
-    if not match:
+    fm_text, _ = _split_frontmatter(content)
+    if fm_text is None:
         return ValidationResult(
             valid=False, errors=["No YAML frontmatter found in notes/ file"]
         )
+    return _provenance_result(_parse_frontmatter(fm_text))
 
-    fm_text = match.group(1)
-    try:
-        frontmatter = yaml.safe_load(fm_text)
-    except yaml.YAMLError:
+
+def _provenance_result(
+    frontmatter: object, *, check_source: bool = True
+) -> ValidationResult:
+    """check_notes_provenance() for an already parsed frontmatter block.
+
+    With *check_source* False the advisory ``source`` warning is skipped.
+    """
+    if frontmatter is _INVALID:
         return ValidationResult(valid=False, errors=["Invalid YAML frontmatter"])
 
     if not isinstance(frontmatter, dict):
@@ -511,6 +570,9 @@ def check_notes_provenance(content: str) -> ValidationResult:
             valid=False, errors=["Frontmatter is not a YAML mapping"]
         )
 
+    errors: list[str] = []
+    warnings: list[str] = []
+
     # description is required for all notes/ files
     desc = frontmatter.get("description")
     if desc is None:
@@ -523,7 +585,8 @@ def check_notes_provenance(content: str) -> ValidationResult:
     source = frontmatter.get("source")
 
     if (
-        note_type not in _SOURCE_EXEMPT_TYPES
+        check_source
+        and note_type not in _SOURCE_EXEMPT_TYPES
         and (note_type in _CLAIM_FAMILY_TYPES or not note_type)
         and not source
     ):
@@ -538,6 +601,66 @@ def check_notes_provenance(content: str) -> ValidationResult:
     )
 
 
+def validate_all(
+    content: str,
+    *,
+    check_truncated_links: bool = False,
+    check_provenance: bool = False,
+    check_source: bool = True,
+) -> ValidationResult:
+    """Run the write-time content checks, stopping at the first that fails.
+
+    In order: YAML safety and NFC Unicode in the frontmatter, truncated wiki
+    links (when *check_truncated_links*), the type schema (validate_note),
+    and notes/ provenance (when *check_provenance*).  The frontmatter is
+    located and parsed once for all of them.
+
+    Args:
+        content: Full note content.
+        check_truncated_links: Also block ``[[title...]]`` links.
+        check_provenance: Also apply check_notes_provenance().
+        check_source: With *check_provenance*, also warn on a missing
+            ``source`` field.
+
+    Returns:
+        A ``ValidationResult`` carrying the failing check's errors, or
+        ``valid=True`` with any provenance warnings.
+    """
+    fm_text, _ = _split_frontmatter(content)
+
+    if fm_text is not None:
+        issues = _yaml_safety_issues(fm_text)
+        if issues:
+            reason = "YAML safety issue in frontmatter: " + "; ".join(issues)
+            return ValidationResult(valid=False, errors=[reason])
+        issues = _unicode_issues(fm_text)
+        if issues:
+            reason = "Unicode normalization issue: " + "; ".join(issues)
+            return ValidationResult(valid=False, errors=[reason])
+
+    if check_truncated_links:
+        issues = detect_truncated_wiki_links(content)
+        if issues:
+            return ValidationResult(valid=False, errors=issues)
+
+    blank = not content.strip()
+    frontmatter = _parse_frontmatter(fm_text) if fm_text is not None else None
+    if not blank and fm_text is not None:
+        schema = _schema_result(frontmatter, None)
+        if not schema.valid:
+            return schema
+
+    if not check_provenance:
+        return ValidationResult(valid=True)
+    if blank:
+        return ValidationResult(valid=False, errors=["Empty file content"])
+    if fm_text is None:
+        return ValidationResult(
+            valid=False, errors=["No YAML frontmatter found in notes/ file"]
+        )
+    return _provenance_result(frontmatter, check_source=check_source)
+
+
 # ---------------------------------------------------------------------------
 # Structural compliance checks (B1-B4)
 # ---------------------------------------------------------------------------
@@ -605,21 +728,15 @@ def _build_stem_index(vault_root: Path) -> dict[str, str]:
 
 def _get_body(content: str) -> str:
     """Extract body text after frontmatter."""
-    fm_match = _FM_PATTERN.match(content)
-    if fm_match:
-        return content[fm_match.end():]
-    return content
+    return _split_frontmatter(content)[1]
 
 
 def _get_fm_type(content: str) -> str | None:
     """Extract the type field from frontmatter, or None."""
-    fm_match = _FM_PATTERN.match(content)
-    if not fm_match:
-        return None
-    try:
-        fm = yaml.safe_load(fm_match.group(1))
-    except yaml.YAMLError:
+    fm_text, _ = _split_frontmatter(content)
+    if fm_text is None:
         return None
+    fm = _parse_frontmatter(fm_text)
     if isinstance(fm, dict):
         return fm.get("type")
     return None
@@ -715,17 +832,14 @@ def check_wiki_link_targets(
         targets.add(m.group(1).strip())
 
     # Also check source: frontmatter field
-    fm_match = _FM_PATTERN.match(content)
-    if fm_match:
-        try:
-            fm = yaml.safe_load(fm_match.group(1))
-            if isinstance(fm, dict):
-                source_val = fm.get("source", "")
-                if isinstance(source_val, str):
-                    for m in _WIKI_LINK_CONTENT_RE.finditer(source_val):
-                        targets.add(m.group(1).strip())
-        except yaml.YAMLError:
-            pass
+    fm_text, _ = _split_frontmatter(content)
+    if fm_text is not None:
+        fm = _parse_frontmatter(fm_text)
+        if isinstance(fm, dict):
+            source_val = fm.get("source", "")
+            if isinstance(source_val, str):
+                for m in _WIKI_LINK_CONTENT_RE.finditer(source_val):
+                    targets.add(m.group(1).strip())
 
     if not targets:
         return ValidationResult(valid=True)
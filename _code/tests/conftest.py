@@ -0,0 +1,21 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from engram_r import hook_utils
+
+
+@pytest.fixture(autouse=True)
+def _isolated_hook_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep persisted hook state out of ~/.cache and reset in-process memos.
+
+    Hooks also run in the foreground so they never fork the test process.
+    """
+    monkeypatch.setenv("ENGRAMR_CACHE_DIR", str(tmp_path / ".engramr-cache"))
+    monkeypatch.setenv("ENGRAMR_HOOK_FOREGROUND", "1")
+    hook_utils._find_vault_root_cached.cache_clear()
+    hook_utils._load_config_cached.cache_clear()
@@ -1,11 +1,23 @@
 """Tests for arXiv module -- uses mock responses, no network calls."""
 
+import http.client
+import os
+import threading
+import time
+import urllib.error
 import xml.etree.ElementTree as ET
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 import pytest
 
-from engram_r.arxiv import ArxivArticle, _parse_entry, search_arxiv
+from engram_r import arxiv
+from engram_r.arxiv import (
+    ArxivArticle,
+    _iter_entries,
+    _parse_entry,
+    search_arxiv,
+    search_many,
+)
 
 # Minimal Atom entry for testing
 _SAMPLE_ENTRY_XML = """
@@ -63,31 +75,147 @@ class TestParseEntry:
 
 
 class TestSearchArxiv:
-    @patch("urllib.request.urlopen")
-    def test_returns_articles(self, mock_urlopen):
+    @patch("engram_r.arxiv._http_get")
+    def test_returns_articles(self, mock_get):
         response_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
         <feed xmlns="http://www.w3.org/2005/Atom">
           {_SAMPLE_ENTRY_XML}
         </feed>"""
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = response_xml.encode("utf-8")
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_resp
+        mock_get.return_value = response_xml.encode("utf-8")
 
         results = search_arxiv("all:co-scientist", max_results=1)
         assert len(results) == 1
         assert results[0].title == "Towards an AI co-scientist"
 
-    @patch("urllib.request.urlopen")
-    def test_empty_results(self, mock_urlopen):
+    @patch("engram_r.arxiv._http_get")
+    def test_empty_results(self, mock_get):
         response_xml = """<?xml version="1.0" encoding="UTF-8"?>
         <feed xmlns="http://www.w3.org/2005/Atom"></feed>"""
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = response_xml.encode("utf-8")
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_resp
+        mock_get.return_value = response_xml.encode("utf-8")
 
         results = search_arxiv("nonexistent_query_xyz", max_results=1)
         assert results == []
+
+
+class TestSearchMany:
+    @patch("engram_r.arxiv.search_arxiv")
+    def test_results_in_query_order(self, mock_search):
+        mock_search.side_effect = lambda q, *args, **kwargs: [q]
+        results = search_many(["all:a", "all:b", "all:c"], max_results=5)
+        assert results == [["all:a"], ["all:b"], ["all:c"]]
+        mock_search.assert_any_call(
+            "all:b", 5, "relevance", "descending", no_cache=False
+        )
+
+    def test_no_queries(self):
+        assert search_many([]) == []
+
+
+class TestResponseCache:
+    @pytest.fixture
+    def mock_get(self):
+        response_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
+        <feed xmlns="http://www.w3.org/2005/Atom">
+          {_SAMPLE_ENTRY_XML}
+        </feed>"""
+        with patch(
+            "engram_r.arxiv._http_get", return_value=response_xml.encode("utf-8")
+        ) as m:
+            yield m
+
+    def test_repeat_query_served_from_cache(self, mock_get):
+        first = search_arxiv("all:co-scientist", max_results=1)
+        second = search_arxiv("all:co-scientist", max_results=1)
+        assert first == second
+        assert mock_get.call_count == 1
+
+    def test_different_parameters_fetch_again(self, mock_get):
+        search_arxiv("all:co-scientist", max_results=1)
+        search_arxiv("all:co-scientist", max_results=2)
+        assert mock_get.call_count == 2
+
+    def test_no_cache_bypasses(self, mock_get):
+        search_arxiv("all:co-scientist", max_results=1)
+        search_arxiv("all:co-scientist", max_results=1, no_cache=True)
+        assert mock_get.call_count == 2
+
+    def test_expired_entry_refetched(self, mock_get, tmp_path):
+        search_arxiv("all:co-scientist", max_results=1)
+        (cached,) = (tmp_path / ".engramr-cache" / "arxiv").glob("*.xml")
+        old = time.time() - 2 * 24 * 3600
+        os.utime(cached, (old, old))
+        search_arxiv("all:co-scientist", max_results=1)
+        assert mock_get.call_count == 2
+
+
+class TestIterEntries:
+    def test_entries_in_order(self):
+        second = _SAMPLE_ENTRY_XML.replace("2502.18864v1", "2503.00001v2")
+        feed = (
+            '<feed xmlns="http://www.w3.org/2005/Atom"><title>q</title>'
+            f"{_SAMPLE_ENTRY_XML}{second}</feed>"
+        ).encode()
+        ids = [_parse_entry(e).arxiv_id for e in _iter_entries(feed)]
+        assert ids == ["2502.18864v1", "2503.00001v2"]
+
+
+class _FakeResponse:
+    def __init__(self, status=200, body=b"<feed/>"):
+        self.status = status
+        self.reason = "OK" if status == 200 else "Error"
+        self.msg = {}
+        self._body = body
+
+    def read(self):
+        return self._body
+
+
+class TestHttpGet:
+    @pytest.fixture(autouse=True)
+    def fresh_connections(self, monkeypatch):
+        monkeypatch.setattr(arxiv, "_connections", threading.local())
+
+    def test_connection_reused_across_requests(self):
+        with patch("http.client.HTTPConnection") as conn_cls:
+            conn = conn_cls.return_value
+            conn.getresponse.return_value = _FakeResponse()
+            assert arxiv._http_get("http://export.arxiv.org/api/query?a=1") == (
+                b"<feed/>"
+            )
+            arxiv._http_get("http://export.arxiv.org/api/query?a=2")
+        conn_cls.assert_called_once_with("export.arxiv.org", timeout=30)
+        assert [c.args for c in conn.request.call_args_list] == [
+            ("GET", "/api/query?a=1"),
+            ("GET", "/api/query?a=2"),
+        ]
+
+    def test_retries_once_on_dropped_connection(self):
+        with patch("http.client.HTTPConnection") as conn_cls:
+            conn = conn_cls.return_value
+            conn.getresponse.side_effect = [
+                http.client.RemoteDisconnected("closed"),
+                _FakeResponse(),
+            ]
+            assert arxiv._http_get("http://export.arxiv.org/api/query") == b"<feed/>"
+        conn.close.assert_called_once()
+        assert conn.request.call_count == 2
+
+    def test_timeout_resets_connection(self):
+        with patch("http.client.HTTPConnection") as conn_cls:
+            conn = conn_cls.return_value
+            conn.getresponse.side_effect = [TimeoutError("timed out"), _FakeResponse()]
+            with pytest.raises(TimeoutError):
+                arxiv._http_get("http://export.arxiv.org/api/query?a=1")
+            conn.close.assert_called_once()
+            assert arxiv._connections.conn is None
+
+            assert arxiv._http_get("http://export.arxiv.org/api/query?a=2") == (
+                b"<feed/>"
+            )
+        assert conn_cls.call_count == 2
+
+    def test_error_status_raises_http_error(self):
+        with patch("http.client.HTTPConnection") as conn_cls:
+            conn_cls.return_value.getresponse.return_value = _FakeResponse(503)
+            with pytest.raises(urllib.error.HTTPError):
+                arxiv._http_get("http://export.arxiv.org/api/query")
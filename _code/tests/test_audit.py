@@ -2,9 +2,12 @@
 
 import json
 
+import pytest
+
 from engram_r.audit import (
     AuditEntry,
     AuditOutcome,
+    AuditWriter,
     RuleEvaluation,
     append_audit_entry,
     append_outcome,
@@ -229,3 +232,169 @@ class TestAppendOutcome:
         append_outcome(outcome, log_path)
         remaining = list(tmp_path.glob(".audit-*"))
         assert remaining == []
+
+
+class TestAppendLine:
+    def test_large_entry_written_whole(self, tmp_path):
+        log_path = tmp_path / "audit.jsonl"
+        summary = {f"key_{i}": "x" * 100 for i in range(100)}
+        entry = AuditEntry(timestamp="t", vault_summary=summary)
+        append_audit_entry(entry, log_path)
+        append_audit_entry(AuditEntry(timestamp="t2"), log_path)
+        lines = log_path.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])["vault_summary"] == summary
+
+    def test_concurrent_writers_do_not_interleave(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        log_path = tmp_path / "audit.jsonl"
+
+        def write(i):
+            append_audit_entry(
+                AuditEntry(timestamp="t", selected_task=f"task-{i}" * (i % 50)),
+                log_path,
+            )
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(write, range(200)))
+        lines = log_path.read_text().splitlines()
+        assert len(lines) == 200
+        for line in lines:
+            json.loads(line)
+
+    def test_write_failure_logged(self, tmp_path, caplog):
+        log_path = tmp_path / "audit.jsonl"
+        log_path.mkdir()
+        append_outcome(
+            AuditOutcome(
+                timestamp="t",
+                task_key="k",
+                skill="s",
+                outcome="success",
+                duration_seconds=1,
+            ),
+            log_path,
+        )
+        assert "Failed to write outcome entry" in caplog.text
+
+
+class TestAuditWriter:
+    def test_buffers_until_flush(self, tmp_path):
+        log_path = tmp_path / "audit.jsonl"
+        writer = AuditWriter(log_path)
+        writer.append(AuditEntry(timestamp="t", selected_task="a"))
+        assert not log_path.exists()
+        writer.flush()
+        assert json.loads(log_path.read_text())["selected_task"] == "a"
+
+    def test_flushes_full_batch(self, tmp_path, monkeypatch):
+        import engram_r.audit as audit
+
+        calls = []
+        real = audit._append_buffers
+        monkeypatch.setattr(
+            audit,
+            "_append_buffers",
+            lambda bufs, path: calls.append(len(bufs)) or real(bufs, path),
+        )
+        log_path = tmp_path / "audit.jsonl"
+        with AuditWriter(log_path, max_batch=3) as writer:
+            for i in range(7):
+                writer.append(AuditEntry(timestamp="t", selected_task=f"task-{i}"))
+        assert calls == [3, 3, 1]
+        tasks = [json.loads(x)["selected_task"] for x in log_path.read_text().split()]
+        assert tasks == [f"task-{i}" for i in range(7)]
+
+    def test_flushes_on_byte_limit(self, tmp_path):
+        log_path = tmp_path / "audit.jsonl"
+        writer = AuditWriter(log_path, max_bytes=1)
+        writer.append(AuditEntry(timestamp="t"))
+        assert log_path.exists()
+
+    def test_mixed_records(self, tmp_path):
+        log_path = tmp_path / "audit.jsonl"
+        with AuditWriter(log_path) as writer:
+            writer.append(AuditEntry(timestamp="t"))
+            writer.append(
+                AuditOutcome(
+                    timestamp="t",
+                    task_key="k",
+                    skill="s",
+                    outcome="success",
+                    duration_seconds=1,
+                )
+            )
+        types = [json.loads(x)["type"] for x in log_path.read_text().splitlines()]
+        assert types == ["selection", "outcome"]
+
+    def test_failed_flush_keeps_pending(self, tmp_path):
+        log_path = tmp_path / "audit.jsonl"
+        log_path.mkdir()
+        writer = AuditWriter(log_path)
+        writer.append(AuditEntry(timestamp="t"))
+        with pytest.raises(OSError):
+            writer.flush()
+        log_path.rmdir()
+        writer.flush()
+        assert len(log_path.read_text().splitlines()) == 1
+
+
+class TestEncoding:
+    def test_compact_utf8_line(self, tmp_path):
+        log_path = tmp_path / "audit.jsonl"
+        append_audit_entry(AuditEntry(timestamp="t", error="café"), log_path)
+        raw = log_path.read_bytes()
+        assert raw.endswith(b"}\n")
+        assert "café".encode() in raw
+        assert b", " not in raw and b": " not in raw
+
+
+class TestToDictMatchesAsdict:
+    """The hand-written to_dict methods cover every dataclass field."""
+
+    def test_audit_entry(self):
+        from dataclasses import asdict
+
+        entry = AuditEntry(
+            timestamp="t",
+            selected_task="k",
+            vault_summary={"inbox": 2},
+            rules_evaluated=[RuleEvaluation(check_name="p1", triggered=True)],
+            error="e",
+        )
+        assert entry.to_dict() == asdict(entry)
+        assert list(entry.to_dict()) == list(asdict(entry))
+
+    def test_audit_outcome(self):
+        from dataclasses import asdict
+
+        outcome = AuditOutcome(
+            timestamp="t",
+            task_key="k",
+            skill="s",
+            outcome="success",
+            duration_seconds=3,
+            vault_summary_before={"inbox": 2},
+            vault_summary_after={"inbox": 1},
+            changed_keys=["inbox"],
+        )
+        assert outcome.to_dict() == asdict(outcome)
+        assert list(outcome.to_dict()) == list(asdict(outcome))
+
+    def test_rule_evaluation(self):
+        from dataclasses import asdict
+
+        rule = RuleEvaluation(check_name="p1", triggered=False, skip_reason="x")
+        assert rule.to_dict() == asdict(rule)
+
+    def test_containers_copied(self):
+        entry = AuditEntry(timestamp="t", vault_summary={"inbox": 2})
+        entry.to_dict()["vault_summary"]["inbox"] = 99
+        assert entry.vault_summary == {"inbox": 2}
+
+
+class TestSlots:
+    def test_records_have_no_dict(self):
+        assert not hasattr(RuleEvaluation(check_name="p", triggered=False), "__dict__")
+        assert not hasattr(AuditEntry(timestamp="t"), "__dict__")
@@ -24,6 +24,16 @@ def _hook_stdin(file_path: str) -> str:
     )
 
 
+def _fake_git(status: bytes = b""):
+    """subprocess.run stand-in: *status* for ``git status``, success otherwise."""
+
+    def run(cmd, **kwargs):
+        stdout = status if cmd[:2] == ["git", "status"] else ""
+        return subprocess.CompletedProcess(args=cmd, returncode=0, stdout=stdout)
+
+    return run
+
+
 @pytest.fixture
 def vault(tmp_path: Path) -> Path:
     """Create a minimal vault with git."""
@@ -95,19 +105,16 @@ class TestAutoCommitTrackedFile:
 
 class TestBroadSweep:
     def test_sweep_stages_vault_dirs(self, vault: Path) -> None:
-        """Sweep pass stages all vault content directories."""
+        """Sweep pass stages changes under the vault content directories."""
         file_path = vault / "self" / "goals.md"
         file_path.write_text("goals", encoding="utf-8")
 
         calls_log = []
+        fake = _fake_git(b"?? notes/new.md\0")
 
         def fake_run(cmd, **kwargs):
             calls_log.append(cmd)
-            return subprocess.CompletedProcess(
-                args=cmd,
-                returncode=0 if "add" in cmd else 1,  # diff --cached returns 1 = has changes
-                stdout="",
-            )
+            return fake(cmd, **kwargs)
 
         with (
             patch("auto_commit.load_config", return_value={"git_auto_commit": True}),
@@ -118,10 +125,54 @@ class TestBroadSweep:
         ):
             auto_commit.main()
 
-        # Should contain sweep commits
-        add_commands = [c for c in calls_log if c[0] == "git" and c[1] == "add"]
-        # At least the specific file add + sweep adds for existing dirs
-        assert len(add_commands) >= 2
+        # The specific file add, then the sweep's update-index
+        stage_commands = [
+            c for c in calls_log if c[0] == "git" and c[1] in ("add", "update-index")
+        ]
+        assert len(stage_commands) >= 2
+
+    def test_sweep_feeds_status_paths_to_update_index(self, vault: Path) -> None:
+        """One status over the existing sweep dirs drives one update-index."""
+        mock_run = MagicMock(
+            side_effect=_fake_git(
+                b" M self/a.md\0?? notes/b c.md\0R  ops/new.md\0ops/old.md\0"
+            )
+        )
+        with (
+            patch("auto_commit.subprocess.run", mock_run),
+            patch("auto_commit.git_cache.toplevel", return_value=vault),
+        ):
+            auto_commit._sweep(vault)
+
+        cmds = [c.args[0] for c in mock_run.call_args_list]
+        assert cmds[0][:2] == ["git", "status"]
+        assert cmds[0][-4:] == ["--", "notes", "self", "ops"]
+        assert cmds[1][:2] == ["git", "update-index"]
+        assert mock_run.call_args_list[1].kwargs["input"] == (
+            b"self/a.md\0notes/b c.md\0ops/new.md\0"
+        )
+        assert mock_run.call_args_list[1].kwargs["cwd"] == str(vault)
+        assert "auto: vault update" in cmds[2]
+        assert not any("diff" in c for c in cmds)
+
+    def test_present_sweep_dirs_lists_existing_dirs_only(self, vault: Path) -> None:
+        (vault / "docs").write_text("not a dir", encoding="utf-8")
+        (vault / "_code" / "templates").mkdir(parents=True)
+        assert auto_commit._present_sweep_dirs(vault) == [
+            "notes",
+            "self",
+            "ops",
+            "_code/templates",
+        ]
+
+    def test_present_sweep_dirs_missing_vault(self, tmp_path: Path) -> None:
+        assert auto_commit._present_sweep_dirs(tmp_path / "missing") == []
+
+    def test_clean_sweep_dirs_spawn_nothing_more(self, vault: Path) -> None:
+        mock_run = MagicMock(side_effect=_fake_git(b""))
+        with patch("auto_commit.subprocess.run", mock_run):
+            auto_commit._sweep(vault)
+        assert mock_run.call_count == 1
 
 
 class TestNoStdinGraceful:
@@ -143,7 +194,7 @@ class TestGitFailureLogging:
         stderr_buf = io.StringIO()
 
         def fake_run(cmd, **kwargs):
-            if cmd[1] == "add" and str(file_path) in str(cmd):
+            if cmd[1] == "add" and "self/goals.md" in kwargs.get("input", ""):
                 return subprocess.CompletedProcess(
                     args=cmd, returncode=128, stdout="", stderr="fatal: bad"
                 )
@@ -198,3 +249,186 @@ class TestErrorHandling:
         ):
             auto_commit.main()  # Should not raise
         assert "test" in stderr_buf.getvalue()
+
+
+class TestCoalescing:
+    """Queue + lock coalescing when the vault has an on-disk git dir."""
+
+    @pytest.fixture
+    def git_vault(self, vault: Path) -> Path:
+        (vault / ".git").mkdir()
+        return vault
+
+    def _run_main(self, vault: Path, file_path: Path, **patches) -> MagicMock:
+        mock_run = MagicMock(side_effect=_fake_git(patches.get("status", b"")))
+        with (
+            patch("auto_commit.load_config", return_value={"git_auto_commit": True}),
+            patch("auto_commit.resolve_vault", return_value=vault),
+            patch("sys.stdin", io.StringIO(_hook_stdin(str(file_path)))),
+            patch("auto_commit._is_git_repo", return_value=True),
+            patch("auto_commit._detach", return_value=patches.get("detach", True)),
+            patch("auto_commit._DEBOUNCE_SECONDS", 0),
+            patch("auto_commit.subprocess.run", mock_run),
+        ):
+            auto_commit.main()
+        return mock_run
+
+    def test_lock_held_enqueues_and_exits(self, git_vault: Path) -> None:
+        import fcntl
+
+        file_path = git_vault / "self" / "goals.md"
+        file_path.write_text("goals", encoding="utf-8")
+        with open(git_vault / ".git" / auto_commit._LOCK_NAME, "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            mock_run = self._run_main(git_vault, file_path)
+
+        mock_run.assert_not_called()
+        queue = git_vault / ".git" / auto_commit._QUEUE_NAME
+        assert queue.read_text(encoding="utf-8") == "self/goals.md\n"
+
+    def test_owner_commits_queued_paths_in_one_batch(self, git_vault: Path) -> None:
+        file_path = git_vault / "self" / "goals.md"
+        file_path.write_text("goals", encoding="utf-8")
+        queue = git_vault / ".git" / auto_commit._QUEUE_NAME
+        queue.write_text("notes/a.md\nself/goals.md\n", encoding="utf-8")
+
+        mock_run = self._run_main(git_vault, file_path)
+
+        add_call = mock_run.call_args_list[0]
+        assert add_call.args[0][:2] == ["git", "add"]
+        assert add_call.kwargs["input"] == "notes/a.md\0self/goals.md"
+        commit_cmd = mock_run.call_args_list[1].args[0]
+        assert "auto: batch (2 files)" in commit_cmd
+        assert queue.read_text(encoding="utf-8") == ""
+
+    def test_parent_returns_after_detach(self, git_vault: Path) -> None:
+        file_path = git_vault / "self" / "goals.md"
+        file_path.write_text("goals", encoding="utf-8")
+        mock_run = self._run_main(git_vault, file_path, detach=False)
+        mock_run.assert_not_called()
+
+    def test_recent_sweep_skipped_for_committed_path(self, git_vault: Path) -> None:
+        (git_vault / ".git" / auto_commit._SWEPT_NAME).touch()
+        file_path = git_vault / "self" / "goals.md"
+        file_path.write_text("goals", encoding="utf-8")
+
+        mock_run = self._run_main(git_vault, file_path)
+
+        cmds = [c.args[0] for c in mock_run.call_args_list]
+        assert len(cmds) == 2
+        assert "auto: vault update" not in cmds[1]
+
+    def test_untracked_sweep_dir_write_forces_sweep(self, git_vault: Path) -> None:
+        (git_vault / ".git" / auto_commit._SWEPT_NAME).touch()
+        file_path = git_vault / "notes" / "claim.md"
+        file_path.write_text("claim", encoding="utf-8")
+
+        mock_run = self._run_main(
+            git_vault, file_path, status=b"?? notes/claim.md\0"
+        )
+
+        cmds = [c.args[0] for c in mock_run.call_args_list]
+        assert cmds[0][:2] == ["git", "status"]
+        assert "auto: vault update" in cmds[-1]
+        assert not (git_vault / ".git" / auto_commit._SWEEP_FLAG_NAME).exists()
+
+    def test_commits_in_real_repo(self, git_vault: Path) -> None:
+        import shutil
+
+        shutil.rmtree(git_vault / ".git")
+        subprocess.run(["git", "init", "-q"], cwd=git_vault, check=True)
+        for key, val in (("user.name", "Test"), ("user.email", "t@example.com")):
+            subprocess.run(["git", "config", key, val], cwd=git_vault, check=True)
+        file_path = git_vault / "self" / "goals.md"
+        file_path.write_text("goals", encoding="utf-8")
+
+        with (
+            patch("auto_commit.load_config", return_value={"git_auto_commit": True}),
+            patch("auto_commit.resolve_vault", return_value=git_vault),
+            patch("sys.stdin", io.StringIO(_hook_stdin(str(file_path)))),
+            patch("auto_commit._detach", return_value=True),
+            patch("auto_commit._DEBOUNCE_SECONDS", 0),
+        ):
+            auto_commit.main()
+
+        log = subprocess.run(
+            ["git", "log", "--format=%s"],
+            cwd=git_vault,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.splitlines()
+        assert log[-1] == "auto: update self/goals.md"
+        status = subprocess.run(
+            ["git", "status", "--porcelain"],
+            cwd=git_vault,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        assert "self/" not in status
+
+
+class TestIsGitRepo:
+    def test_uses_pygit2_when_available(self, tmp_path: Path) -> None:
+        fake = MagicMock()
+        fake.discover_repository.return_value = str(tmp_path / ".git")
+        with (
+            patch("auto_commit.pygit2", fake),
+            patch("auto_commit.subprocess.run") as mock_run,
+        ):
+            assert auto_commit._is_git_repo(tmp_path) is True
+        mock_run.assert_not_called()
+        fake.discover_repository.assert_called_once_with(str(tmp_path))
+
+    def test_pygit2_no_repo(self, tmp_path: Path) -> None:
+        fake = MagicMock()
+        fake.discover_repository.return_value = None
+        with patch("auto_commit.pygit2", fake):
+            assert auto_commit._is_git_repo(tmp_path) is False
+
+    def test_falls_back_to_git_cli(self, tmp_path: Path) -> None:
+        with (
+            patch("auto_commit.pygit2", None),
+            patch(
+                "engram_r.git_cache.subprocess.run",
+                side_effect=subprocess.CalledProcessError(128, "git"),
+            ),
+        ):
+            assert auto_commit._is_git_repo(tmp_path) is False
+
+
+class TestSweepRealRepo:
+    def test_sweep_commits_changes_and_respects_gitignore(self, vault: Path) -> None:
+        subprocess.run(["git", "init", "-q"], cwd=vault, check=True)
+        for key, val in (("user.name", "Test"), ("user.email", "t@example.com")):
+            subprocess.run(["git", "config", key, val], cwd=vault, check=True)
+        (vault / ".gitignore").write_text("*.tmp\n", encoding="utf-8")
+        (vault / "notes" / "sub").mkdir()
+        (vault / "notes" / "sub" / "a claim.md").write_text("x", encoding="utf-8")
+        (vault / "notes" / "scratch.tmp").write_text("x", encoding="utf-8")
+
+        auto_commit._sweep(vault)
+
+        files = subprocess.run(
+            ["git", "ls-files"], cwd=vault, capture_output=True, text=True, check=True
+        ).stdout.splitlines()
+        assert "notes/sub/a claim.md" in files
+        assert "ops/config.yaml" in files
+        assert "notes/scratch.tmp" not in files
+
+    def test_sweep_vault_in_repo_subdirectory(self, tmp_path: Path) -> None:
+        repo = tmp_path / "repo"
+        vault = repo / "vaults" / "main"
+        (vault / "notes").mkdir(parents=True)
+        subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+        for key, val in (("user.name", "Test"), ("user.email", "t@example.com")):
+            subprocess.run(["git", "config", key, val], cwd=repo, check=True)
+        (vault / "notes" / "a.md").write_text("x", encoding="utf-8")
+
+        auto_commit._sweep(vault)
+
+        files = subprocess.run(
+            ["git", "ls-files"], cwd=repo, capture_output=True, text=True, check=True
+        ).stdout.splitlines()
+        assert files == ["vaults/main/notes/a.md"]
@@ -10,7 +10,9 @@ import yaml
 # Import from scripts directory
 import sys
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[1] / "scripts" / "maintenance")
+)
 
 from backfill_provenance import backfill_note, infer_source_class
 
@@ -119,3 +121,51 @@ class TestBackfillNote:
         backfill_note(note)
         content = note.read_text(encoding="utf-8")
         assert "Important body with [[wiki links]] preserved." in content
+
+    def test_skips_note_without_frontmatter(self, tmp_path: Path) -> None:
+        note = tmp_path / "plain.md"
+        note.write_text("No frontmatter here.\n" * 2000, encoding="utf-8")
+        assert backfill_note(note) is None
+
+    def test_long_body_preserved(self, tmp_path: Path) -> None:
+        note = tmp_path / "test.md"
+        body = "Line with unicode éè text.\n" * 2000
+        self._write_note(
+            note,
+            {"description": "Test", "type": "claim", "source": "[[EXP-001-x]]"},
+            body=body,
+        )
+        result = backfill_note(note)
+        assert result is not None
+        assert result["source_class"] == "empirical"
+        content = note.read_text(encoding="utf-8")
+        assert content.endswith(body + "\n")
+        assert 'source_class: "empirical"' in content
+
+    def test_frontmatter_longer_than_prefix(self, tmp_path: Path) -> None:
+        note = tmp_path / "test.md"
+        self._write_note(
+            note,
+            {
+                "description": "x" * 10000,
+                "type": "claim",
+                "source": "[[H-001-long]]",
+            },
+        )
+        result = backfill_note(note)
+        assert result is not None
+        assert result["source_class"] == "hypothesis"
+        fm_text = note.read_text(encoding="utf-8").split("---\n")[1]
+        assert yaml.safe_load(fm_text)["verified_by"] == "agent"
+
+    def test_crlf_line_endings(self, tmp_path: Path) -> None:
+        note = tmp_path / "test.md"
+        note.write_bytes(
+            b'---\r\ndescription: "crlf"\r\nsource: "[[EXP-001]]"\r\n---\r\n'
+            b"Body.\r\n"
+        )
+        result = backfill_note(note)
+        assert result is not None
+        assert result["source_class"] == "empirical"
+        fm_text = note.read_text(encoding="utf-8").split("---\n")[1]
+        assert yaml.safe_load(fm_text)["verified_by"] == "agent"
@@ -64,6 +64,12 @@ class TestStripWikiLinks:
     def test_nested_brackets(self) -> None:
         assert _strip_wiki_links("[[x]]") == "x"
 
+    def test_empty_display_left_alone(self) -> None:
+        assert _strip_wiki_links("[[a|]] and [[|b]]") == "[[a|]] and [[|b]]"
+
+    def test_display_may_contain_pipe(self) -> None:
+        assert _strip_wiki_links("[[a|b|c]]") == "b|c"
+
 
 class TestExportClaim:
     """Test single claim export."""
@@ -178,6 +184,22 @@ class TestExportClaims:
         claims = export_claims(vault, source_vault="test", now=_NOW)
         assert len(claims) == 3  # bad note skipped
 
+    def test_skips_unreadable_notes(self, vault: Path) -> None:
+        (vault / "notes" / "dir.md").mkdir()
+        claims = export_claims(vault, source_vault="test", now=_NOW)
+        assert len(claims) == 3
+
+    def test_sorted_order_kept(self, vault: Path) -> None:
+        notes = vault / "notes"
+        for i in range(40):
+            (notes / f"bulk-{i:02d}.md").write_text(
+                f'---\ndescription: "{i}"\n---\n\nBody {i}.\n'
+            )
+        claims = export_claims(vault, source_vault="test", now=_NOW)
+        titles = [c.title for c in claims]
+        assert titles == sorted(titles)
+        assert len(titles) == 43
+
 
 class TestYamlRoundTrip:
     """Test YAML serialization/deserialization."""
@@ -236,6 +258,22 @@ class TestYamlRoundTrip:
         result = load_exported_claims("[]")
         assert result == []
 
+    def test_export_readable_by_pure_python_loader(self) -> None:
+        from dataclasses import asdict
+
+        claims = [
+            ExportedClaim(
+                title="Ünïcode claim: with a colon",
+                tags=["x", "y"],
+                body="Line one.\n\nLine two is long " + "word " * 40 + "\n",
+                verified_date="2026-02-25",
+            )
+        ]
+        exported = export_to_yaml(claims)
+        assert yaml.load(exported, Loader=yaml.SafeLoader) == [
+            asdict(c) for c in claims
+        ]
+
 
 class TestExportPiiSanitization:
     """PII sanitization on export."""
@@ -353,3 +353,70 @@ class TestDaemonConfigBotAuthority:
         assert cfg.bot.authority.owner_ids == ()
         assert cfg.bot.authority.public_access is True
         assert cfg.bot.authority.max_per_user_per_minute == 5
+
+
+# ---------------------------------------------------------------------------
+# Load caching
+# ---------------------------------------------------------------------------
+
+
+class TestLoadConfigCache:
+    def _write(self, path: Path, goals: list[str]) -> None:
+        path.write_text(yaml.dump({"goals_priority": goals}))
+
+    def test_unchanged_file_parsed_once(self, tmp_path: Path, monkeypatch):
+        import engram_r.daemon_config as daemon_config
+
+        cfg_path = tmp_path / "daemon-config.yaml"
+        self._write(cfg_path, ["g1"])
+        calls = []
+        real = daemon_config._build_config
+        monkeypatch.setattr(
+            daemon_config,
+            "_build_config",
+            lambda raw: calls.append(1) or real(raw),
+        )
+        for _ in range(3):
+            assert load_config(cfg_path).goals_priority == ["g1"]
+        assert len(calls) == 1
+
+    def test_reloads_after_edit(self, tmp_path: Path):
+        cfg_path = tmp_path / "daemon-config.yaml"
+        self._write(cfg_path, ["g1"])
+        assert load_config(cfg_path).goals_priority == ["g1"]
+        self._write(cfg_path, ["g2", "g3"])
+        assert load_config(cfg_path).goals_priority == ["g2", "g3"]
+
+    def test_callers_get_copies(self, tmp_path: Path):
+        cfg_path = tmp_path / "daemon-config.yaml"
+        self._write(cfg_path, ["g1"])
+        load_config(cfg_path).goals_priority.append("mutated")
+        assert load_config(cfg_path).goals_priority == ["g1"]
+
+    def test_missing_file_raises(self, tmp_path: Path):
+        with pytest.raises(FileNotFoundError):
+            load_config(tmp_path / "absent.yaml")
+
+    def test_malformed_yaml_raises(self, tmp_path: Path):
+        cfg_path = tmp_path / "daemon-config.yaml"
+        cfg_path.write_text("goals_priority: [unclosed\n")
+        with pytest.raises(yaml.YAMLError):
+            load_config(cfg_path)
+
+
+# ---------------------------------------------------------------------------
+# Slots
+# ---------------------------------------------------------------------------
+
+
+class TestSlots:
+    def test_config_instances_have_no_dict(self):
+        config = DaemonConfig()
+        assert not hasattr(config, "__dict__")
+        assert not hasattr(config.bot, "__dict__")
+
+    def test_still_frozen(self):
+        import dataclasses
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            DaemonConfig().goals_priority = []
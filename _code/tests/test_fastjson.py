@@ -0,0 +1,49 @@
+"""Tests for engram_r._fastjson -- orjson fast path with stdlib fallback."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from engram_r import _fastjson
+
+_SAMPLE = [
+    {"id": "claim-001", "status": "pending", "phases": ["create"], "n": 3},
+    {"id": "café", "nested": {"ok": True, "none": None}, "empty": []},
+]
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request):
+    if request.param == "orjson":
+        if _fastjson.orjson is None:
+            pytest.skip("orjson not installed")
+        yield
+    else:
+        with patch.object(_fastjson, "orjson", None):
+            yield
+
+
+class TestDumps:
+    def test_indent_matches_stdlib(self, backend) -> None:
+        expected = json.dumps(_SAMPLE, indent=2, ensure_ascii=False).encode()
+        assert _fastjson.dumps(_SAMPLE, indent=True) == expected
+
+    def test_compact_matches_stdlib(self, backend) -> None:
+        expected = json.dumps(
+            _SAMPLE, ensure_ascii=False, separators=(",", ":")
+        ).encode()
+        assert _fastjson.dumps(_SAMPLE) == expected
+
+
+class TestLoads:
+    def test_roundtrip_bytes_and_str(self, backend) -> None:
+        raw = _fastjson.dumps(_SAMPLE)
+        assert _fastjson.loads(raw) == _SAMPLE
+        assert _fastjson.loads(raw.decode()) == _SAMPLE
+
+    def test_error_is_stdlib_exception(self, backend) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            _fastjson.loads(b"{not json")
@@ -0,0 +1,82 @@
+"""Tests for engram_r.git_cache."""
+
+from __future__ import annotations
+
+import subprocess
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from engram_r import git_cache, hook_utils
+
+
+def _ok(top: Path) -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(args=[], returncode=0, stdout=f"{top}\n")
+
+
+class TestToplevel:
+    def test_probe_persisted(self, tmp_path: Path) -> None:
+        (tmp_path / ".git").mkdir()
+        with patch(
+            "engram_r.git_cache.subprocess.run", return_value=_ok(tmp_path)
+        ) as mock_run:
+            assert git_cache.toplevel(tmp_path) == tmp_path
+            assert git_cache.toplevel(tmp_path) == tmp_path
+        assert mock_run.call_count == 1
+
+    def test_removed_git_dir_reprobes(self, tmp_path: Path) -> None:
+        (tmp_path / ".git").mkdir()
+        with patch("engram_r.git_cache.subprocess.run", return_value=_ok(tmp_path)):
+            git_cache.toplevel(tmp_path)
+        (tmp_path / ".git").rmdir()
+        with patch(
+            "engram_r.git_cache.subprocess.run",
+            side_effect=subprocess.CalledProcessError(128, "git"),
+        ) as mock_run:
+            assert git_cache.toplevel(tmp_path) is None
+        assert mock_run.call_count == 1
+
+    def test_expired_entry_reprobes(self, tmp_path: Path) -> None:
+        (tmp_path / ".git").mkdir()
+        hook_utils._update_ctx(
+            "git_probe",
+            str(tmp_path),
+            {"toplevel": str(tmp_path), "checked": time.time() - 3600},
+        )
+        with patch(
+            "engram_r.git_cache.subprocess.run", return_value=_ok(tmp_path)
+        ) as mock_run:
+            assert git_cache.toplevel(tmp_path) == tmp_path
+        assert mock_run.call_count == 1
+
+
+class TestIsRepo:
+    def test_negative_result_cached(self, tmp_path: Path) -> None:
+        with patch(
+            "engram_r.git_cache.subprocess.run",
+            side_effect=subprocess.CalledProcessError(128, "git"),
+        ) as mock_run:
+            assert git_cache.is_repo(tmp_path) is False
+            assert git_cache.is_repo(tmp_path) is False
+        assert mock_run.call_count == 1
+
+    def test_real_repository(self, tmp_path: Path) -> None:
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        assert git_cache.is_repo(tmp_path) is True
+
+
+class TestChangedPaths:
+    def test_pathspec_and_untracked_listing(self, tmp_path: Path) -> None:
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        (tmp_path / "notes" / "sub").mkdir(parents=True)
+        (tmp_path / "notes" / "sub" / "a b.md").write_text("x", encoding="utf-8")
+        (tmp_path / "other.md").write_text("x", encoding="utf-8")
+
+        assert git_cache.changed_paths(tmp_path, ["notes"]) == ["notes/"]
+        assert git_cache.changed_paths(tmp_path, ["notes"], all_untracked=True) == [
+            "notes/sub/a b.md"
+        ]
+        assert "other.md" in git_cache.changed_paths(tmp_path)
+
+    def test_not_a_repo(self, tmp_path: Path) -> None:
+        assert git_cache.changed_paths(tmp_path / "missing") == []
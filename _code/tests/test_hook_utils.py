@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import os
+import time
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+from engram_r import hook_utils
 from engram_r.hook_utils import find_vault_root, load_config, resolve_vault
 
 
@@ -45,17 +47,41 @@ class TestFindVaultRoot:
         target.mkdir()
         with patch.dict(os.environ, {"PROJECT_DIR": str(target)}):
             # Start from a path with no marker and no git
-            with patch("engram_r.hook_utils.subprocess.run", side_effect=FileNotFoundError):
+            with patch(
+                "engram_r.git_cache.subprocess.run", side_effect=FileNotFoundError
+            ):
                 result = find_vault_root(start=tmp_path / "nowhere")
                 assert result == target
 
+    def test_vault_root_env_skips_walk_and_git(
+        self, vault: Path, tmp_path: Path
+    ) -> None:
+        target = tmp_path / "pinned"
+        target.mkdir()
+        with (
+            patch.dict(os.environ, {"ENGRAMR_VAULT_ROOT": str(target)}),
+            patch("engram_r.git_cache.subprocess.run") as mock_run,
+        ):
+            assert find_vault_root(start=vault) == target
+        mock_run.assert_not_called()
+
+    def test_relative_vault_root_env_made_absolute(
+        self, vault: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        (tmp_path / "pinned").mkdir()
+        monkeypatch.chdir(tmp_path)
+        with patch.dict(os.environ, {"ENGRAMR_VAULT_ROOT": "pinned"}):
+            result = find_vault_root(start=vault)
+        assert result.is_absolute()
+        assert result == Path(os.path.realpath(tmp_path / "pinned"))
+
     def test_git_fallback(self, tmp_path: Path) -> None:
         """Falls back to git rev-parse when no marker and no PROJECT_DIR."""
         import subprocess as sp
 
         with (
             patch.dict(os.environ, {}, clear=False),
-            patch("engram_r.hook_utils.subprocess.run") as mock_run,
+            patch("engram_r.git_cache.subprocess.run") as mock_run,
         ):
             # Remove PROJECT_DIR if present
             os.environ.pop("PROJECT_DIR", None)
@@ -69,7 +95,7 @@ class TestFindVaultRoot:
         """Last resort: return _CODE_DIR.parent."""
         with (
             patch.dict(os.environ, {}, clear=False),
-            patch("engram_r.hook_utils.subprocess.run", side_effect=FileNotFoundError),
+            patch("engram_r.git_cache.subprocess.run", side_effect=FileNotFoundError),
         ):
             os.environ.pop("PROJECT_DIR", None)
             result = find_vault_root(start=tmp_path / "nowhere")
@@ -92,6 +118,74 @@ class TestLoadConfig:
         assert config == {}
 
 
+class TestConfigCache:
+    def test_returns_independent_copies(self, vault: Path) -> None:
+        first = load_config(vault)
+        first["schema_validation"] = False
+        assert load_config(vault)["schema_validation"] is True
+
+    def test_reparses_after_edit(self, vault: Path) -> None:
+        assert load_config(vault)["schema_validation"] is True
+        (vault / "ops" / "config.yaml").write_text(
+            "schema_validation: false\nextra: 1\n", encoding="utf-8"
+        )
+        assert load_config(vault) == {"schema_validation": False, "extra": 1}
+
+    def test_persisted_parse_reused_by_next_process(self, vault: Path) -> None:
+        load_config(vault)
+        hook_utils._load_config_cached.cache_clear()  # simulate a new process
+        with patch("yaml.load", side_effect=AssertionError):
+            assert load_config(vault) == {"schema_validation": True}
+
+    def test_dates_not_persisted(self, vault: Path) -> None:
+        (vault / "ops" / "config.yaml").write_text(
+            "since: 2026-01-01\n", encoding="utf-8"
+        )
+        load_config(vault)
+        ctx = hook_utils._read_ctx()
+        assert str(vault / "ops" / "config.yaml") not in ctx.get("config", {})
+
+
+    def test_warm_fire_skips_yaml_import(self, vault: Path) -> None:
+        import sys
+
+        load_config(vault)
+        hook_utils._load_config_cached.cache_clear()
+        with patch.dict(sys.modules, {"yaml": None}):
+            # Importing yaml would raise ImportError here
+            assert load_config(vault) == {"schema_validation": True}
+
+
+class TestGitToplevelCache:
+    def test_persisted_across_processes(self, tmp_path: Path) -> None:
+        import subprocess as sp
+
+        (tmp_path / ".git").mkdir()
+        os.environ.pop("PROJECT_DIR", None)
+        with patch("engram_r.git_cache.subprocess.run") as mock_run:
+            mock_run.return_value = sp.CompletedProcess(
+                args=[], returncode=0, stdout=str(tmp_path) + "\n"
+            )
+            assert find_vault_root(start=tmp_path / "nowhere") == tmp_path
+            hook_utils._find_vault_root_cached.cache_clear()
+            assert find_vault_root(start=tmp_path / "nowhere") == tmp_path
+        assert mock_run.call_count == 1
+
+    def test_stale_entry_ignored(self, tmp_path: Path) -> None:
+        hook_utils._update_ctx(
+            "git_probe",
+            os.getcwd(),
+            {"toplevel": str(tmp_path / "gone"), "checked": time.time()},
+        )
+        with (
+            patch.dict(os.environ, {}, clear=False),
+            patch("engram_r.git_cache.subprocess.run", side_effect=FileNotFoundError),
+        ):
+            os.environ.pop("PROJECT_DIR", None)
+            result = find_vault_root(start=tmp_path / "nowhere")
+        assert result != tmp_path / "gone"
+
+
 class TestResolveVault:
     def test_config_vault_root_takes_priority(self, tmp_path: Path) -> None:
         target = tmp_path / "custom"
@@ -104,3 +198,41 @@ class TestResolveVault:
         with patch("engram_r.hook_utils.find_vault_root", return_value=vault):
             result = resolve_vault({})
             assert result == vault
+
+
+class TestDetach:
+    def test_foreground_env_skips_fork(self) -> None:
+        with patch("engram_r.hook_utils.os.fork") as mock_fork:
+            assert hook_utils.detach() is True
+        mock_fork.assert_not_called()
+
+    def test_parent_gets_false(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("ENGRAMR_HOOK_FOREGROUND")
+        with (
+            patch("engram_r.hook_utils.os.fork", return_value=4242) as mock_fork,
+            patch("engram_r.hook_utils.os.setsid") as mock_setsid,
+        ):
+            assert hook_utils.detach() is False
+        mock_fork.assert_called_once()
+        mock_setsid.assert_not_called()
+
+
+class TestVaultRelpath:
+    def test_inside(self, tmp_path: Path) -> None:
+        rel = hook_utils.vault_relpath(tmp_path / "self" / "goals.md", tmp_path)
+        assert rel == os.path.join("self", "goals.md")
+
+    def test_sibling_prefix_is_outside(self, tmp_path: Path) -> None:
+        vault = tmp_path / "vault"
+        assert hook_utils.vault_relpath(tmp_path / "vault-abc" / "x.md", vault) is None
+
+    def test_vault_itself(self, tmp_path: Path) -> None:
+        assert hook_utils.vault_relpath(tmp_path, tmp_path) == ""
+
+    def test_through_symlink(self, tmp_path: Path) -> None:
+        vault = tmp_path / "vault"
+        (vault / "notes").mkdir(parents=True)
+        link = tmp_path / "link"
+        link.symlink_to(vault)
+        rel = hook_utils.vault_relpath(link / "notes" / "a.md", vault)
+        assert rel == os.path.join("notes", "a.md")
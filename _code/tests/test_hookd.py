@@ -0,0 +1,211 @@
+"""Tests for engram_r.hookd and scripts/hooks/hook_client.py."""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from engram_r import hookd
+
+_CODE_DIR = Path(__file__).resolve().parent.parent
+_CLIENT = _CODE_DIR / "scripts" / "hooks" / "hook_client.py"
+
+
+class TestParseRequest:
+    def test_round_trip(self) -> None:
+        data = b"pipeline_bridge\0/vault\0A=1\0B=x=y\0\0" + b'{"a": "x\0y"}'
+        hook, cwd, env, payload = hookd.parse_request(data)
+        assert (hook, cwd, env) == ("pipeline_bridge", "/vault", {"A": "1", "B": "x=y"})
+        assert payload == b'{"a": "x\0y"}'
+
+    def test_empty_environment(self) -> None:
+        hook, cwd, env, payload = hookd.parse_request(b"auto_commit\0/\0\0{}")
+        assert (hook, cwd, env, payload) == ("auto_commit", "/", {}, b"{}")
+
+    def test_unknown_hook(self) -> None:
+        with pytest.raises(ValueError, match="unknown hook"):
+            hookd.parse_request(b"validate_queue\0/\0\0{}")
+
+    def test_truncated(self) -> None:
+        with pytest.raises(ValueError, match="malformed"):
+            hookd.parse_request(b"auto_commit\0/")
+
+    def test_unterminated_environment(self) -> None:
+        with pytest.raises(ValueError, match="malformed"):
+            hookd.parse_request(b"auto_commit\0/\0A=1")
+
+
+class TestSocketName:
+    def test_keyed_on_code_tree(self) -> None:
+        assert hookd.SOCKET_NAME != "hookd.sock"
+        assert hookd.SOCKET_NAME.startswith("hookd-")
+        assert hookd.SOCKET_NAME[len("hookd-") : -len(".sock")] in hookd.LOCK_NAME
+
+    def test_client_agrees(self) -> None:
+        env = {**os.environ, "PYTHONPATH": ""}
+        out = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import runpy, sys; "
+                f"g = runpy.run_path({str(_CLIENT)!r}); "
+                "print(g['_SOCKET_NAME'])",
+            ],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert out.stdout.strip() == hookd.SOCKET_NAME
+
+
+class TestExitStatus:
+    def test_codes(self, capsys: pytest.CaptureFixture[str]) -> None:
+        assert hookd._exit_status(None) == 0
+        assert hookd._exit_status(2) == 2
+        assert hookd._exit_status(256) == 0
+        assert hookd._exit_status("bad input") == 1
+        assert "bad input" in capsys.readouterr().err
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="daemon needs fork")
+class TestDaemonRoundTrip:
+    @pytest.fixture
+    def vault(self, tmp_path: Path) -> Path:
+        v = tmp_path / "vault"
+        (v / "_research" / "literature").mkdir(parents=True)
+        (v / "ops" / "queue").mkdir(parents=True)
+        (v / ".arscontexta").write_text("marker", encoding="utf-8")
+        (v / "ops" / "config.yaml").write_text(
+            "pipeline_bridge_log: false\n", encoding="utf-8"
+        )
+        return v
+
+    def _fire(
+        self, vault: Path, env: dict, hook: str, payload: dict
+    ) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, str(_CLIENT), hook],
+            input=json.dumps(payload),
+            cwd=vault,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+
+    def _env(self) -> dict:
+        env = {
+            **os.environ,
+            "ENGRAMR_HOOKD_IDLE": "5",
+            "PYTHONPATH": str(_CODE_DIR / "src"),
+        }
+        env.pop("PROJECT_DIR", None)
+        return env
+
+    def _wait_for_socket(self, env: dict) -> None:
+        sock = Path(env["ENGRAMR_CACHE_DIR"]) / hookd.SOCKET_NAME
+        deadline = time.monotonic() + 60
+        while not sock.exists() and time.monotonic() < deadline:
+            time.sleep(0.1)
+        assert sock.exists()
+
+    def test_first_fire_inline_then_daemon(self, vault: Path) -> None:
+        env = self._env()
+        payload = {
+            "tool_name": "Write",
+            "tool_input": {
+                "file_path": str(vault / "_research" / "literature" / "2026-a.md")
+            },
+        }
+
+        first = self._fire(vault, env, "pipeline_bridge", payload).stdout
+        assert "[Pipeline Bridge]" in first
+
+        self._wait_for_socket(env)
+        second = self._fire(vault, env, "pipeline_bridge", payload).stdout
+        assert second == first
+        log = Path(env["ENGRAMR_CACHE_DIR"]) / hookd.LOG_NAME
+        assert "hookd:" not in log.read_text(encoding="utf-8")
+
+    def test_daemon_writes_both_streams(self, vault: Path) -> None:
+        """validate_write answers on stdout and stderr and ends in sys.exit."""
+        env = self._env()
+        payload = {
+            "tool_name": "Write",
+            "tool_input": {
+                "file_path": str(vault / "ops" / "methodology" / "a" / "b.md"),
+                "content": "no frontmatter\n",
+            },
+        }
+
+        first = self._fire(vault, env, "validate_write", payload)
+        assert "Methodology source file" in first.stderr
+
+        self._wait_for_socket(env)
+        second = self._fire(vault, env, "validate_write", payload)
+        assert (second.stdout, second.stderr) == (first.stdout, first.stderr)
+
+    def test_client_environment_reaches_hook(self, vault: Path) -> None:
+        """The worker sees each fire's environment, not the daemon's."""
+        env = self._env()
+        env.pop("ENGRAMR_IDENTITY_UNLOCK", None)
+        payload = {
+            "tool_name": "Write",
+            "tool_input": {
+                "file_path": str(vault / "self" / "identity.md"),
+                "content": "---\ndescription: x\n---\n",
+            },
+        }
+
+        first = self._fire(vault, env, "validate_write", payload)
+        assert '"block"' in first.stdout
+
+        self._wait_for_socket(env)
+        unlocked = self._fire(
+            vault, {**env, "ENGRAMR_IDENTITY_UNLOCK": "1"}, "validate_write", payload
+        )
+        assert '"block"' not in unlocked.stdout
+        locked = self._fire(vault, env, "validate_write", payload)
+        assert '"block"' in locked.stdout
+
+    def test_no_status_falls_back_inline(self, vault: Path) -> None:
+        """A daemon that drops the fire without a status must not lose it."""
+        env = self._env()
+        cache = Path(env["ENGRAMR_CACHE_DIR"])
+        cache.mkdir(parents=True, exist_ok=True)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(cache / hookd.SOCKET_NAME))
+        server.listen(1)
+
+        def _drop() -> None:
+            conn, _ = server.accept()
+            conn.recv(65536)
+            conn.close()
+
+        payload = {
+            "tool_name": "Write",
+            "tool_input": {
+                "file_path": str(vault / "_research" / "literature" / "b.md")
+            },
+        }
+        # Hold the daemon lock so the client's respawn leaves our socket alone
+        with open(cache / hookd.LOCK_NAME, "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            t = threading.Thread(target=_drop)
+            t.start()
+            try:
+                out = self._fire(vault, env, "pipeline_bridge", payload).stdout
+            finally:
+                t.join(timeout=30)
+                server.close()
+        assert "[Pipeline Bridge]" in out
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import errno
 import subprocess
 import sys
 from pathlib import Path
@@ -228,6 +229,25 @@ class TestScaffold:
         )
         assert not (target_path / "_code" / ".venv").exists()
 
+    def test_excludes_nested_caches_from_code_copy(
+        self, source_vault: Path, target_path: Path
+    ) -> None:
+        pkg = source_vault / "_code" / "src" / "engram_r"
+        (pkg / "__pycache__").mkdir()
+        (pkg / "__pycache__" / "mod.cpython-311.pyc").write_bytes(b"\0")
+        (pkg / "mod.py").write_text("X = 1\n")
+
+        init_vault.scaffold(
+            target_path,
+            source_vault,
+            vault_name="Test",
+            init_git=False,
+            register=False,
+        )
+        dst = target_path / "_code" / "src" / "engram_r"
+        assert (dst / "mod.py").read_text() == "X = 1\n"
+        assert not (dst / "__pycache__").exists()
+
     def test_creates_gitignore(self, source_vault: Path, target_path: Path) -> None:
         init_vault.scaffold(
             target_path,
@@ -459,3 +479,143 @@ class TestStarterSkills:
     def test_no_overlap_between_starter_and_full(self) -> None:
         overlap = set(init_vault._STARTER_SKILLS) & set(init_vault._FULL_SKILLS)
         assert not overlap, f"Overlapping skills: {overlap}"
+
+
+class TestFastCopy:
+    """_fastcopy() copies contents and metadata whichever primitive works."""
+
+    def _source(self, tmp_path: Path) -> Path:
+        src = tmp_path / "src.bin"
+        src.write_bytes(bytes(range(256)) * 1000)
+        src.chmod(0o640)
+        return src
+
+    def test_matches_source(self, tmp_path: Path) -> None:
+        src = self._source(tmp_path)
+        dst = tmp_path / "dst.bin"
+        init_vault._fastcopy(src, dst)
+        assert dst.read_bytes() == src.read_bytes()
+        assert dst.stat().st_mode == src.stat().st_mode
+        assert dst.stat().st_mtime_ns == src.stat().st_mtime_ns
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        src = tmp_path / "empty"
+        src.touch()
+        dst = tmp_path / "dst"
+        init_vault._fastcopy(src, dst)
+        assert dst.read_bytes() == b""
+
+    def test_falls_back_when_unsupported(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def unsupported(in_fd: int, out_fd: int, count: int) -> int:
+            raise OSError(errno.EXDEV, "cross-device")
+
+        monkeypatch.setattr(init_vault, "_KERNEL_COPIES", [unsupported])
+        monkeypatch.setattr(init_vault, "_COPY_BUFSIZE", 4096)
+        src = self._source(tmp_path)
+        dst = tmp_path / "dst.bin"
+        init_vault._fastcopy(src, dst)
+        assert dst.read_bytes() == src.read_bytes()
+
+    def test_other_errors_propagate(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def no_space(in_fd: int, out_fd: int, count: int) -> int:
+            raise OSError(errno.ENOSPC, "no space")
+
+        monkeypatch.setattr(init_vault, "_KERNEL_COPIES", [no_space])
+        with pytest.raises(OSError):
+            init_vault._fastcopy(self._source(tmp_path), tmp_path / "dst.bin")
+
+
+class TestFindSourceVault:
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        init_vault._find_source_vault.cache_clear()
+        yield
+        init_vault._find_source_vault.cache_clear()
+
+    def test_env_override(
+        self, source_vault: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("ENGRAMR_SOURCE_VAULT", str(source_vault))
+        assert init_vault._find_source_vault() == source_vault
+
+    def test_invalid_override_exits(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("ENGRAMR_SOURCE_VAULT", str(tmp_path / "missing"))
+        with pytest.raises(SystemExit) as exc:
+            init_vault._find_source_vault()
+        assert exc.value.code == 2
+
+    def test_result_cached(
+        self, source_vault: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("ENGRAMR_SOURCE_VAULT", str(source_vault))
+        first = init_vault._find_source_vault()
+        monkeypatch.delenv("ENGRAMR_SOURCE_VAULT")
+        assert init_vault._find_source_vault() is first
+
+
+class TestHardlinkCode:
+    """--hardlink-code links _code/ files instead of copying them."""
+
+    def test_code_files_linked(self, source_vault: Path, target_path: Path) -> None:
+        init_vault.scaffold(
+            target_path,
+            source_vault,
+            init_git=False,
+            register=False,
+            hardlink_code=True,
+        )
+        src = source_vault / "_code" / "pyproject.toml"
+        dst = target_path / "_code" / "pyproject.toml"
+        assert dst.stat().st_ino == src.stat().st_ino
+        # Only _code/ is linked
+        assert (target_path / "CLAUDE.md").stat().st_ino != (
+            source_vault / "CLAUDE.md"
+        ).stat().st_ino
+
+    def test_copied_by_default(self, source_vault: Path, target_path: Path) -> None:
+        init_vault.scaffold(target_path, source_vault, init_git=False, register=False)
+        src = source_vault / "_code" / "pyproject.toml"
+        dst = target_path / "_code" / "pyproject.toml"
+        assert dst.stat().st_ino != src.stat().st_ino
+
+    def test_copies_across_devices(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def cross_device(src: Path, dst: Path) -> None:
+            raise OSError(errno.EXDEV, "cross-device")
+
+        monkeypatch.setattr(init_vault.os, "link", cross_device)
+        src = tmp_path / "src.txt"
+        src.write_text("data")
+        dst = tmp_path / "dst.txt"
+        init_vault._link_or_copy(src, dst)
+        assert dst.read_text() == "data"
+        assert dst.stat().st_ino != src.stat().st_ino
+
+
+class TestProbeSource:
+    """_probe_source() sorts paths into existing dirs and files."""
+
+    def test_classifies_paths(self, source_vault: Path) -> None:
+        (source_vault / "ops" / "scripts").mkdir(parents=True, exist_ok=True)
+        dirs, files = init_vault._probe_source(
+            source_vault,
+            ["ops/scripts", "ops/config.yaml", "CLAUDE.md", "nope/x", "ops/absent"],
+        )
+        assert dirs == {"ops/scripts"}
+        assert files == {"ops/config.yaml", "CLAUDE.md"}
+
+    def test_follows_symlinks(self, tmp_path: Path) -> None:
+        real = tmp_path / "real"
+        real.mkdir()
+        (tmp_path / "link").symlink_to(real)
+        (tmp_path / "dangling").symlink_to(tmp_path / "missing")
+        dirs, files = init_vault._probe_source(tmp_path, ["link", "dangling"])
+        assert dirs == {"link"}
+        assert files == set()
@@ -0,0 +1,47 @@
+"""Tests for the engram_r package namespace."""
+
+from __future__ import annotations
+
+import importlib
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import engram_r
+
+_SRC_DIR = Path(engram_r.__file__).resolve().parent.parent
+
+
+class TestLazyExports:
+    """Plotting names are re-exported without importing plot libraries."""
+
+    def test_import_skips_plot_libraries(self) -> None:
+        code = (
+            "import sys, engram_r\n"
+            "heavy = {'matplotlib', 'pandas', 'scipy', 'engram_r.plot_builders'}\n"
+            "print(sorted(heavy & set(sys.modules)))\n"
+        )
+        env = {**os.environ, "PYTHONPATH": str(_SRC_DIR)}
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        assert result.stdout.strip() == "[]"
+
+    @pytest.mark.parametrize("name", engram_r.__all__)
+    def test_all_names_resolve(self, name: str) -> None:
+        module = importlib.import_module(f"engram_r.{engram_r._LAZY[name]}")
+        assert getattr(engram_r, name) is getattr(module, name)
+
+    def test_unknown_name_raises(self) -> None:
+        with pytest.raises(AttributeError):
+            engram_r.no_such_name  # noqa: B018
+
+    def test_dir_lists_exports(self) -> None:
+        assert set(engram_r.__all__) <= set(dir(engram_r))
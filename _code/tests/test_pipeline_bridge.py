@@ -47,6 +47,14 @@ class TestClassifyFile:
     def test_template_excluded(self) -> None:
         assert pipeline_bridge._classify_file("_code/templates/literature.md") is None
 
+    def test_nested_note_and_index(self) -> None:
+        assert (
+            pipeline_bridge._classify_file("_research/hypotheses/sub/_index.md")
+            == "hypothesis"
+        )
+        assert pipeline_bridge._classify_file("_research/literature/x.md.bak") is None
+        assert pipeline_bridge._classify_file("x/_research/literature/a.md") is None
+
     def test_unrelated_file(self) -> None:
         assert pipeline_bridge._classify_file("notes/some-claim.md") is None
 
@@ -81,6 +89,89 @@ class TestQueueDedup:
         assert not pipeline_bridge._is_already_queued(queue_path, "_research/literature/x.md")
 
 
+class TestQueueIndex:
+    def _write_queue(self, queue_path: Path, tasks: list[dict]) -> None:
+        queue_path.write_text(json.dumps({"tasks": tasks}), encoding="utf-8")
+
+    def test_sidecar_reused_across_processes(self, vault: Path) -> None:
+        queue_path = vault / "ops" / "queue" / "queue.json"
+        self._write_queue(
+            queue_path,
+            [
+                {"source": "_research/literature/x.md", "status": "pending"},
+                {"source": "_research/literature/y.md", "status": "done"},
+            ],
+        )
+        assert pipeline_bridge._pending_queue_count(queue_path) == 1
+        pipeline_bridge._queue_index_cached.cache_clear()
+
+        with patch("pipeline_bridge._fastjson.loads") as mock_loads:
+            assert pipeline_bridge._is_already_queued(
+                queue_path, "_research/literature/x.md"
+            )
+            assert not pipeline_bridge._is_already_queued(
+                queue_path, "_research/literature/y.md"
+            )
+        mock_loads.assert_not_called()
+
+    def test_rebuilt_after_queue_change(self, vault: Path) -> None:
+        queue_path = vault / "ops" / "queue" / "queue.json"
+        self._write_queue(queue_path, [])
+        assert not pipeline_bridge._is_already_queued(
+            queue_path, "_research/literature/x.md"
+        )
+        self._write_queue(
+            queue_path,
+            [{"source": "_research/literature/x.md", "status": "pending"}],
+        )
+        assert pipeline_bridge._is_already_queued(
+            queue_path, "_research/literature/x.md"
+        )
+
+    def test_wrapped_source_matches(self, vault: Path) -> None:
+        queue_path = vault / "ops" / "queue" / "queue.json"
+        self._write_queue(
+            queue_path,
+            [{"source": "[[_research/literature/x.md]]", "status": "pending"}],
+        )
+        assert pipeline_bridge._is_already_queued(
+            queue_path, "_research/literature/x.md"
+        )
+
+    def test_absolute_source_matches(self, vault: Path) -> None:
+        queue_path = vault / "ops" / "queue" / "queue.json"
+        source = str(vault / "_research" / "literature" / "x.md")
+        self._write_queue(queue_path, [{"source": source, "status": "pending"}])
+        assert pipeline_bridge._is_already_queued(
+            queue_path, "_research/literature/x.md"
+        )
+
+    def test_prefix_of_source_does_not_match(self, vault: Path) -> None:
+        queue_path = vault / "ops" / "queue" / "queue.json"
+        self._write_queue(
+            queue_path,
+            [{"source": "_research/literature/x.md.bak", "status": "pending"}],
+        )
+        assert not pipeline_bridge._is_already_queued(
+            queue_path, "_research/literature/x.md"
+        )
+
+
+class TestSourceKey:
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "_research/literature/x.md",
+            "[[_research/literature/x.md]]",
+            "[[_research/literature/x.md|X]]",
+            "/home/u/vault/_research/literature/x.md",
+            " _research/literature/x.md\n",
+        ],
+    )
+    def test_normalizes_to_vault_path(self, source: str) -> None:
+        assert pipeline_bridge._source_key(source) == "_research/literature/x.md"
+
+
 class TestErrorLogging:
     """C3: malformed inputs log warnings to stderr."""
 
@@ -14,11 +14,13 @@ from engram_r.schema_validator import (
     check_title_echo,
     check_topics_footer,
     check_wiki_link_targets,
+    detect_truncated_wiki_links,
     detect_unicode_issues,
     detect_yaml_safety_issues,
     normalize_text,
     sanitize_title,
     strip_html,
+    validate_all,
     validate_filename,
     validate_note,
 )
@@ -1382,3 +1384,79 @@ class TestTopicsFooter:
         result = check_topics_footer(content)
         assert result.valid
         assert result.warnings == []
+
+
+# ---------------------------------------------------------------------------
+# validate_all (fused write-time checks)
+# ---------------------------------------------------------------------------
+
+
+class TestValidateAll:
+    def test_clean_claim_passes_with_source_warning(self):
+        content = _note(
+            [
+                'description: "Some claim"',
+                "type: claim",
+                'verified_by: "agent"',
+                'source_class: "synthesis"',
+                'confidence: "supported"',
+            ]
+        )
+        result = validate_all(content, check_provenance=True)
+        assert result.valid
+        assert any("source" in w for w in result.warnings)
+
+        quiet = validate_all(content, check_provenance=True, check_source=False)
+        assert quiet.valid
+        assert quiet.warnings == []
+
+    def test_yaml_safety_reported_before_schema(self):
+        content = _note(["description: ratio: 3 to 1", "type: claim"])
+        result = validate_all(content)
+        assert not result.valid
+        assert result.errors[0].startswith("YAML safety issue in frontmatter: ")
+
+    def test_unicode_issue(self):
+        decomposed = unicodedata.normalize("NFD", "caf\u00e9")
+        result = validate_all(_note([f'description: "{decomposed}"']))
+        assert result.errors[0].startswith("Unicode normalization issue: ")
+
+    def test_truncated_links_only_when_requested(self):
+        content = _note(['description: "x"'], body="See [[a long title...]]\n")
+        assert validate_all(content).valid
+        result = validate_all(content, check_truncated_links=True)
+        assert result.errors == detect_truncated_wiki_links(content)
+
+    def test_schema_errors_match_validate_note(self):
+        content = _note(["type: hypothesis", "title: T"])
+        assert validate_all(content).errors == validate_note(content).errors
+
+    def test_provenance_errors_match_check_notes_provenance(self):
+        for content in ("no frontmatter\n", "   \n", _note(["type: moc"])):
+            fused = validate_all(content, check_provenance=True)
+            assert fused.errors == check_notes_provenance(content).errors
+
+    def test_no_frontmatter_without_provenance_passes(self):
+        assert validate_all("plain text\n").valid
+
+
+class TestDetectTruncatedWikiLinks:
+    def test_reports_each_link(self):
+        issues = detect_truncated_wiki_links("[[one...]] and [[two...]] [[ok]]")
+        assert len(issues) == 2
+        assert "[[one...]]" in issues[0]
+        assert "[[two...]]" in issues[1]
+
+    def test_clean(self):
+        assert detect_truncated_wiki_links("Some text... and [[valid]]") == []
+
+
+class TestSplitFrontmatter:
+    def test_split(self):
+        from engram_r.schema_validator import _split_frontmatter
+
+        assert _split_frontmatter("---\ntype: claim\n---\nBody\n") == (
+            "type: claim",
+            "Body\n",
+        )
+        assert _split_frontmatter("Body only\n") == (None, "Body only\n")
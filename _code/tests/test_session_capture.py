@@ -109,6 +109,43 @@ class TestExtractSessionInfo:
         })
         assert info["summary"] == "Transcript fallback."
 
+    def test_transcript_single_pass_keeps_latest_message(
+        self, tmp_path: Path
+    ) -> None:
+        transcript = tmp_path / "transcript.jsonl"
+        lines = [
+            json.dumps({"role": "assistant", "content": "First."}),
+            "not json but harmless",
+            json.dumps({"tool_name": "Edit", "tool_input": {"file_path": "/v/b.md"}}),
+            json.dumps({"role": "user", "content": "Thanks."}),
+            json.dumps({"role": "assistant", "content": "Second."}),
+            "{truncated \"role\"",
+        ]
+        transcript.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        info = session_capture._extract_session_info({
+            "session_id": "t",
+            "transcript_path": str(transcript),
+        })
+        assert info["summary"] == "Second."
+        assert info["files_written"] == ["/v/b.md"]
+
+    def test_last_assistant_message_from_tail(self, tmp_path: Path) -> None:
+        transcript = tmp_path / "transcript.jsonl"
+        lines = [
+            '{"role": "assistant", "content": "Older."}',
+            '{"role":"assistant","content":"Compact."}',
+            '{"role": "assistant", "content": [{"type": "text"}]}',
+            '{"role" : "assistant", "content": "   "}',
+            '{"role": "user", "content": "role assistant"}',
+        ]
+        transcript.write_text("\n".join(lines), encoding="utf-8")
+        assert session_capture._last_assistant_message(transcript) == "Compact."
+
+    def test_last_assistant_message_empty_transcript(self, tmp_path: Path) -> None:
+        transcript = tmp_path / "transcript.jsonl"
+        transcript.write_bytes(b"")
+        assert session_capture._last_assistant_message(transcript) == ""
+
     def test_cwd_extracted(self) -> None:
         info = session_capture._extract_session_info({
             "session_id": "t",
@@ -200,6 +237,37 @@ class TestMainWritesSession:
         content = files[0].read_text(encoding="utf-8")
         assert "Completed the task successfully." in content
 
+    def _fire(self, vault: Path, **kwargs) -> None:
+        with (
+            patch(
+                "session_capture.load_config", return_value={"session_capture": True}
+            ),
+            patch("session_capture.resolve_vault", return_value=vault),
+            patch("sys.stdin", io.StringIO(_hook_stdin("sess1234", **kwargs))),
+            patch.object(session_capture, "_slack_session_end"),
+        ):
+            session_capture.main()
+
+    def test_refire_appends_only_new_content(self, vault: Path) -> None:
+        self._fire(vault, last_assistant_message="First stop.")
+        note = next((vault / "ops" / "sessions").glob("*.md"))
+        # Simulate /remember marking the note after the first Stop
+        marked = note.read_text(encoding="utf-8").replace(
+            "---\n", "---\nmined: true\n", 1
+        )
+        note.write_text(marked, encoding="utf-8")
+        first = note.read_text(encoding="utf-8")
+
+        self._fire(vault, last_assistant_message="First stop.")
+        assert note.read_text(encoding="utf-8") == first
+
+        self._fire(vault, last_assistant_message="Second stop.")
+        content = note.read_text(encoding="utf-8")
+        assert content.startswith(first)
+        assert content[len(first) :] == (
+            "\n## Update\n\n### Session Summary\nSecond stop.\n"
+        )
+
     def test_skips_when_disabled(self, vault: Path) -> None:
         with (
             patch("session_capture.load_config", return_value={"session_capture": False}),
@@ -302,6 +370,32 @@ class TestGitFilesChanged:
         result = session_capture._git_files_changed(str(tmp_path))
         assert result == sorted(result)
 
+    def test_rename_and_spaces(self, tmp_path: Path) -> None:
+        import subprocess
+
+        env = {
+            **__import__("os").environ,
+            "GIT_AUTHOR_NAME": "test",
+            "GIT_AUTHOR_EMAIL": "t@t.com",
+            "GIT_COMMITTER_NAME": "test",
+            "GIT_COMMITTER_EMAIL": "t@t.com",
+        }
+        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True)
+        (tmp_path / "old.md").write_text("v1", encoding="utf-8")
+        subprocess.run(["git", "add", "old.md"], cwd=tmp_path, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", "init"],
+            cwd=tmp_path,
+            capture_output=True,
+            env=env,
+        )
+        subprocess.run(
+            ["git", "mv", "old.md", "new.md"], cwd=tmp_path, capture_output=True
+        )
+        (tmp_path / "with space.md").write_text("x", encoding="utf-8")
+        result = session_capture._git_files_changed(str(tmp_path))
+        assert result == ["new.md", "with space.md"]
+
     def test_info_includes_files_changed(self, tmp_path: Path) -> None:
         import subprocess
 
@@ -331,3 +425,57 @@ class TestSessionOutputSections:
         content = files[0].read_text(encoding="utf-8")
         assert "## Files Changed" in content
         assert "## Tool Calls" in content
+
+
+class TestTranscriptCache:
+    def _info(self, transcript: Path) -> dict:
+        return session_capture._extract_session_info({
+            "session_id": "t",
+            "transcript_path": str(transcript),
+        })
+
+    def test_unchanged_transcript_not_reread(self, tmp_path: Path) -> None:
+        transcript = tmp_path / "t.jsonl"
+        transcript.write_text(
+            json.dumps({"tool_name": "Write", "tool_input": {"file_path": "/v/a.md"}})
+            + "\n"
+            + json.dumps({"role": "assistant", "content": "Done."})
+            + "\n",
+            encoding="utf-8",
+        )
+        first = self._info(transcript)
+        with patch.object(session_capture, "_scan_transcript") as mock_scan:
+            second = self._info(transcript)
+        mock_scan.assert_not_called()
+        assert second["files_written"] == first["files_written"] == ["/v/a.md"]
+        assert second["summary"] == "Done."
+
+    def test_grown_transcript_scans_only_tail(self, tmp_path: Path) -> None:
+        transcript = tmp_path / "t.jsonl"
+        head = (
+            json.dumps({"tool_name": "Write", "tool_input": {"file_path": "/v/a.md"}})
+            + "\n"
+        )
+        transcript.write_text(head, encoding="utf-8")
+        self._info(transcript)
+
+        with transcript.open("a", encoding="utf-8") as f:
+            f.write(
+                json.dumps({"tool_name": "Skill", "tool_input": {"skill": "reduce"}})
+                + "\n"
+            )
+            f.write(json.dumps({"role": "assistant", "content": "Later."}) + "\n")
+
+        real_scan = session_capture._scan_transcript
+        starts = []
+
+        def spy(path, *, start=0):
+            starts.append(start)
+            return real_scan(path, start=start)
+
+        with patch.object(session_capture, "_scan_transcript", side_effect=spy):
+            info = self._info(transcript)
+        assert starts == [len(head.encode("utf-8"))]
+        assert info["files_written"] == ["/v/a.md"]
+        assert info["skills_invoked"] == ["/reduce"]
+        assert info["summary"] == "Later."
@@ -91,6 +91,19 @@ def test_load_methodology_empty_file(vault: Path) -> None:
     assert result == ""
 
 
+def test_load_methodology_rereads_after_change(vault: Path) -> None:
+    """The cached parse is dropped once _compiled.md changes on disk."""
+    meth_dir = vault / "ops" / "methodology"
+    meth_dir.mkdir(parents=True)
+    compiled = meth_dir / "_compiled.md"
+    compiled.write_text("# M\nfirst rule\n", encoding="utf-8")
+    assert session_orient._load_methodology(vault) == "first rule"
+    assert session_orient._load_methodology(vault) == "first rule"
+
+    compiled.write_text("# M\nsecond, longer rule\n", encoding="utf-8")
+    assert session_orient._load_methodology(vault) == "second, longer rule"
+
+
 def test_main_includes_methodology(
     vault: Path, compiled_content: str, capsys: pytest.CaptureFixture[str]
 ) -> None:
@@ -167,6 +180,139 @@ def test_vault_state_counts_missing_dirs(tmp_path: Path) -> None:
 # --- Goals.md threads tests ---
 
 
+def test_list_active_goals(vault: Path) -> None:
+    goals = vault / "_research" / "goals"
+    (goals / "b-goal.md").write_text(
+        "---\ntitle: Beta\nstatus: active\n---\nbody\n", encoding="utf-8"
+    )
+    (goals / "a-goal.md").write_text("---\nstatus: active\n---\n", encoding="utf-8")
+    (goals / "c-done.md").write_text("---\nstatus: done\n---\n", encoding="utf-8")
+    (goals / "_index.md").write_text("---\ntitle: Index\n---\n", encoding="utf-8")
+    (goals / "notes.txt").write_text("---\ntitle: Txt\n---\n", encoding="utf-8")
+    assert session_orient._list_active_goals(vault) == ["a-goal", "Beta"]
+
+
+def test_list_active_goals_crlf(vault: Path) -> None:
+    (vault / "_research" / "goals" / "g.md").write_bytes(
+        b"---\r\ntitle: CRLF goal\r\nstatus: active\r\n---\r\nbody\r\n"
+    )
+    assert session_orient._list_active_goals(vault) == ["CRLF goal"]
+
+
+def test_top_hypotheses_stops_after_n_rows(vault: Path) -> None:
+    rows = "".join(f"| {i} | H-{i} | Hyp {i} | {1600 - i} |\r\n" for i in range(1, 50))
+    (vault / "_research" / "hypotheses" / "_index.md").write_text(
+        "# Leaderboard\n\n| Rank | ID | Title | Elo |\n|---|---|---|---|\n" + rows,
+        encoding="utf-8",
+    )
+    assert session_orient._top_hypotheses(vault, n=2) == [
+        "  1. Hyp 1 (Elo 1599)",
+        "  2. Hyp 2 (Elo 1598)",
+    ]
+
+
+def test_top_hypotheses_missing_index(vault: Path) -> None:
+    assert session_orient._top_hypotheses(vault) == []
+
+
+def test_latest_meta_review_picks_newest_name(vault: Path) -> None:
+    mr = vault / "_research" / "meta-reviews"
+    (mr / "2026-01-01-review.md").write_text("no frontmatter", encoding="utf-8")
+    (mr / "2026-02-01-review.md").write_text(
+        "---\ndate: 2026-02-01\nhypotheses_reviewed: 4\nmatches_analyzed: 9\n---\n",
+        encoding="utf-8",
+    )
+    assert session_orient._latest_meta_review(vault) == (
+        "  Latest: 2026-02-01 (4 hypotheses, 9 matches)"
+    )
+
+
+def test_read_frontmatter_spans_second_chunk(tmp_path: Path) -> None:
+    note = tmp_path / "note.md"
+    note.write_text(
+        "---\ntitle: Long\nabstract: " + "x" * 5000 + "\n---\n" + "body" * 5000,
+        encoding="utf-8",
+    )
+    assert session_orient._read_frontmatter(str(note))["title"] == "Long"
+
+
+def test_read_frontmatter_reads_rest_past_window(tmp_path: Path) -> None:
+    note = tmp_path / "note.md"
+    note.write_text(
+        "---\ntitle: Huge\nabstract: " + "y" * 9000 + "\n---\nbody\n",
+        encoding="utf-8",
+    )
+    assert session_orient._read_frontmatter(str(note), limit=4096)["title"] == "Huge"
+
+
+def test_read_frontmatter_crlf(tmp_path: Path) -> None:
+    note = tmp_path / "note.md"
+    note.write_bytes(b"---\r\ntitle: CRLF goal\r\nstatus: active\r\n---\r\nBody.\r\n")
+    assert session_orient._read_frontmatter(str(note)) == {
+        "title": "CRLF goal",
+        "status": "active",
+    }
+
+
+def test_read_frontmatter_crlf_split_across_chunks(tmp_path: Path) -> None:
+    note = tmp_path / "note.md"
+    head = b"---\r\ntitle: Split\r\nabstract: "
+    # Put the closing fence's CR as the last byte of the first chunk
+    pad = b"x" * (4096 - len(head) - 1)
+    note.write_bytes(head + pad + b"\r\n---\r\nBody.\r\n")
+    assert session_orient._read_frontmatter(str(note), limit=4096)["title"] == "Split"
+
+
+def test_read_frontmatter_unclosed(tmp_path: Path) -> None:
+    note = tmp_path / "note.md"
+    note.write_text("---\ntitle: Open\n" + "y" * 9000, encoding="utf-8")
+    assert session_orient._read_frontmatter(str(note), limit=4096) is None
+
+
+def test_fast_frontmatter_flat_fields() -> None:
+    block = "# comment\ntitle: 'Amyloid clearance'\nstatus: active\ndate: 2026-02-01"
+    assert session_orient._fast_frontmatter(block) == {
+        "title": "Amyloid clearance",
+        "status": "active",
+        "date": "2026-02-01",
+    }
+
+
+@pytest.mark.parametrize(
+    "block",
+    [
+        "tags: [a, b]",
+        "status:\n  - active",
+        "title: >\n  folded",
+        "status: active # trailing comment",
+        'title: "tab\\there"',
+        "status: null",
+        "title: 'it''s'",
+    ],
+)
+def test_fast_frontmatter_defers_to_yaml(block: str) -> None:
+    assert session_orient._fast_frontmatter(block) is None
+
+
+def test_read_frontmatter_falls_back_to_yaml(tmp_path: Path) -> None:
+    note = tmp_path / "note.md"
+    note.write_text(
+        "---\ntitle: 'it''s'\ntags: [a, b]\n---\n", encoding="utf-8"
+    )
+    assert session_orient._read_frontmatter(str(note)) == {
+        "title": "it's",
+        "tags": ["a", "b"],
+    }
+
+
+def test_latest_meta_review_missing_dir(tmp_path: Path) -> None:
+    assert session_orient._latest_meta_review(tmp_path) is None
+
+
+def test_latest_meta_review_empty_dir(vault: Path) -> None:
+    assert session_orient._latest_meta_review(vault) is None
+
+
 def test_goals_md_threads(vault: Path) -> None:
     """Extracts bullet lines from goals.md."""
     (vault / "self" / "goals.md").write_text(
@@ -201,6 +347,37 @@ def test_overdue_reminders(vault: Path) -> None:
     assert "Old overdue" in result[0]
 
 
+def test_overdue_reminders_large_crlf_file(vault: Path) -> None:
+    """Files past the mmap threshold give the same lines, CR stripped."""
+    filler = "".join(f"- [x] 2020-01-01: done {i}\r\n" for i in range(300))
+    (vault / "ops" / "reminders.md").write_bytes(
+        (filler + "-\r\n- [ ] 2020-01-01: Old overdue task\r\n").encode("utf-8")
+    )
+    assert session_orient._overdue_reminders(vault) == [
+        "- [ ] 2020-01-01: Old overdue task"
+    ]
+
+
+def test_goals_md_threads_large_file(vault: Path) -> None:
+    bullets = "".join(f"  - thread {i}\n" for i in range(500))
+    (vault / "self" / "goals.md").write_text("# Goals\n-\n" + bullets, encoding="utf-8")
+    result = session_orient._goals_md_threads(vault, max_lines=3)
+    assert result == ["  - thread 0", "  - thread 1", "  - thread 2"]
+
+
+def test_overdue_reminders_date_anywhere_on_line(vault: Path) -> None:
+    (vault / "ops" / "reminders.md").write_text(
+        "- [ ] Renew license by 2020-03-01 (then 2099-01-01)\n"
+        "- [ ] Call back, no date\n"
+        "- [ ] Review due 2099-06-30\n",
+        encoding="utf-8",
+    )
+    assert session_orient._overdue_reminders(vault) == [
+        "- [ ] Renew license by 2020-03-01 (then 2099-01-01)",
+        "- [ ] Call back, no date",
+    ]
+
+
 def test_overdue_reminders_missing(vault: Path) -> None:
     """Missing reminders file returns empty list."""
     result = session_orient._overdue_reminders(vault)
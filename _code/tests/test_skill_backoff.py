@@ -137,3 +137,62 @@ class TestSkillInBackoff:
         in_bo, remaining = skill_in_backoff("x", p)
         assert in_bo is False
         assert remaining == 0
+
+
+class TestStateCache:
+    def test_unchanged_file_parsed_once(self, tmp_path, monkeypatch):
+        from engram_r import _daemon_backoff
+
+        p = tmp_path / "backoff.json"
+        record_failure("x", p)
+        calls = []
+        real_loads = _daemon_backoff._fastjson.loads
+        monkeypatch.setattr(
+            _daemon_backoff._fastjson,
+            "loads",
+            lambda data: calls.append(1) or real_loads(data),
+        )
+        for _ in range(5):
+            skill_in_backoff("x", p)
+        assert len(calls) == 1
+
+    def test_sees_external_rewrite(self, tmp_path):
+        p = tmp_path / "backoff.json"
+        record_failure("x", p)
+        assert read_backoff(p)["x"]["consecutive_failures"] == 1
+        p.write_text(json.dumps({"x": {"consecutive_failures": 42}}))
+        assert read_backoff(p)["x"]["consecutive_failures"] == 42
+
+    def test_callers_get_copies(self, tmp_path):
+        p = tmp_path / "backoff.json"
+        record_failure("x", p)
+        read_backoff(p)["x"]["consecutive_failures"] = 99
+        assert read_backoff(p)["x"]["consecutive_failures"] == 1
+
+
+class TestWriteBackoff:
+    def test_syncs_before_rename(self, tmp_path, monkeypatch):
+        from engram_r import _daemon_backoff
+
+        p = tmp_path / "backoff.json"
+        events = []
+        monkeypatch.setattr(
+            _daemon_backoff, "_datasync", lambda fd: events.append("sync")
+        )
+        real_replace = _daemon_backoff.os.replace
+        monkeypatch.setattr(
+            _daemon_backoff.os,
+            "replace",
+            lambda src, dst: events.append("replace") or real_replace(src, dst),
+        )
+        record_failure("x", p)
+        assert events == ["sync", "replace"]
+        assert not p.with_suffix(".tmp").exists()
+        assert json.loads(p.read_text())["x"]["consecutive_failures"] == 1
+
+    def test_write_error_is_logged(self, tmp_path, caplog):
+        p = tmp_path / "backoff.json"
+        p.with_suffix(".tmp").mkdir()
+        record_failure("x", p)
+        assert not p.exists()
+        assert "Failed to write backoff state" in caplog.text
@@ -19,10 +19,9 @@ _CODE_DIR = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(_CODE_DIR / "src"))
 sys.path.insert(0, str(_CODE_DIR / "scripts" / "hooks"))
 
-from validate_write import (  # noqa: E402
-    _check_truncated_wiki_links,
-    main,
-)
+from validate_write import main  # noqa: E402
+
+from engram_r.schema_validator import detect_truncated_wiki_links  # noqa: E402
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -196,6 +195,27 @@ class TestProvenanceEnforcement:
         # Source warning should be suppressed for Edit tool
         assert "source" not in stderr.lower() or "Topics" in stderr
 
+    def test_claim_missing_source_edit_warns_when_strict(self):
+        content = _note(
+            [
+                'description: "Some insight about mechanisms"',
+                "type: claim",
+                'verified_by: "agent"',
+                'source_class: "synthesis"',
+                'confidence: "preliminary"',
+            ]
+        )
+        config = {
+            "schema_validation": True,
+            "pipeline_compliance": True,
+            "schema_validation_strict": True,
+        }
+        stdout, stderr, exited = _run_hook(
+            "/vault/notes/some insight.md", content, tool_name="Edit", config=config
+        )
+        assert _parse_block_response(stdout) is None
+        assert "Missing 'source' field" in stderr
+
     def test_moc_missing_source_no_warning(self):
         content = _note(
             [
@@ -267,18 +287,16 @@ class TestTruncatedWikiLinks:
     """Truncated [[...]] link detection."""
 
     def test_detects_truncated_link(self):
-        err = _check_truncated_wiki_links("See [[some long title...]] for details")
-        assert err is not None
-        assert "Truncated" in err
-        assert "[[some long title...]]" in err
+        issues = detect_truncated_wiki_links("See [[some long title...]] for details")
+        assert len(issues) == 1
+        assert "Truncated" in issues[0]
+        assert "[[some long title...]]" in issues[0]
 
     def test_no_truncated_link(self):
-        err = _check_truncated_wiki_links("See [[full title]] for details")
-        assert err is None
+        assert detect_truncated_wiki_links("See [[full title]] for details") == []
 
     def test_ellipsis_outside_link_ok(self):
-        err = _check_truncated_wiki_links("Some text... and [[valid link]]")
-        assert err is None
+        assert detect_truncated_wiki_links("Some text... and [[valid link]]") == []
 
     def test_blocks_notes_file_with_truncated_link(self):
         content = _note(
@@ -528,3 +546,54 @@ class TestTitleEchoIntegration:
         # Should NOT be blocked for title echo (not in notes/)
         if resp is not None:
             assert "Title echo" not in resp.get("reason", "")
+
+
+# ---------------------------------------------------------------------------
+# Tests: early exit for non-note writes
+# ---------------------------------------------------------------------------
+
+
+class TestNonNoteEarlyExit:
+    def test_non_md_write_skips_config_and_parse(self):
+        stdin_data = _hook_input("/vault/_code/src/x.py", "notes.md mention")
+        with (
+            patch("validate_write.load_config") as mock_config,
+            patch("validate_write._fastjson.loads") as mock_loads,
+            patch("sys.stdin", io.StringIO(stdin_data)),
+        ):
+            main()
+        mock_config.assert_not_called()
+        mock_loads.assert_not_called()
+
+    def test_md_mentioned_only_in_content_still_skipped(self):
+        stdout, _, exited = _run_hook(
+            "/vault/notes/readme.txt", '---\ntitle: "see x.md"\n---\n'
+        )
+        assert stdout == ""
+        assert not exited
+
+
+# ---------------------------------------------------------------------------
+# Tests: vault membership of the written path
+# ---------------------------------------------------------------------------
+
+
+class TestVaultMembership:
+    _BAD_NOTE = _note(["type: hypothesis", "title: T"])
+
+    def test_sibling_dir_with_vault_prefix_skipped(self):
+        stdout, _, exited = _run_hook("/vault2/notes/x.md", self._BAD_NOTE)
+        assert stdout == ""
+        assert not exited
+
+    def test_path_through_symlink_is_validated(self, tmp_path: Path):
+        real = tmp_path / "real"
+        (real / "_research").mkdir(parents=True)
+        link = tmp_path / "link"
+        link.symlink_to(real)
+        stdout, _, exited = _run_hook(
+            str(link / "_research" / "h.md"), self._BAD_NOTE, vault_root=real
+        )
+        resp = _parse_block_response(stdout)
+        assert resp is not None and resp["decision"] == "block"
+        assert exited
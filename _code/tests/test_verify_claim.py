@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 
 import pytest
@@ -113,3 +114,202 @@ class TestFindBatchClaims:
         })
         results = find_batch_claims(tmp_path, {"source_class": "hypothesis"})
         assert len(results) == 0
+
+
+class TestParseOnce:
+    """A batch run parses each matched note once for filter and update."""
+
+    def test_find_then_verify_parses_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import verify_claim
+
+        fm = {"description": "A", "source_class": "hypothesis"}
+        fm_str = yaml.dump(fm, default_flow_style=False, sort_keys=False)
+        note = tmp_path / "a.md"
+        note.write_text(f"---\n{fm_str}---\n\nBody.\n", encoding="utf-8")
+
+        calls = []
+        real_load = yaml.load
+        monkeypatch.setattr(
+            verify_claim.yaml,
+            "load",
+            lambda text, **kwargs: calls.append(text) or real_load(text, **kwargs),
+        )
+
+        matched = find_batch_claims(tmp_path, {"source_class": "hypothesis"})
+        assert matched == [note]
+        cached = verify_claim._load_note(note)[0]
+        assert verify_note(note, "Andres Chousal", "2026-02-25") is True
+        # The note itself is parsed once; the other load checks the patch
+        assert calls.count(fm_str.rstrip("\n")) == 1
+        assert len(calls) == 2
+        # The update works on a copy, leaving the cached dict intact
+        assert "verified_by" not in cached
+
+
+class TestLongNotes:
+    """Notes longer than the head read keep their body and frontmatter."""
+
+    def test_long_body_preserved(self, tmp_path: Path) -> None:
+        note = tmp_path / "long.md"
+        body = "word " * 5000 + "\n"
+        note.write_text(f"---\ndescription: A\n---\n{body}", encoding="utf-8")
+        assert find_batch_claims(tmp_path, {"description": "A"}) == [note]
+        assert verify_note(note, "Andres Chousal", "2026-02-25") is True
+        assert note.read_text(encoding="utf-8").endswith(f"---\n{body}")
+
+    def test_frontmatter_past_head(self, tmp_path: Path) -> None:
+        note = tmp_path / "big-fm.md"
+        filler = "x" * 10000
+        note.write_text(
+            f"---\nfiller: {filler}\ndescription: A\n---\n\nBody.\n",
+            encoding="utf-8",
+        )
+        assert find_batch_claims(tmp_path, {"description": "A"}) == [note]
+        assert verify_note(note, "Andres Chousal", "2026-02-25") is True
+        text = note.read_text(encoding="utf-8")
+        assert "verified_by: human" in text
+        assert text.endswith("---\nBody.\n")
+
+
+class TestInPlaceRewrite:
+    """Re-verifying rewrites only the frontmatter when its length holds."""
+
+    def _note(self, tmp_path: Path) -> Path:
+        note = tmp_path / "claim.md"
+        note.write_text("---\ndescription: A\n---\nBody.\n", encoding="utf-8")
+        assert verify_note(note, "Alice", "2026-02-25") is True
+        return note
+
+    def test_same_length_header_written_in_place(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        note = self._note(tmp_path)
+        monkeypatch.setattr(
+            Path, "write_text", lambda *a, **k: pytest.fail("full rewrite")
+        )
+        assert verify_note(note, "Bobby", "2026-02-26") is True
+        text = note.read_text(encoding="utf-8")
+        assert "verified_who: Bobby" in text
+        assert "verified_date: '2026-02-26'" in text
+        assert text.endswith("---\nBody.\n")
+
+    def test_unchanged_header_not_written(self, tmp_path: Path) -> None:
+        note = self._note(tmp_path)
+        before = note.stat().st_mtime_ns
+        assert verify_note(note, "Alice", "2026-02-25") is True
+        assert note.stat().st_mtime_ns == before
+
+    def test_crlf_note_rewritten_whole(self, tmp_path: Path) -> None:
+        note = tmp_path / "crlf.md"
+        note.write_bytes(b"---\r\nverified_who: Alice\r\n---\r\nBody.\r\n")
+        assert verify_note(note, "Alice", "2026-02-25") is True
+        text = note.read_text(encoding="utf-8")
+        assert text.startswith("---\nverified_who: Alice\n")
+        assert "verified_by: human" in text
+        assert text.endswith("---\nBody.\n")
+
+
+class TestMainReport:
+    """main() reports every note, in order, across report chunks."""
+
+    def test_reports_all_notes(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        import verify_claim
+
+        monkeypatch.setattr(verify_claim, "_REPORT_CHUNK", 2)
+        for i in range(5):
+            (tmp_path / f"claim-{i}.md").write_text(
+                "---\ndescription: A\n---\nBody.\n", encoding="utf-8"
+            )
+        (tmp_path / "plain.md").write_text("No frontmatter.\n", encoding="utf-8")
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                "verify_claim.py",
+                "--who",
+                "Alice",
+                "--date",
+                "2026-02-25",
+                *sorted(str(p) for p in tmp_path.glob("*.md")),
+            ],
+        )
+        verify_claim.main()
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[:6] == [
+            *(f"  VERIFIED: claim-{i}.md" for i in range(5)),
+            "  SKIPPED (no frontmatter): plain.md",
+        ]
+        assert lines[-1] == "DONE: 5 claims verified by Alice on 2026-02-25"
+
+
+class TestPatchFrontmatter:
+    """verify_note rewrites only the verification keys' lines."""
+
+    def test_other_lines_kept_verbatim(self, tmp_path: Path) -> None:
+        note = tmp_path / "claim.md"
+        note.write_text(
+            "---\n"
+            'description: "Quoted, as written"\n'
+            "verified_by: agent\n"
+            "topics: [a, b]   # flow style\n"
+            "verified_who:\n"
+            "- Someone\n"
+            "- Else\n"
+            "tags:\n"
+            "  - x\n"
+            "---\n"
+            "Body.\n",
+            encoding="utf-8",
+        )
+        assert verify_note(note, "Alice", "2026-02-25") is True
+        assert note.read_text(encoding="utf-8") == (
+            "---\n"
+            'description: "Quoted, as written"\n'
+            "verified_by: human\n"
+            "topics: [a, b]   # flow style\n"
+            "verified_who: Alice\n"
+            "tags:\n"
+            "  - x\n"
+            "verified_date: '2026-02-25'\n"
+            "---\n"
+            "Body.\n"
+        )
+
+    def test_quotes_values_when_needed(self, tmp_path: Path) -> None:
+        note = tmp_path / "claim.md"
+        note.write_text("---\ndescription: A\n---\nBody.\n", encoding="utf-8")
+        assert verify_note(note, "Dr. X: #1", "2026-02-25") is True
+        text = note.read_text(encoding="utf-8")
+        match = re.match(r"^---\n(.*?)\n---\n", text, re.DOTALL)
+        assert match is not None
+        assert yaml.safe_load(match.group(1))["verified_who"] == "Dr. X: #1"
+
+    def test_falls_back_to_full_dump(self, tmp_path: Path) -> None:
+        import verify_claim
+
+        # The blank line inside the block scalar ends the patcher's skip, so
+        # the patched text misparses and the block is re-dumped instead.
+        fm_text = "verified_who: |\n  one\n\n  three\ndescription: A"
+        patched = verify_claim._patch_fm(fm_text, {"verified_who": "B"})
+        assert yaml.safe_load(patched)["verified_who"] != "B"
+
+        note = tmp_path / "claim.md"
+        note.write_text(f"---\n{fm_text}\n---\nBody.\n", encoding="utf-8")
+        assert verify_note(note, "Alice", "2026-02-25") is True
+        text = note.read_text(encoding="utf-8")
+        match = re.match(r"^---\n(.*?)\n---\n", text, re.DOTALL)
+        assert match is not None
+        assert yaml.safe_load(match.group(1)) == {
+            "verified_who": "Alice",
+            "description": "A",
+            "verified_by": "human",
+            "verified_date": "2026-02-25",
+        }
+        assert text.endswith("---\nBody.\n")